@@ -23,12 +23,27 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
+from sqlalchemy.engine import make_url
+
+from api.config.settings import get_settings
 from api.database.base import Base
 from api.models.users import User
 from api.models.orders import Order
 from api.models.order_items import OrderItem
+from api.models.reports import DailyItemSales, DailyOrderStatus, DailyRevenue
+from api.models.idempotency import IdempotencyKey
 target_metadata = Base.metadata
 
+# usa o mesmo banco da aplicação (DATABASE_URL), trocando o driver assíncrono
+# pelo equivalente síncrono usado nas migrações.
+SYNC_DRIVERS = {'aiosqlite': 'pysqlite', 'aiomysql': 'mysqldb', 'asyncmy': 'mysqldb', 'asyncpg': 'psycopg2'}
+database_url = make_url(get_settings().database_url)
+if database_url.get_driver_name() in SYNC_DRIVERS:
+    database_url = database_url.set(
+        drivername=f'{database_url.get_backend_name()}+{SYNC_DRIVERS[database_url.get_driver_name()]}'
+    )
+config.set_main_option('sqlalchemy.url', database_url.render_as_string(hide_password=False).replace('%', '%%'))
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -0,0 +1,36 @@
+"""Adiciona índices para consultas frequentes.
+
+Revision ID: 9b1f4c2d7e3a
+Revises: 36d47949781f
+Create Date: 2026-10-17 10:12:31.482907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f4c2d7e3a'
+down_revision: Union[str, Sequence[str], None] = '36d47949781f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_usuarios_email', 'usuarios', ['email'], unique=True)
+    op.create_index('ix_pedidos_user_active_id', 'pedidos', ['user', 'active', 'id'], unique=False)
+    op.create_index('ix_pedidos_active_id', 'pedidos', ['active', 'id'], unique=False)
+    op.create_index('ix_itens_pedido_order_active', 'itens_pedido', ['order', 'active'], unique=False)
+    op.create_index('ix_itens_pedido_active_id', 'itens_pedido', ['active', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_itens_pedido_active_id', table_name='itens_pedido')
+    op.drop_index('ix_itens_pedido_order_active', table_name='itens_pedido')
+    op.drop_index('ix_pedidos_active_id', table_name='pedidos')
+    op.drop_index('ix_pedidos_user_active_id', table_name='pedidos')
+    op.drop_index('ix_usuarios_email', table_name='usuarios')
@@ -0,0 +1,38 @@
+"""Conta pedidos por status pelo índice em vez de um contador.
+
+Revision ID: a8e5c3f1d907
+Revises: f3c9d2a7b614
+Create Date: 2026-10-18 10:05:12.331904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e5c3f1d907'
+down_revision: Union[str, Sequence[str], None] = 'f3c9d2a7b614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_pedidos_active_status', 'pedidos', ['active', 'status'], unique=False)
+    op.drop_table('relatorio_pedidos_por_status')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('relatorio_pedidos_por_status',
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('orders', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+    op.execute("""
+        INSERT INTO relatorio_pedidos_por_status (status, orders)
+        SELECT status, COUNT(*) FROM pedidos WHERE active AND status IS NOT NULL GROUP BY status
+    """)
+    op.drop_index('ix_pedidos_active_status', table_name='pedidos')
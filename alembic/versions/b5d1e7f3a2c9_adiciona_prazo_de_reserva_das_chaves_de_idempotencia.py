@@ -0,0 +1,30 @@
+"""Adiciona prazo de reserva das chaves de idempotência.
+
+Revision ID: b5d1e7f3a2c9
+Revises: a8e5c3f1d907
+Create Date: 2026-10-18 14:21:37.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1e7f3a2c9'
+down_revision: Union[str, Sequence[str], None] = 'a8e5c3f1d907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Chaves já em andamento ficam sem prazo e podem ser assumidas pela próxima tentativa.
+    op.add_column('chaves_idempotencia', sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('chaves_idempotencia') as batch_op:
+        batch_op.drop_column('locked_until')
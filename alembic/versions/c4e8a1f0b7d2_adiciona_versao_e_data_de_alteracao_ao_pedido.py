@@ -0,0 +1,31 @@
+"""Adiciona versão e data de alteração ao pedido.
+
+Revision ID: c4e8a1f0b7d2
+Revises: 9b1f4c2d7e3a
+Create Date: 2026-10-17 14:03:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f0b7d2'
+down_revision: Union[str, Sequence[str], None] = '9b1f4c2d7e3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('pedidos', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('pedidos', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('pedidos') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('version')
@@ -0,0 +1,48 @@
+"""Adiciona contagem diária de pedidos por status, dividida em linhas por pedido.
+
+Revision ID: c7f2a9e4d1b6
+Revises: b5d1e7f3a2c9
+Create Date: 2026-10-18 16:02:48.117350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7f2a9e4d1b6'
+down_revision: Union[str, Sequence[str], None] = 'b5d1e7f3a2c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesmo valor de `ORDER_STATUS_SHARDS` em api/models/reports.py no momento da migração.
+ORDER_STATUS_SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('relatorio_pedidos_por_status_diaria',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('shard', sa.Integer(), nullable=False),
+    sa.Column('orders', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status', 'shard')
+    )
+
+    # carga inicial: cada pedido existente conta no status atual, no dia da última alteração.
+    op.execute(f"""
+        INSERT INTO relatorio_pedidos_por_status_diaria (day, status, shard, orders)
+        SELECT COALESCE(DATE(updated_at), CURRENT_DATE), status, id % {ORDER_STATUS_SHARDS}, COUNT(*)
+        FROM pedidos
+        WHERE active AND status IS NOT NULL
+        GROUP BY COALESCE(DATE(updated_at), CURRENT_DATE), status, id % {ORDER_STATUS_SHARDS}
+    """)
+    op.drop_index('ix_pedidos_active_status', table_name='pedidos')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_pedidos_active_status', 'pedidos', ['active', 'status'], unique=False)
+    op.drop_table('relatorio_pedidos_por_status_diaria')
@@ -0,0 +1,37 @@
+"""Armazena preços em centavos.
+
+Revision ID: d7a3e9c15b48
+Revises: c4e8a1f0b7d2
+Create Date: 2026-10-17 15:26:07.540319
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3e9c15b48'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f0b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY_COLUMNS = (('pedidos', 'price'), ('itens_pedido', 'unit_price'))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        op.execute(f'UPDATE {table} SET {column} = ROUND({column} * 100) WHERE {column} IS NOT NULL')
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.Float(), type_=sa.Integer(),
+                                  postgresql_using=f'{column}::integer')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.Integer(), type_=sa.Float())
+        op.execute(f'UPDATE {table} SET {column} = {column} / 100.0 WHERE {column} IS NOT NULL')
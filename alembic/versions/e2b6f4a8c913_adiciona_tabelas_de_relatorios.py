@@ -0,0 +1,69 @@
+"""Adiciona tabelas de relatórios.
+
+Revision ID: e2b6f4a8c913
+Revises: d7a3e9c15b48
+Create Date: 2026-10-17 16:41:18.903275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f4a8c913'
+down_revision: Union[str, Sequence[str], None] = 'd7a3e9c15b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('relatorio_receita_diaria',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('orders', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('relatorio_vendas_itens_diaria',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('flavor', sa.String(), nullable=False),
+    sa.Column('size', sa.String(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'flavor', 'size')
+    )
+    op.create_table('relatorio_pedidos_por_status',
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('orders', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+
+    # carga inicial a partir dos pedidos existentes; pedidos finalizados antes da coluna
+    # updated_at existir são contabilizados no dia da migração.
+    op.execute("""
+        INSERT INTO relatorio_receita_diaria (day, orders, revenue)
+        SELECT COALESCE(DATE(updated_at), CURRENT_DATE), COUNT(*), COALESCE(SUM(price), 0)
+        FROM pedidos
+        WHERE status = 'FINALIZADO' AND active
+        GROUP BY COALESCE(DATE(updated_at), CURRENT_DATE)
+    """)
+    op.execute("""
+        INSERT INTO relatorio_vendas_itens_diaria (day, flavor, size, quantity, revenue)
+        SELECT COALESCE(DATE(p.updated_at), CURRENT_DATE), i.flavor, i.size, SUM(i.amount), SUM(i.unit_price * i.amount)
+        FROM itens_pedido i JOIN pedidos p ON p.id = i."order"
+        WHERE p.status = 'FINALIZADO' AND p.active AND i.active AND i.flavor IS NOT NULL AND i.size IS NOT NULL
+        GROUP BY COALESCE(DATE(p.updated_at), CURRENT_DATE), i.flavor, i.size
+    """)
+    op.execute("""
+        INSERT INTO relatorio_pedidos_por_status (status, orders)
+        SELECT status, COUNT(*) FROM pedidos WHERE active AND status IS NOT NULL GROUP BY status
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('relatorio_pedidos_por_status')
+    op.drop_table('relatorio_vendas_itens_diaria')
+    op.drop_table('relatorio_receita_diaria')
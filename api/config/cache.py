@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Union
+
+from api.config.settings import Settings
+
+
+class MemoryCacheBackend:
+    def __init__(self, max_size: int = 1024):
+        """
+        Backend de cache em memória (LRU com expiração) com a mesma interface assíncrona
+        do cliente `redis.asyncio` usada pela aplicação: `get`, `set` (com `ex`), `incr` e `delete`.
+
+        Os valores são guardados e devolvidos como bytes, como no Redis. O cache é local ao
+        processo: com vários workers, use o Redis para que as invalidações valham para todos.
+
+        Args:
+            max_size (int): Quantidade máxima de chaves guardadas; as menos usadas são descartadas.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()
+        self._lock = Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Union[bytes, str, int], ex: Optional[int] = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode()
+        elif isinstance(value, int):
+            value = str(value).encode()
+
+        expires_at = time.monotonic() + ex if ex is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    async def incr(self, key: str) -> int:
+        current = await self.get(key)
+        value = int(current) + 1 if current is not None else 1
+        with self._lock:
+            expires_at = self._entries[key][1] if key in self._entries else None
+            self._entries[key] = (str(value).encode(), expires_at)
+            self._entries.move_to_end(key)
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._entries.pop(key, None) is not None for key in keys)
+
+
+def build_cache_backend(settings: Settings):
+    """
+    Cria o backend de cache definido em `CACHE_BACKEND`.
+
+    - `memory`: cache em memória do processo (padrão).
+    - `redis`: cliente `redis.asyncio` conectado a `REDIS_URL` (requer o pacote `redis`).
+    - `none`: cache desabilitado.
+
+    Returns:
+        O backend de cache, ou None quando o cache estiver desabilitado.
+    """
+    if settings.cache_backend == 'none':
+        return None
+
+    if settings.cache_backend == 'memory':
+        return MemoryCacheBackend(max_size=settings.cache_max_size)
+
+    if settings.cache_backend == 'redis':
+        try:
+            from redis import asyncio as redis
+        except ImportError as error:
+            raise RuntimeError('CACHE_BACKEND=redis requer o pacote "redis" instalado.') from error
+        return redis.from_url(settings.redis_url)
+
+    raise ValueError(f'Backend de cache inválido: {settings.cache_backend}')
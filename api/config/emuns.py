@@ -11,6 +11,7 @@ class UserErrorMessages(str, Enum):
     USER_NOT_ADMIN = 'Usuário não admin!'
     USER_NOT_AUTHORIZED = 'Usuário não autorizado!'
     USER_NOT_CREATED = 'Erro ao criar usuário!'
+    AUTH_SERVICE_BUSY = 'Serviço de autenticação sobrecarregado, tente novamente!'
 
 
 class OrderErrorMessages(str, Enum):
@@ -19,4 +20,17 @@ class OrderErrorMessages(str, Enum):
     ORDER_NOT_UPDATED = 'Erro ao atualizar pedido!'
     ORDER_NOT_DELETED = 'Erro ao deletar pedido!'
     ORDER_NOT_CANCELLED = 'Erro ao cancelar pedido!'
-    ORDER_ALREADY_CANCELLED = 'Pedido já cancelado!'
\ No newline at end of file
+    ORDER_ALREADY_CANCELLED = 'Pedido já cancelado!'
+    ORDER_ALREADY_FINISHED = 'Pedido já finalizado!'
+    ORDER_NOT_PENDING = 'Apenas pedidos pendentes podem ser cancelados ou finalizados!'
+    ORDER_CONFLICT = 'Pedido alterado por outra requisição, tente novamente!'
+    ORDER_ITEMS_ORDER_MISMATCH = 'Todos os itens devem pertencer ao pedido informado!'
+
+
+class IdempotencyErrorMessages(str, Enum):
+    IDEMPOTENCY_KEY_REUSED = 'Chave de idempotência já usada em outra requisição!'
+    IDEMPOTENCY_REQUEST_IN_PROGRESS = 'Requisição com esta chave de idempotência ainda em andamento!'
+
+
+class PaginationErrorMessages(str, Enum):
+    INVALID_CURSOR = 'Cursor de paginação inválido!'
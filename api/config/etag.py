@@ -0,0 +1,34 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(*parts) -> str:
+    """
+    Gera um ETag fraco a partir das partes informadas (ex: ID e versão dos registros).
+
+    Args:
+        *parts: Valores que identificam o estado do recurso.
+
+    Returns:
+        str: O ETag no formato `W/"<hash>"`.
+    """
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica se o cabeçalho If-None-Match corresponde ao ETag atual (comparação fraca).
+
+    Args:
+        if_none_match (str | None): O valor do cabeçalho If-None-Match da requisição.
+        etag (str): O ETag atual do recurso.
+
+    Returns:
+        bool: True se o cliente já possui a versão atual do recurso.
+    """
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/') == etag.removeprefix('W/') for tag in tags)
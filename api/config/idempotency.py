@@ -0,0 +1,237 @@
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+import orjson
+from fastapi import HTTPException, Response
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config.emuns import IdempotencyErrorMessages
+from api.config.settings import get_settings
+from api.database.engine import SessionLocal
+from api.models.idempotency import IdempotencyKey
+
+# Cabeçalho adicionado às respostas reproduzidas a partir de uma chave já usada.
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+class StoredResponse(NamedTuple):
+    request_hash: str
+    status_code: int
+    body: bytes
+
+
+class IdempotencyStore:
+    def __init__(self, session_factory: async_sessionmaker = SessionLocal, ttl: float = 86400,
+                 max_size: int = 1024, purge_interval: int = 1000, lock_timeout: float = 60):
+        """
+        Guarda as respostas das requisições de criação enviadas com `Idempotency-Key`, para
+        que novas tentativas do cliente com a mesma chave recebam a resposta original em vez
+        de criar o recurso de novo.
+
+        As respostas ficam na tabela `chaves_idempotencia`, compartilhada pelos workers, com um
+        cache LRU em memória na frente. A chave é reservada no banco antes de executar a
+        requisição: uma tentativa que chega enquanto a primeira ainda está em andamento recebe
+        409, e uma requisição que falha libera a chave para uma nova tentativa. A reserva vale por
+        `lock_timeout` segundos: se a requisição original não concluir nem liberar a chave nesse
+        prazo (ex: o worker caiu), a próxima tentativa com o mesmo corpo assume a chave.
+
+        Usa sessões próprias, que gravam independentemente da sessão da requisição.
+
+        Args:
+            session_factory (async_sessionmaker): A fábrica das sessões usadas pelo store.
+            ttl (float): Tempo, em segundos, durante o qual uma chave é reproduzida.
+            max_size (int): Quantidade máxima de respostas no cache em memória.
+            purge_interval (int): A cada quantas reservas as chaves expiradas são apagadas do banco.
+            lock_timeout (float): Tempo, em segundos, que uma chave reservada fica bloqueada
+                para novas tentativas enquanto a requisição original não conclui.
+        """
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.max_size = max_size
+        self.purge_interval = purge_interval
+        self.reservations = 0
+        self._entries: OrderedDict[str, tuple[StoredResponse, float]] = OrderedDict()
+
+    @staticmethod
+    def scope_key(user_id: int, endpoint: str, idempotency_key: str) -> str:
+        """
+        Retorna a chave gravada para a chave informada pelo cliente, isolada por usuário e endpoint.
+        """
+        return hashlib.sha256(f'{user_id}:{endpoint}:{idempotency_key}'.encode()).hexdigest()
+
+    @staticmethod
+    def request_hash(payload) -> str:
+        """
+        Retorna o hash do corpo da requisição, usado para recusar a mesma chave com outro corpo.
+        """
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def run(self, idempotency_key: Optional[str], user_id: int, endpoint: str, payload,
+                  handler: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        Executa `handler` uma única vez por chave de idempotência.
+
+        Sem chave, apenas executa `handler`. Com uma chave já concluída dentro do TTL, reproduz
+        a resposta gravada (com o cabeçalho `Idempotent-Replayed: true`) sem executar `handler`.
+
+        Args:
+            idempotency_key (str, optional): O valor do cabeçalho `Idempotency-Key`.
+            user_id (int): O usuário que está fazendo a requisição.
+            endpoint (str): Identificação do endpoint (ex: `POST /api/v1/orders/`).
+            payload: O corpo da requisição, já validado.
+            handler (Callable[[], Awaitable[Response]]): Executa a criação e retorna a resposta.
+
+        Returns:
+            Response: A resposta gerada por `handler` ou a gravada anteriormente.
+
+        Raises:
+            HTTPException: 422 se a chave já foi usada com outro corpo;
+                409 se a requisição original ainda está em andamento.
+        """
+        if idempotency_key is None:
+            return await handler()
+
+        key = self.scope_key(user_id, endpoint, idempotency_key)
+        request_hash = self.request_hash(payload)
+        reserved_at = datetime.now(timezone.utc)
+
+        stored = self._get_cached(key)
+        if stored is None:
+            stored = await self._reserve(key, request_hash, reserved_at)
+        if stored is not None:
+            return self._replay(stored, request_hash)
+
+        try:
+            response = await handler()
+        except BaseException:
+            await self._release(key)
+            raise
+
+        await self._complete(key, StoredResponse(request_hash, response.status_code, response.body), reserved_at)
+        return response
+
+    def _get_cached(self, key: str) -> Optional[StoredResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return stored
+
+    def _cache(self, key: str, stored: StoredResponse, created_at: datetime) -> None:
+        ttl = self.ttl - (datetime.now(timezone.utc) - created_at).total_seconds()
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (stored, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _replay(stored: StoredResponse, request_hash: str) -> Response:
+        if stored.request_hash != request_hash:
+            raise HTTPException(status_code=422, detail=IdempotencyErrorMessages.IDEMPOTENCY_KEY_REUSED)
+        if stored.status_code is None:
+            raise HTTPException(status_code=409, detail=IdempotencyErrorMessages.IDEMPOTENCY_REQUEST_IN_PROGRESS)
+
+        return Response(stored.body, status_code=stored.status_code, media_type='application/json',
+                        headers={REPLAYED_HEADER: 'true'})
+
+    @staticmethod
+    def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    async def _reserve(self, key: str, request_hash: str, now: datetime) -> Optional[StoredResponse]:
+        """
+        Reserva a chave no banco. Retorna None se a reserva foi feita (a requisição deve ser
+        executada) ou a resposta gravada, se a chave já existia e ainda não expirou.
+
+        Uma chave ainda sem resposta cuja reserva venceu (`locked_until`) é assumida por esta
+        requisição, desde que com o mesmo corpo; a reserva é renovada por um UPDATE condicional,
+        para que apenas uma das tentativas simultâneas a assuma.
+        """
+        self.reservations += 1
+        locked_until = now + timedelta(seconds=self.lock_timeout)
+
+        async with self.session_factory() as session:
+            if self.purge_interval and self.reservations % self.purge_interval == 0:
+                await session.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < now - timedelta(seconds=self.ttl)))
+
+            for _ in range(2):
+                session.add(IdempotencyKey(key=key, request_hash=request_hash, created_at=now, locked_until=locked_until))
+                try:
+                    await session.commit()
+                    return None
+                except IntegrityError:
+                    await session.rollback()
+
+                existing = await session.get(IdempotencyKey, key)
+                if existing is None:
+                    continue
+
+                stored = StoredResponse(existing.request_hash, existing.status_code, existing.response)
+                created_at = self._as_utc(existing.created_at)
+                if created_at <= now - timedelta(seconds=self.ttl):
+                    await session.delete(existing)
+                    await session.commit()
+                    continue
+
+                if stored.status_code is None:
+                    lease = self._as_utc(existing.locked_until)
+                    if stored.request_hash != request_hash or (lease is not None and lease > now):
+                        return stored
+
+                    result = await session.execute(
+                        update(IdempotencyKey)
+                        .where(IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None),
+                               or_(IdempotencyKey.locked_until.is_(None), IdempotencyKey.locked_until <= now))
+                        .values(created_at=now, locked_until=locked_until)
+                        .execution_options(synchronize_session=False)
+                    )
+                    await session.commit()
+                    if result.rowcount:
+                        return None
+                    session.expunge_all()
+                    continue
+
+                self._cache(key, stored, created_at)
+                return stored
+
+        raise HTTPException(status_code=409, detail=IdempotencyErrorMessages.IDEMPOTENCY_REQUEST_IN_PROGRESS)
+
+    async def _complete(self, key: str, stored: StoredResponse, created_at: datetime) -> None:
+        """
+        Grava a resposta da chave reservada em `created_at`. O cache em memória expira junto
+        com a linha gravada, pelo TTL contado a partir da reserva.
+        """
+        async with self.session_factory() as session:
+            await session.execute(update(IdempotencyKey).where(IdempotencyKey.key == key)
+                                  .values(status_code=stored.status_code, response=stored.body, locked_until=None))
+            await session.commit()
+        self._cache(key, stored, created_at)
+
+    async def _release(self, key: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(delete(IdempotencyKey).where(IdempotencyKey.key == key))
+            await session.commit()
+
+
+idempotency_store = IdempotencyStore(
+    ttl=get_settings().idempotency_ttl_seconds,
+    max_size=get_settings().idempotency_cache_max_size,
+    lock_timeout=get_settings().idempotency_lock_seconds,
+)
@@ -0,0 +1,143 @@
+import math
+import time
+from typing import Callable, Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Limites (em segundos) dos buckets do histograma de latência das rotas.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class MetricsRegistry:
+    def __init__(self, namespace: str = 'ordering', buckets: Iterable[float] = LATENCY_BUCKETS):
+        """
+        Métricas da aplicação em memória, expostas no formato texto do Prometheus.
+
+        As requisições são registradas pelo `MetricsMiddleware` (histograma de latência por
+        rota, contagem por status e requisições em andamento). Os demais componentes
+        (pool de bcrypt, pool do banco, caches) entram como coletores, lidos apenas quando
+        `/metrics` é consultado.
+
+        Os contadores são atualizados sempre no event loop do worker, sem concorrência entre
+        threads, e por isso dispensam locks: cada requisição custa alguns incrementos.
+
+        Args:
+            namespace (str): Prefixo do nome de todas as métricas.
+            buckets (Iterable[float]): Limites dos buckets do histograma de latência, em segundos.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self.in_flight = 0
+        self._latency: dict[tuple[str, str], list] = {}
+        self._responses: dict[tuple[str, str, int], int] = {}
+        self._collectors: list[tuple[str, Callable[[], dict], tuple[str, ...]]] = []
+
+    def observe_request(self, method: str, route: str, status_code: int, duration: float) -> None:
+        """
+        Registra uma requisição concluída: a latência no histograma da rota e o status da resposta.
+        """
+        histogram = self._latency.get((method, route))
+        if histogram is None:
+            histogram = self._latency[(method, route)] = [[0] * len(self.buckets), 0.0, 0]
+
+        counts = histogram[0]
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                counts[index] += 1
+                break
+        histogram[1] += duration
+        histogram[2] += 1
+
+        key = (method, route, status_code)
+        self._responses[key] = self._responses.get(key, 0) + 1
+
+    def register_collector(self, name: str, collect: Callable[[], dict], counters: Iterable[str] = ()) -> None:
+        """
+        Registra uma fonte de métricas lida a cada consulta de `/metrics`.
+
+        Args:
+            name (str): Nome do componente, usado no nome das métricas (`<namespace>_<name>_<chave>`).
+            collect (Callable[[], dict]): Função que retorna as métricas atuais do componente.
+                Valores que não são números são ignorados.
+            counters (Iterable[str]): Chaves que só crescem, expostas como counter; as demais são gauge.
+        """
+        self._collectors.append((name, collect, tuple(counters)))
+
+    def render(self) -> str:
+        """
+        Retorna todas as métricas no formato texto de exposição do Prometheus.
+        """
+        prefix = self.namespace
+        lines = [
+            f'# HELP {prefix}_http_requests_in_flight Requisições HTTP em andamento.',
+            f'# TYPE {prefix}_http_requests_in_flight gauge',
+            f'{prefix}_http_requests_in_flight {self.in_flight}',
+            f'# HELP {prefix}_http_request_duration_seconds Latência das requisições HTTP por rota.',
+            f'# TYPE {prefix}_http_request_duration_seconds histogram',
+        ]
+
+        for (method, route), (counts, total, count) in sorted(self._latency.items()):
+            labels = f'method="{method}",route="{route}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{prefix}_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{prefix}_http_request_duration_seconds_sum{{{labels}}} {total}')
+            lines.append(f'{prefix}_http_request_duration_seconds_count{{{labels}}} {count}')
+
+        lines.append(f'# HELP {prefix}_http_responses_total Respostas HTTP por rota e status.')
+        lines.append(f'# TYPE {prefix}_http_responses_total counter')
+        for (method, route, status_code), count in sorted(self._responses.items()):
+            lines.append(f'{prefix}_http_responses_total{{method="{method}",route="{route}",status="{status_code}"}} {count}')
+
+        for name, collect, counters in self._collectors:
+            for key, value in collect().items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or math.isnan(value):
+                    continue
+                metric = f'{prefix}_{name}_{key}'
+                if key in counters:
+                    metric += '_total'
+                lines.append(f'# TYPE {metric} {"counter" if key in counters else "gauge"}')
+                lines.append(f'{metric} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        """
+        Middleware ASGI que registra no `registry` a latência, o status e as requisições
+        em andamento de cada rota.
+
+        As requisições são agrupadas pelo caminho declarado da rota (ex: `/api/v1/orders/{id_order}`),
+        e não pela URL, para manter fixa a quantidade de séries; caminhos que não correspondem
+        a nenhuma rota são agrupados em `unmatched`.
+        """
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        self.registry.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.registry.in_flight -= 1
+            route = getattr(scope.get('route'), 'path', 'unmatched')
+            self.registry.observe_request(scope['method'], route, status_code, time.perf_counter() - start)
+
+
+metrics = MetricsRegistry()
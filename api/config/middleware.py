@@ -0,0 +1,38 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.database.instrumentation import track_queries
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app: ASGIApp):
+        """
+        Middleware ASGI que mede as consultas SQL de cada requisição e as informa no
+        cabeçalho `Server-Timing` da resposta, junto com o tempo total de processamento:
+
+            Server-Timing: db;dur=3.2;desc="4 queries", app;dur=11.8
+
+        Implementado direto sobre o ASGI (e não com `BaseHTTPMiddleware`) para não criar
+        uma task extra por requisição nem interferir nas respostas em streaming.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        stats = track_queries()
+        start = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                elapsed = time.perf_counter() - start
+                headers = MutableHeaders(scope=message)
+                headers.append('Server-Timing', f'db;dur={stats.duration * 1000:.1f};desc="{stats.statements} queries", '
+                                                f'app;dur={elapsed * 1000:.1f}')
+            await send(message)
+
+        await self.app(scope, receive, send_with_server_timing)
@@ -0,0 +1,88 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+from fastapi import HTTPException
+
+from api.config.emuns import PaginationErrorMessages
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Gera um cursor opaco a partir do ID do último registro da página.
+
+    Args:
+        last_id (int): O ID do último registro retornado.
+
+    Returns:
+        str: O cursor codificado em base64 url-safe.
+    """
+    raw = json.dumps({'id': last_id}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decodifica um cursor gerado por `encode_cursor` e retorna o ID correspondente.
+
+    Args:
+        cursor (str | None): O cursor informado pelo cliente no parâmetro `after`.
+
+    Returns:
+        int | None: O ID a partir do qual a próxima página começa, ou None se nenhum cursor foi informado.
+
+    Raises:
+        HTTPException: 400 se o cursor for inválido.
+    """
+    if cursor is None:
+        return None
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded))['id']
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail=PaginationErrorMessages.INVALID_CURSOR)
+
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail=PaginationErrorMessages.INVALID_CURSOR)
+    return last_id
+
+
+def next_cursor(rows: list, limit: int) -> Optional[str]:
+    """
+    Retorna o cursor da próxima página, ou None quando a página atual é a última.
+
+    Args:
+        rows (list): Os registros retornados na página atual, ordenados por ID.
+        limit (int): O tamanho da página solicitado.
+
+    Returns:
+        str | None: O cursor da próxima página.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1].id)
+
+
+def paginate(statement, column, offset: int = 0, limit: int = 10, after: Optional[int] = None):
+    """
+    Aplica a paginação a uma consulta, ordenada pela coluna informada.
+
+    Quando `after` é informado, usa paginação por cursor (`column > after`), que não
+    degrada conforme o cliente avança nas páginas. Caso contrário, usa offset/limit.
+
+    Args:
+        statement (Select): A consulta a ser paginada.
+        column (Column): A coluna usada como chave da paginação (normalmente o ID).
+        offset (int, optional): Número de registros a serem pulados. Default é 0.
+        limit (int, optional): Número máximo de registros a serem retornados. Default é 10.
+        after (int, optional): O ID do último registro da página anterior. Default é None.
+
+    Returns:
+        Select: A consulta paginada.
+    """
+    statement = statement.order_by(column).limit(limit)
+    if after is not None:
+        return statement.where(column > after)
+    return statement.offset(offset)
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = 200, headers: Optional[dict] = None) -> ORJSONResponse:
+    """
+    Serializa um schema já validado diretamente com o orjson.
+
+    Retornar a resposta pronta faz o FastAPI pular o `response_model` da rota (que continua
+    documentando a resposta no OpenAPI): sem isso o schema seria convertido em dicionário,
+    validado novamente e só então serializado, dobrando o custo em listagens grandes.
+
+    Args:
+        model (BaseModel): O schema de resposta, já validado (ex: `ResponseOrderSchema[List[OrderPublicSchema]]`).
+        status_code (int): O status HTTP da resposta.
+        headers (dict, optional): Cabeçalhos adicionais (ex: ETag).
+
+    Returns:
+        ORJSONResponse: A resposta serializada.
+    """
+    return ORJSONResponse(model.model_dump(), status_code=status_code, headers=headers)
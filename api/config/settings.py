@@ -0,0 +1,68 @@
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+load_dotenv()
+
+
+class Settings(BaseModel):
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int
+    database_url: str = 'sqlite+aiosqlite:///sqlite.db'
+    database_replica_urls: str = ''
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_pre_ping: bool = False
+    db_pool_recycle: int = -1
+    sqlite_high_concurrency: bool = False
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size_kib: int = 65536
+    order_items_loading_strategy: str = 'selectin'
+    principal_cache_ttl_seconds: float = 60
+    principal_cache_max_size: int = 1024
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+    cache_backend: str = 'memory'
+    cache_max_size: int = 1024
+    redis_url: str = 'redis://localhost:6379/0'
+    order_cache_ttl_seconds: float = 5
+    order_events_queue_size: int = 100
+    order_events_heartbeat_seconds: float = 15
+    slow_query_threshold_ms: float = 200
+    idempotency_ttl_seconds: float = 86400
+    idempotency_cache_max_size: int = 1024
+    idempotency_lock_seconds: float = 60
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Monta as configurações da aplicação a partir das variáveis de ambiente (e do arquivo .env).
+
+        Variáveis opcionais ausentes ou vazias assumem o valor padrão do campo.
+
+        Returns:
+            Settings: As configurações carregadas.
+        """
+        values = {name: os.getenv(name.upper()) for name in cls.model_fields}
+        return cls(**{name: value for name, value in values.items() if value not in (None, '')})
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Retorna as configurações da aplicação, carregadas uma única vez por processo.
+
+    Pode ser usada como dependência do FastAPI para injetar as configurações.
+
+    Returns:
+        Settings: As configurações da aplicação.
+    """
+    return Settings.from_env()
@@ -1,10 +1,109 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 
-DATABASE_URL = "sqlite:///sqlite.db"
+from api.config.settings import Settings, get_settings
+from api.database.instrumentation import instrument_engine
+from api.database.pool import MeasuredAsyncQueuePool
+from api.database.routing import RoutingSession
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}  # se for SQLite
-)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
\ No newline at end of file
+def async_database_url(database_url: str) -> str:
+    """
+    Garante o driver assíncrono para URLs SQLite informadas com o driver síncrono padrão
+    (ex: `sqlite:///sqlite.db` -> `sqlite+aiosqlite:///sqlite.db`).
+    """
+    url = make_url(database_url)
+    if url.drivername == 'sqlite':
+        url = url.set(drivername='sqlite+aiosqlite')
+    return url.render_as_string(hide_password=False)
+
+
+def engine_options(settings: Settings) -> dict:
+    """
+    Monta as opções do pool de conexões a partir das configurações da aplicação.
+
+    Bancos SQLite em memória usam um pool próprio do SQLAlchemy (uma única conexão)
+    e por isso não recebem as opções de dimensionamento.
+    """
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+
+    return {
+        'poolclass': MeasuredAsyncQueuePool,
+        'pool_size': settings.db_pool_size,
+        'max_overflow': settings.db_max_overflow,
+        'pool_timeout': settings.db_pool_timeout,
+        'pool_pre_ping': settings.db_pool_pre_ping,
+        'pool_recycle': settings.db_pool_recycle,
+    }
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    """
+    Retorna os PRAGMAs do perfil de alta concorrência do SQLite.
+
+    WAL permite leituras simultâneas a uma escrita, `synchronous=NORMAL` reduz os fsyncs
+    (seguro com WAL) e `busy_timeout` faz escritas concorrentes aguardarem o lock
+    em vez de falharem com "database is locked".
+    """
+    return [
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        f'PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}',
+        f'PRAGMA mmap_size={settings.sqlite_mmap_size}',
+        f'PRAGMA cache_size=-{settings.sqlite_cache_size_kib}',
+    ]
+
+
+def build_engine(settings: Settings) -> AsyncEngine:
+    """
+    Cria o engine assíncrono da aplicação a partir das configurações.
+
+    Com `SQLITE_HIGH_CONCURRENCY` habilitado e um banco SQLite, os PRAGMAs de
+    `sqlite_pragmas` são aplicados a cada nova conexão do pool. Todas as consultas são
+    medidas por `instrument_engine` (contagem por requisição e log de consultas lentas).
+    """
+    database_url = async_database_url(settings.database_url)
+    engine = create_async_engine(database_url, **engine_options(settings))
+
+    if settings.sqlite_high_concurrency and engine.dialect.name == 'sqlite':
+        pragmas = sqlite_pragmas(settings)
+
+        @event.listens_for(engine.sync_engine, 'connect')
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    instrument_engine(engine, settings.slow_query_threshold_ms)
+    return engine
+
+
+def replica_urls(settings: Settings) -> list[str]:
+    """
+    Retorna as URLs das réplicas de leitura informadas em `DATABASE_REPLICA_URLS`,
+    separadas por vírgula.
+    """
+    return [url.strip() for url in settings.database_replica_urls.split(',') if url.strip()]
+
+
+engine = build_engine(get_settings())
+
+replica_engines = [
+    build_engine(get_settings().model_copy(update={'database_url': url}))
+    for url in replica_urls(get_settings())
+]
+
+DATABASE_URL = engine.url.render_as_string(hide_password=False)
+
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=[replica.sync_engine for replica in replica_engines],
+    autoflush=False,
+    expire_on_commit=False,
+)
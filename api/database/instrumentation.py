@@ -0,0 +1,111 @@
+import logging
+import sys
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger('api.database.slow_queries')
+
+
+class QueryStats:
+    __slots__ = ('statements', 'duration')
+
+    def __init__(self):
+        """
+        Contadores das consultas SQL executadas durante uma requisição.
+
+        Attributes:
+            statements (int): Quantidade de comandos enviados ao banco.
+            duration (float): Tempo total gasto no banco, em segundos.
+        """
+        self.statements = 0
+        self.duration = 0.0
+
+
+# Contadores da requisição atual; None fora de uma requisição instrumentada.
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar('query_stats', default=None)
+
+
+def track_queries() -> QueryStats:
+    """
+    Passa a contar as consultas do contexto atual (requisição ou task) e retorna os contadores.
+    """
+    stats = QueryStats()
+    query_stats.set(stats)
+    return stats
+
+
+def frame_name(frame) -> str:
+    """
+    Retorna o nome qualificado da função do frame (ex: `OrderRepository.get_order_by_id`).
+
+    `co_qualname` só existe a partir do Python 3.11; antes dele, o nome da classe vem do
+    `self` da chamada, quando houver.
+    """
+    code = frame.f_code
+    qualname = getattr(code, 'co_qualname', None)
+    if qualname is not None:
+        return qualname
+
+    owner = frame.f_locals.get('self')
+    return f'{type(owner).__name__}.{code.co_name}' if owner is not None else code.co_name
+
+
+def query_origin() -> Optional[str]:
+    """
+    Retorna o método de repositório que originou a consulta em execução
+    (ex: `OrderRepository.get_orders_by_user`), ou None se não for possível identificá-lo.
+
+    As consultas do driver assíncrono rodam em um greenlet separado; a busca continua
+    pela pilha do greenlet pai, onde está a corrotina que chamou o repositório.
+    """
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent()
+
+    while frame is not None:
+        if frame.f_globals.get('__name__', '').endswith('.repository'):
+            return frame_name(frame)
+
+        frame = frame.f_back
+        if frame is None and current is not None and current.parent is not None:
+            current = current.parent
+            frame = current.gr_frame
+
+    return None
+
+
+def instrument_engine(engine: AsyncEngine, slow_query_threshold_ms: float) -> None:
+    """
+    Registra no engine os eventos que medem cada consulta SQL.
+
+    Cada comando é somado aos contadores da requisição atual (`query_stats`) e, se levar
+    mais que `slow_query_threshold_ms`, é registrado no log com o método de repositório
+    que o originou. Um limite negativo desativa o log de consultas lentas.
+
+    Uma falha ao montar o log nunca é propagada: a consulta já foi executada e não deve falhar.
+    """
+    threshold = slow_query_threshold_ms / 1000
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['query_start_time'].pop()
+
+        stats = query_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.duration += duration
+
+        if 0 <= threshold <= duration:
+            try:
+                logger.warning('Consulta lenta (%.1f ms) em %s: %s', duration * 1000,
+                               query_origin() or 'origem desconhecida', ' '.join(statement.split()))
+            except Exception:
+                logger.debug('Falha ao registrar a consulta lenta', exc_info=True)
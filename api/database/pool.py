@@ -0,0 +1,67 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeasuredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool de conexões assíncrono que registra o tempo gasto para obter uma conexão.
+
+    O tempo inclui a espera por uma conexão livre quando o pool está esgotado, a abertura
+    de novas conexões e o pre-ping, permitindo dimensionar o pool por worker do uvicorn.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.timeouts = 0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait_time = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    """
+    Retorna a situação atual do pool de conexões do engine.
+
+    Args:
+        engine (AsyncEngine): O engine cujo pool será inspecionado.
+
+    Returns:
+        dict: Tamanho do pool, conexões livres, em uso e em overflow e, quando disponível,
+        o tempo de espera para obter conexões (médio e máximo, em segundos).
+    """
+    pool = engine.pool
+    status = {'pool_class': type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+        })
+
+    if isinstance(pool, MeasuredAsyncQueuePool):
+        status.update({
+            'checkouts': pool.checkouts,
+            'timeouts': pool.timeouts,
+            'wait_time_avg': pool.wait_time_total / pool.checkouts if pool.checkouts else 0.0,
+            'wait_time_max': pool.wait_time_max,
+        })
+
+    return status
@@ -0,0 +1,67 @@
+import random
+from functools import wraps
+from typing import Optional, Sequence
+
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Chaves usadas em `Session.info` para decidir o destino das consultas.
+READ_ONLY = 'routing_read_only'
+USE_PRIMARY = 'routing_use_primary'
+
+
+class RoutingSession(Session):
+    def __init__(self, *args, replicas: Optional[Sequence[Engine]] = None, **kwargs):
+        """
+        Sessão que envia as leituras marcadas com `replica_read` para uma das réplicas
+        e todo o resto (escritas, flushes e leituras comuns) para o banco principal.
+
+        Depois da primeira escrita a sessão fica presa ao banco principal até ser fechada,
+        garantindo que a requisição que acabou de gravar leia os próprios dados
+        mesmo que as réplicas ainda não tenham recebido a alteração.
+
+        Args:
+            replicas (Sequence[Engine], optional): Engines síncronos das réplicas de leitura.
+                Sem réplicas todas as consultas vão para o banco principal.
+        """
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas or [])
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[USE_PRIMARY] = True
+
+        if self.replicas and self.info.get(READ_ONLY) and not self.info.get(USE_PRIMARY):
+            return random.choice(self.replicas)
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def replica_read(method):
+    """
+    Marca um método assíncrono de repositório como somente leitura, permitindo
+    que as consultas feitas por ele sejam atendidas por uma réplica.
+    """
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        info = self.session.info
+        previous = info.get(READ_ONLY, False)
+        info[READ_ONLY] = True
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            info[READ_ONLY] = previous
+
+    return wrapper
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    Faz a sessão ler apenas do banco principal até ser fechada.
+
+    Deve ser chamada no início de operações que leem e depois alteram os mesmos dados,
+    para que a alteração nunca parta de uma leitura desatualizada de uma réplica.
+    """
+    session.info[USE_PRIMARY] = True
@@ -1,17 +1,17 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from api.database.engine import SessionLocal
 
-def get_session():
+async def get_session():
     """
-    Dependência do FastAPI que fornece uma sessão de banco de dados.
+    Dependência do FastAPI que fornece uma sessão assíncrona de banco de dados.
 
     Esta função cria uma nova sessão de banco de dados e a fecha quando sai do escopo. 
     Ela deve ser usada como dependência em rotas do FastAPI.
 
-    Yields: Session: Uma sessão de banco de dados.
+    Yields: AsyncSession: Uma sessão assíncrona de banco de dados.
     """
-    session: Session = SessionLocal()
+    session: AsyncSession = SessionLocal()
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        await session.close()
@@ -0,0 +1,27 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+
+class Money(TypeDecorator):
+    """
+    Valor monetário exato, guardado no banco como um inteiro de centavos.
+
+    Na aplicação os valores são `Decimal` com duas casas (ex: `Decimal('10.50')`); na gravação
+    são convertidos para centavos com arredondamento comercial. Somas feitas no banco
+    (`SUM(unit_price * amount)`) operam sobre inteiros e não acumulam erros de ponto flutuante.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)).scaleb(-2)
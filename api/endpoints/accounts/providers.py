@@ -1,14 +1,14 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database.session import get_session
 from api.endpoints.accounts.repository import AccountRepository
 from api.endpoints.accounts.services import AccountService
 
-def get_account_service(session: Session = Depends(get_session)) -> AccountService:
+def get_account_service(session: AsyncSession = Depends(get_session)) -> AccountService:
     """
     Argumentos:
-    - session (Session): A sessão do banco de dados.
+    - session (AsyncSession): A sessão assíncrona do banco de dados.
 
     Retornos:
     - AccountService: Uma instância de AccountService.
@@ -1,21 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional
+from api.config.pagination import paginate
+from api.database.routing import replica_read
+from api.endpoints.auth.cache import principal_cache
 from api.models.users import User
 
 class AccountRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         """
         Inicializa o repositório de usuários.
 
         Par metros
         ----------
-        session : Session
-            A sessão do do banco de dados.
+        session : AsyncSession
+            A sessão assíncrona do banco de dados.
         """
         self.session = session
 
-    def get_all_accounts(self, offset: int = 0, limit: int = 10) -> list[User]:
+    @replica_read
+    async def get_all_accounts(self, offset: int = 0, limit: int = 10, after: Optional[int] = None) -> list[User]:
         """
         Recupera todos os usuários do banco de dados.
 
@@ -27,6 +32,9 @@ class AccountRepository:
         limit : int, opcional
             O número m ximo de usuários a serem retornados.
             Padr o   10.
+        after : int, opcional
+            O ID do último usuário da página anterior, para paginação por cursor.
+            Quando informado, o offset é ignorado.
 
         Retornos
         -------
@@ -34,11 +42,15 @@ class AccountRepository:
             A lista de usuários se encontrado, caso contr rio uma lista vazia.
         """
         try:
-            return self.session.query(User).filter(User.admin == False, User.active == True).offset(offset).limit(limit).all()
+            result = await self.session.scalars(
+                paginate(select(User).where(User.admin == False, User.active == True), User.id, offset, limit, after)
+            )
+            return list(result)
         except SQLAlchemyError:
             return []
     
-    def get_all_accounts_admin(self, offset: int = 0, limit: int = 10) -> list[User]:
+    @replica_read
+    async def get_all_accounts_admin(self, offset: int = 0, limit: int = 10, after: Optional[int] = None) -> list[User]:
         """
         Recupera todos os usuários administradores do banco de dados.
 
@@ -50,6 +62,9 @@ class AccountRepository:
         limit : int, opcional
             O número máximo de usuários a serem retornados.
             Padr o   10.
+        after : int, opcional
+            O ID do último usuário da página anterior, para paginação por cursor.
+            Quando informado, o offset é ignorado.
 
         Retornos
         -------
@@ -57,11 +72,15 @@ class AccountRepository:
             A lista de usuários administradores se encontrado, caso contr rio uma lista vazia.
         """
         try:
-            return self.session.query(User).filter(User.admin == True, User.active == True).offset(offset).limit(limit).all()
+            result = await self.session.scalars(
+                paginate(select(User).where(User.admin == True, User.active == True), User.id, offset, limit, after)
+            )
+            return list(result)
         except SQLAlchemyError:
             return []
     
-    def get_account(self, account_id: int) -> Optional[User]:
+    @replica_read
+    async def get_account(self, account_id: int) -> Optional[User]:
         """
         Recupera uma conta de usuário pelo ID do banco de dados.
 
@@ -77,15 +96,16 @@ class AccountRepository:
         """
 
         try:
-            return self.session.query(User).filter(User.id == account_id, User.active == True).first()
+            return await self.session.scalar(select(User).where(User.id == account_id, User.active == True))
         except SQLAlchemyError:
             return None
     
-    def update_account(self, account, data):
+    async def update_account(self, account, data):
         """
         Atualiza os dados de uma conta existente no banco de dados.
 
-        Essa função atualiza os campos `name` e `email` de uma conta, se esses forem fornecidos.
+        Essa função atualiza os campos `name` e `email` de uma conta, se esses forem fornecidos,
+        e remove o usuário do cache de usuários autenticados.
         Caso ocorra um erro durante a transação com o banco, a operação é revertida e `None` é retornado.
 
         Args:
@@ -102,9 +122,10 @@ class AccountRepository:
                 account.email = data.email
 
             self.session.add(account)
-            self.session.commit()
-            self.session.refresh(account)
+            await self.session.commit()
+            await self.session.refresh(account)
+            principal_cache.invalidate(account.id)
             return account
         except SQLAlchemyError:
-            self.session.rollback()
+            await self.session.rollback()
             return None
\ No newline at end of file
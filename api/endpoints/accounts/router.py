@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, status
-from typing import List
+from typing import List, Optional
 
+from api.config.pagination import decode_cursor, next_cursor
+from api.config.responses import model_response
 from api.endpoints.auth.providers import get_current_user
 from api.endpoints.accounts.providers import get_account_service
 from api.endpoints.accounts.services import AccountService
@@ -15,7 +17,7 @@ router = APIRouter(
 )
 
 @router.get('/', status_code=status.HTTP_200_OK, response_model=ResponseAccountsSchema[List[ResponseAccountsPublicSchema]])
-async def get_all_accounts(offset: int = 0, limit: int = 10,
+async def get_all_accounts(offset: int = 0, limit: int = 10, after: Optional[str] = None,
                            service: AccountService = Depends(get_account_service),
                            user: User = Depends(get_current_user)):
     
@@ -28,6 +30,8 @@ async def get_all_accounts(offset: int = 0, limit: int = 10,
         O número de usuários a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
     limit : int, opcional
         O número m ximo de usuários a serem retornados. Padrão é 10.
+    after : str, opcional
+        O `next_cursor` retornado na página anterior, para paginação por cursor. Quando informado, o offset é ignorado.
     service : AccountService
         A inst ncia do serviço de usuários usada para recuperar usuários.
     user : User
@@ -38,11 +42,12 @@ async def get_all_accounts(offset: int = 0, limit: int = 10,
     ResponseAccountsSchema[List[ResponseAccountsPublicSchema]]
         Um esquema de resposta contendo uma mensagem e a lista de usuários.
     """
-    account = service.get_all_accounts(user, offset, limit)
-    return ResponseAccountsSchema(message='Accounts found', data=account)
+    account = await service.get_all_accounts(user, offset, limit, decode_cursor(after))
+    return model_response(ResponseAccountsSchema[List[ResponseAccountsPublicSchema]](
+        message='Accounts found', data=account, next_cursor=next_cursor(account, limit)))
 
 @router.get('/admin', status_code=status.HTTP_200_OK, response_model=ResponseAccountsSchema[List[ResponseAccountsAdminSchema]])
-async def get_all_accounts_admin(offset: int = 0, limit: int = 10,
+async def get_all_accounts_admin(offset: int = 0, limit: int = 10, after: Optional[str] = None,
                            service: AccountService = Depends(get_account_service),
                            user: User = Depends(get_current_user)):
     
@@ -55,6 +60,8 @@ async def get_all_accounts_admin(offset: int = 0, limit: int = 10,
         O número de usuários a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
     limit : int, opcional
         O número m ximo de usuários a serem retornados. Padrão é 10.
+    after : str, opcional
+        O `next_cursor` retornado na página anterior, para paginação por cursor. Quando informado, o offset é ignorado.
     service : AccountService
         A inst ncia do serviço de usuários usada para recuperar usuários.
     user : User
@@ -65,8 +72,9 @@ async def get_all_accounts_admin(offset: int = 0, limit: int = 10,
     ResponseAccountsSchema[List[ResponseAccountsAdminSchema]]
         Um esquema de resposta contendo uma mensagem e a lista de usuários administradores.
     """
-    account = service.get_all_accounts_admin(user, offset, limit)
-    return ResponseAccountsSchema(message='Accounts found', data=account)
+    account = await service.get_all_accounts_admin(user, offset, limit, decode_cursor(after))
+    return model_response(ResponseAccountsSchema[List[ResponseAccountsAdminSchema]](
+        message='Accounts found', data=account, next_cursor=next_cursor(account, limit)))
 
 @router.get('/{account_id}', status_code=status.HTTP_200_OK, response_model=ResponseAccountsSchema[ResponseAccountsPublicSchema])
 async def get_account(account_id: int, service: AccountService = Depends(get_account_service),
@@ -92,7 +100,7 @@ async def get_account(account_id: int, service: AccountService = Depends(get_acc
             - 404 se a conta não for encontrada.
     """
     
-    account = service.get_account(user, account_id)
+    account = await service.get_account(user, account_id)
     return ResponseAccountsSchema(message='Account found', data=account)
 
 @router.post('/{account_id}/update', status_code=status.HTTP_200_OK, response_model=ResponseAccountsSchema[ResponseAccountsPublicSchema])
@@ -121,5 +129,5 @@ async def update_account(account_id: int, update_account_schema: UpdateAccountsS
             - 403 se o usuário não estiver autorizado a atualizar a conta.
             - 404 se a conta não for encontrada.
     """
-    account = service.update_account(user, account_id, update_account_schema)
+    account = await service.update_account(user, account_id, update_account_schema)
     return ResponseAccountsSchema(message='Update completed', data=account)
\ No newline at end of file
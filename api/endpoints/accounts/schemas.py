@@ -7,6 +7,7 @@ T = TypeVar("T")
 class ResponseAccountsSchema(BaseModel, Generic[T]):
     message: str
     data: Optional[T] = None
+    next_cursor: Optional[str] = None
 
 class ResponseAccountsPublicSchema(BaseModel):
     id: int
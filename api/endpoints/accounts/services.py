@@ -1,5 +1,7 @@
 from fastapi import HTTPException
+from typing import Optional
 
+from api.database.routing import use_primary
 from api.endpoints.accounts.repository import AccountRepository
 from api.endpoints.accounts.schemas import UpdateAccountsSchema
 from api.models.users import User
@@ -10,7 +12,7 @@ class AccountService:
     def __init__(self, repository: AccountRepository):
         self.repository = repository
     
-    def get_all_accounts(self, user: User, offset: int = 0, limit: int = 10):
+    async def get_all_accounts(self, user: User, offset: int = 0, limit: int = 10, after: Optional[int] = None):
         """
         Retorna uma lista paginada de todas as contas visíveis no sistema, acessível apenas por administradores.
 
@@ -22,6 +24,7 @@ class AccountService:
             user (User): Usuário autenticado realizando a operação.
             offset (int, optional): Número de registros a serem ignorados para paginação. Default é 0.
             limit (int, optional): Número máximo de registros a serem retornados. Default é 10.
+            after (int, optional): ID do último registro da página anterior, para paginação por cursor. Default é None.
 
         Returns:
             List[Account]: Lista paginada de contas encontradas.
@@ -32,9 +35,9 @@ class AccountService:
         if not user.admin:
             raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         
-        return self.repository.get_all_accounts(offset, limit)
+        return await self.repository.get_all_accounts(offset, limit, after)
     
-    def get_all_accounts_admin(self, user: User, offset: int = 0, limit: int = 10):
+    async def get_all_accounts_admin(self, user: User, offset: int = 0, limit: int = 10, after: Optional[int] = None):
         """
         Retorna uma lista paginada de todas as contas do sistema, apenas para administradores.
 
@@ -46,6 +49,7 @@ class AccountService:
             user (User): Usuário autenticado realizando a operação.
             offset (int, optional): Número de registros a serem pulados para paginação. Default é 0.
             limit (int, optional): Número máximo de registros a serem retornados. Default é 10.
+            after (int, optional): ID do último registro da página anterior, para paginação por cursor. Default é None.
 
         Returns:
             List[Account]: Lista de contas de usuários cadastradas no sistema.
@@ -56,9 +60,9 @@ class AccountService:
         if not user.admin:
             raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         
-        return self.repository.get_all_accounts_admin(offset, limit)
+        return await self.repository.get_all_accounts_admin(offset, limit, after)
     
-    def get_account(self, user: User, account_id: int):
+    async def get_account(self, user: User, account_id: int):
         """
         Retorna uma conta a partir do ID, garantindo que o usuário tenha permissão para acessá-la.
 
@@ -81,12 +85,12 @@ class AccountService:
         if not user.admin and user.id != account_id:
             raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         
-        account = self.repository.get_account(account_id)
+        account = await self.repository.get_account(account_id)
         if not account:
             raise HTTPException(status_code=404, detail=UserErrorMessages.USER_NOT_FOUND)
         return account
     
-    def update_account(self, user: User, account_id: int, data:UpdateAccountsSchema):
+    async def update_account(self, user: User, account_id: int, data:UpdateAccountsSchema):
         """
         Atualiza os dados de uma conta, respeitando as permissões do usuário autenticado.
 
@@ -110,10 +114,11 @@ class AccountService:
         if not user.admin and user.id != account_id:
             raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         
-        account = self.repository.get_account(account_id)
+        use_primary(self.repository.session)
+        account = await self.repository.get_account(account_id)
         if not account:
             raise HTTPException(status_code=404, detail=UserErrorMessages.USER_NOT_FOUND)
         
-        updated_account = self.repository.update_account(account, data)
+        updated_account = await self.repository.update_account(account, data)
         return updated_account
         
\ No newline at end of file
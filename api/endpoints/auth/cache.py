@@ -0,0 +1,127 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from api.config.settings import get_settings
+from api.endpoints.auth.schemas import AuthenticatedUser
+
+
+class PrincipalCache:
+    def __init__(self, ttl: float = 60, max_size: int = 1024):
+        """
+        Cache em memória (TTL + LRU) dos usuários autenticados.
+
+        Evita consultar o banco a cada requisição autenticada: o usuário resolvido a partir
+        de um token fica guardado até expirar o TTL, expirar o próprio token ou ser
+        invalidado explicitamente quando os dados do usuário mudam.
+
+        Args:
+            ttl (float): Tempo máximo, em segundos, que um usuário permanece no cache.
+            max_size (int): Quantidade máxima de tokens guardados; os menos usados são descartados.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[AuthenticatedUser, float]] = OrderedDict()
+        self._keys_by_user: dict[int, set[str]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        """
+        Retorna a chave do cache para o token informado (hash SHA-256 do token).
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[AuthenticatedUser]:
+        """
+        Retorna o usuário associado ao token, ou None se não estiver em cache ou tiver expirado.
+        """
+        key = self.token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return user
+
+    def set(self, token: str, user: AuthenticatedUser, token_expires_at: Optional[float] = None) -> None:
+        """
+        Guarda o usuário autenticado pelo token.
+
+        Args:
+            token (str): O token JWT usado na autenticação.
+            user (AuthenticatedUser): Cópia imutável do usuário resolvido a partir do token.
+            token_expires_at (float, optional): Timestamp (epoch) de expiração do token.
+                A entrada nunca vive mais que o próprio token.
+        """
+        ttl = self.ttl
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        key = self.token_key(token)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (user, time.monotonic() + ttl)
+            self._keys_by_user.setdefault(user.id, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def stats(self) -> dict:
+        """
+        Retorna a quantidade de entradas, de acertos e falhas do cache e a taxa de acerto.
+        """
+        total = self.hits + self.misses
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0}
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Remove do cache todos os tokens do usuário informado.
+
+        Deve ser chamado sempre que os dados do usuário forem alterados ou ele for desativado.
+        """
+        with self._lock:
+            for key in self._keys_by_user.pop(user_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Esvazia o cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        keys = self._keys_by_user.get(entry[0].id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry[0].id]
+
+
+principal_cache = PrincipalCache(
+    ttl=get_settings().principal_cache_ttl_seconds,
+    max_size=get_settings().principal_cache_max_size,
+)
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from api.config.emuns import UserErrorMessages
+from api.config.settings import get_settings
+
+
+class PasswordHasher:
+    def __init__(self, context: CryptContext, max_workers: int = 4, max_queue: int = 64):
+        """
+        Executa o hash e a verificação de senhas (bcrypt) em um pool de threads limitado.
+
+        O bcrypt consome centenas de milissegundos de CPU por operação; rodá-lo dentro das
+        rotas assíncronas trava o event loop para todas as outras requisições. O pool libera
+        o event loop e limita a fila: acima de `max_queue` operações pendentes, novas
+        requisições recebem 503 em vez de aumentar indefinidamente a latência.
+
+        Args:
+            context (CryptContext): O contexto do passlib usado para hash e verificação.
+            max_workers (int): Quantidade de threads do pool.
+            max_queue (int): Quantidade máxima de operações pendentes (em execução ou aguardando).
+        """
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    async def hash(self, password: str) -> str:
+        """
+        Gera o hash da senha informada no pool de threads.
+        """
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """
+        Verifica a senha informada contra o hash no pool de threads.
+        """
+        return await self._run(self.context.verify, password, hashed)
+
+    def stats(self) -> dict:
+        """
+        Retorna as métricas do pool: fila atual, operações concluídas e rejeitadas
+        e o tempo de espera na fila (médio e máximo, em segundos).
+        """
+        return {
+            'pending': self.pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'wait_time_avg': self.wait_time_total / self.completed if self.completed else 0.0,
+            'wait_time_max': self.wait_time_max,
+        }
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(status_code=503, detail=UserErrorMessages.AUTH_SERVICE_BUSY,
+                                headers={'Retry-After': '1'})
+
+        submitted_at = time.perf_counter()
+
+        def task():
+            wait_time = time.perf_counter() - submitted_at
+            return func(*args), wait_time
+
+        self.pending += 1
+        try:
+            result, wait_time = await asyncio.get_running_loop().run_in_executor(self._executor, task)
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+        return result
+
+
+password_hasher = PasswordHasher(
+    CryptContext(schemes=['bcrypt'], deprecated='auto'),
+    max_workers=get_settings().password_hash_workers,
+    max_queue=get_settings().password_hash_max_queue,
+)
@@ -1,22 +1,25 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.config.settings import Settings, get_settings
 from api.database.session import get_session
 from api.endpoints.auth.repository import AuthRepository
 from api.endpoints.auth.services import AuthService
 from api.config.security import oauth2_scheme
 
-def get_auth_service(session: Session = Depends(get_session)) -> AuthService:
+def get_auth_service(session: AsyncSession = Depends(get_session),
+                     settings: Settings = Depends(get_settings)) -> AuthService:
     """
     Argumentos:
-    - session (Session): A sessão do banco de dados.
+    - session (AsyncSession): A sessão assíncrona do banco de dados.
+    - settings (Settings): As configurações da aplicação, carregadas uma única vez por processo.
 
     Retornos:
     - AuthService: Uma instância de AuthService.
     """
     repository = AuthRepository(session)
-    return AuthService(repository)
+    return AuthService(repository, settings=settings)
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
     service: AuthService = Depends(get_auth_service)
 ):
@@ -29,6 +32,6 @@ def get_current_user(
     A função utilizada como decorator em rotas que necessitam de autenticação.
 
     Retornos:
-    - User: O usuário autenticado.
+    - AuthenticatedUser: O usuário autenticado (cópia imutável, desligada da sessão).
     """
-    return service.verify_token(token)
\ No newline at end of file
+    return await service.verify_token(token)
\ No newline at end of file
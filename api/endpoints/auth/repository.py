@@ -1,21 +1,22 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional
 from api.models.users import User
 
 class AuthRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         """
         Inicializa o repositório de usuários.
 
         Par metros
         ----------
-        session : Session
-            A sessão do do banco de dados.
+        session : AsyncSession
+            A sessão assíncrona do banco de dados.
         """
         self.session = session
 
-    def get_user_by_id(self, id: int) -> Optional[User]:
+    async def get_user_by_id(self, id: int) -> Optional[User]:
         """
         Recupera um usuário pelo seu ID do banco de dados.
 
@@ -27,11 +28,11 @@ class AuthRepository:
         """
         
         try:
-            return self.session.query(User).filter(User.id == id).first()
+            return await self.session.scalar(select(User).where(User.id == id))
         except SQLAlchemyError:
             return None
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Recupera um usuário pelo seu email do banco de dados.
 
@@ -42,11 +43,11 @@ class AuthRepository:
         Optional[User] O objeto do usuário se encontrado, caso contrário None.
         """
         try:
-            return self.session.query(User).filter(User.email == email).first()
+            return await self.session.scalar(select(User).where(User.email == email))
         except SQLAlchemyError:
             return None
 
-    def create_user(self, user: User) -> User:
+    async def create_user(self, user: User) -> User:
         """
         Cria um novo usuário no banco de dados.
 
@@ -58,8 +59,8 @@ class AuthRepository:
         """
         try:
             self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
+            await self.session.commit()
+            await self.session.refresh(user)
             return user
         except SQLAlchemyError:
             return None
@@ -28,7 +28,7 @@ async def create_account(
     Se o usuário não for criado, retorna um erro HTTP 400 com a mensagem 'Erro ao criar o usuário.'.
     """
 
-    user = service.create_user(create_user_schema)
+    user = await service.create_user(create_user_schema)
     return ResponseUserSchema(message='Usuário criado com sucesso.', data=ResponseUser.from_orm(user))
 
 @router.post('/create-account-admin', status_code=status.HTTP_201_CREATED, response_model=ResponseUserSchema[ResponseUser])
@@ -48,7 +48,7 @@ async def create_account_admin(
     Se o usuário não for criado, retorna um erro HTTP 400 com a mensagem 'Erro ao criar o usuário.'.
     """
 
-    user = service.create_user_admin(create_user_admin_schema, user)
+    user = await service.create_user_admin(create_user_admin_schema, user)
     return ResponseUserSchema(message='Usuário criado com sucesso.', data=ResponseUser.from_orm(user))
 
 @router.get('/refresh-token', status_code=status.HTTP_200_OK)
@@ -68,7 +68,7 @@ async def refresh_token(refresh_token: str = Depends(oauth2_scheme),
     ----------
     dict: Um dicion rio com os tokens de acesso e atualiza o.
     """
-    refresh_token_service = service.refresh_token(refresh_token)
+    refresh_token_service = await service.refresh_token(refresh_token)
     return refresh_token_service
 
 @router.post('/login', status_code=status.HTTP_200_OK)
@@ -95,7 +95,7 @@ async def login(login_user_schema: LoginUserSchemas,
     ----------
     HTTPException: Se o usuário não existir ou as credenciais forem inválidas.
     """
-    login = service.login(login_user_schema)
+    login = await service.login(login_user_schema)
     return login
 
 @router.post('/login-form', status_code=status.HTTP_200_OK)
@@ -121,6 +121,6 @@ async def login_form(login_user_form: OAuth2PasswordRequestForm = Depends(),
     ----------
     HTTPException: Se o usuário não existir ou as credenciais forem inválidas.
     """
-    return service.login_form(login_user_form)
+    return await service.login_form(login_user_form)
 
 
@@ -18,6 +18,24 @@ class ResponseUser(BaseModel):
     class Config:
         from_attributes = True
 
+class AuthenticatedUser(BaseModel):
+    """
+    Cópia imutável e desligada da sessão do usuário autenticado, guardada no cache de tokens.
+
+    O cache não pode guardar o `User` da ORM: um rollback na sessão da requisição expira o
+    objeto e, depois que a sessão fecha, as próximas requisições com o mesmo token falhariam
+    ao ler os atributos (`DetachedInstanceError`).
+    """
+    id: int
+    name: Optional[str] = None
+    email: str
+    active: Optional[bool] = None
+    admin: Optional[bool] = False
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
 class CreateUserSchemas(BaseModel):
     name: str
     email: str
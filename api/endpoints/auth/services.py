@@ -1,38 +1,46 @@
-import os
-from passlib.context import CryptContext
-from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException
 from jose import JWTError, jwt
 
+from api.endpoints.auth.cache import PrincipalCache, principal_cache
+from api.endpoints.auth.hashing import PasswordHasher, password_hasher
 from api.endpoints.auth.repository import AuthRepository
-from api.endpoints.auth.schemas import CreateUserSchemas, CreateUserAdminSchemas, LoginUserSchemas
+from api.endpoints.auth.schemas import AuthenticatedUser, CreateUserSchemas, CreateUserAdminSchemas, LoginUserSchemas
 from api.models.users import User
 from api.config.emuns import UserErrorMessages
-
-load_dotenv()
+from api.config.settings import Settings, get_settings
 
 
 class AuthService:
-    def __init__(self, repository: AuthRepository):
+    def __init__(self, repository: AuthRepository, cache: PrincipalCache = principal_cache,
+                 hasher: PasswordHasher = password_hasher, settings: Settings = None):
         """
         Inicializa o serviço de autenticação.
 
+        As configurações, o cache e o contexto de criptografia são objetos únicos do processo
+        e apenas referenciados aqui, tornando barata a criação do serviço a cada requisição.
+
         Args:
         repository (AuthRepository): O repositório de usuários.
+        cache (PrincipalCache): O cache dos usuários autenticados por token.
+        hasher (PasswordHasher): O pool que executa o hash e a verificação de senhas.
+        settings (Settings, optional): As configurações da aplicação. Padrão é `get_settings()`.
         """
+        settings = settings or get_settings()
         self.repository = repository
-        self.bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
-        self.secret_key = os.getenv('SECRET_KEY')
-        self.algorithm = os.getenv('ALGORITHM')
-        self.access_token_expire = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES'))
+        self.cache = cache
+        self.hasher = hasher
+        self.secret_key = settings.secret_key
+        self.algorithm = settings.algorithm
+        self.access_token_expire = settings.access_token_expire_minutes
 
-    def encrypt_password(self, password: str) -> str:
+    async def encrypt_password(self, password: str) -> str:
         """
         Encripta a senha informada.
 
-        Recebe uma senha como string e a encripta com o algoritmo bcrypt.
+        Recebe uma senha como string e a encripta com o algoritmo bcrypt,
+        executado no pool de threads para não bloquear o event loop.
 
         Args:
             password (str): A senha a ser encriptada.
@@ -40,9 +48,9 @@ class AuthService:
         Returns:
             str: A senha encriptada.
         """
-        return self.bcrypt_context.hash(password)
+        return await self.hasher.hash(password)
     
-    def create_user(self, data: CreateUserSchemas) -> User:
+    async def create_user(self, data: CreateUserSchemas) -> User:
         """
         Cria um novo usuário no banco de dados.
 
@@ -59,32 +67,32 @@ class AuthService:
         Raises:
             HTTPException: Se o e-mail do usuário já existir no banco de dados.
         """
-        user_exists = self.repository.get_user_by_email(data.email)
+        user_exists = await self.repository.get_user_by_email(data.email)
         if user_exists:
             raise HTTPException(status_code=400, detail=UserErrorMessages.EMAIL_ALREADY_REGISTERED)
 
-        encrypted = self.encrypt_password(data.password)
+        encrypted = await self.encrypt_password(data.password)
         user = User(
             name=data.name,
             email=data.email,
             password=encrypted
         )
 
-        created = self.repository.create_user(user)
+        created = await self.repository.create_user(user)
         if not created:
             raise HTTPException(status_code=400, detail=UserErrorMessages.USER_NOT_CREATED)
 
         return created
     
-    def create_user_admin(self, data: CreateUserAdminSchemas, user: User) -> User:
+    async def create_user_admin(self, data: CreateUserAdminSchemas, user: User) -> User:
         if not user.admin:
             raise HTTPException(status_code=400, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         
-        user_exists = self.repository.get_user_by_email(data.email)
+        user_exists = await self.repository.get_user_by_email(data.email)
         if user_exists:
             raise HTTPException(status_code=400, detail=UserErrorMessages.EMAIL_ALREADY_REGISTERED)
         
-        encrypted = self.encrypt_password(data.password)
+        encrypted = await self.encrypt_password(data.password)
         user_admin = User(
             name=data.name,
             email=data.email,
@@ -92,13 +100,13 @@ class AuthService:
             active=data.active
         )
 
-        created = self.repository.create_user(user_admin)
+        created = await self.repository.create_user(user_admin)
         if not created:
             raise HTTPException(status_code=400, detail=UserErrorMessages.USER_NOT_CREATED)
 
         return created
 
-    def create_token(self, user_id: int, token_duration: timedelta = None) -> str:
+    async def create_token(self, user_id: int, token_duration: timedelta = None) -> str:
         """
         Cria um token JWT para o usuário com o ID informado.
 
@@ -115,7 +123,7 @@ class AuthService:
         Returns:
             str: O token JWT gerado.
         """
-        user = self.repository.get_user_by_id(user_id)
+        user = await self.repository.get_user_by_id(user_id)
         if not user:
             return UserErrorMessages.USER_NOT_FOUND
 
@@ -130,11 +138,13 @@ class AuthService:
         jwt_code = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
         return jwt_code
 
-    def verify_token(self, token: str) -> User:
+    async def verify_token(self, token: str) -> AuthenticatedUser:
         """
         Verifica se o token é válido e retorna o usuário correspondente.
 
         Tenta decodificar o token e verifica se o usuário existe no banco de dados.
+        Tokens já verificados são atendidos pelo cache de usuários autenticados, sem consultar o banco.
+        O usuário é devolvido como `AuthenticatedUser`, uma cópia imutável desligada da sessão.
         Se o token for inválido, lança um erro com a mensagem "Não autorizado, token inválido!".
         Se o usuário não existir, lança um erro com a mensagem "usuário não encontrado!".
 
@@ -144,20 +154,26 @@ class AuthService:
 
         Returns:
         --------
-        User: O usuário correspondente ao token, caso o token seja v lido e o usuário exista. Caso contr rio, retorna uma mensagem de erro.
+        AuthenticatedUser: O usuário correspondente ao token, caso o token seja v lido e o usuário exista. Caso contr rio, retorna uma mensagem de erro.
         """
+        cached_user = self.cache.get(token)
+        if cached_user:
+            return cached_user
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except JWTError:
             raise HTTPException(status_code=401, detail=UserErrorMessages.USER_INVALID_TOKEN)
         
-        user = self.repository.get_user_by_id(int(payload['sub']))
+        user = await self.repository.get_user_by_id(int(payload['sub']))
         if not user:
             raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_FOUND)
         
-        return user
+        authenticated = AuthenticatedUser.model_validate(user)
+        self.cache.set(token, authenticated, payload.get('exp'))
+        return authenticated
 
-    def authenticate_user(self, email: str, password: str):
+    async def authenticate_user(self, email: str, password: str):
         """
         Autentica um usuário no sistema.
 
@@ -173,14 +189,14 @@ class AuthService:
         Returns:
             User | bool: O usuário autenticado ou False se a autentica o falhar.
         """
-        user = self.repository.get_user_by_email(email)
+        user = await self.repository.get_user_by_email(email)
         if not user:
             return False
-        elif not self.bcrypt_context.verify(password, user.password):
+        elif not await self.hasher.verify(password, user.password):
             return False
         return user
 
-    def login(self, data: LoginUserSchemas) -> dict:
+    async def login(self, data: LoginUserSchemas) -> dict:
         """
         Realiza o login do usuário e retorna os tokens de acesso.
 
@@ -198,12 +214,12 @@ class AuthService:
         Raises:
             HTTPException: Se o usuário não existir ou as credenciais forem inválidas.
         """
-        user = self.authenticate_user(data.email, data.password)
+        user = await self.authenticate_user(data.email, data.password)
         if not user:
             return UserErrorMessages.USER_NOT_FOUND_OR_CREDENTIALS_INVALID
 
-        access_token = self.create_token(user.id)
-        refresh_token = self.create_token(user.id, token_duration=timedelta(days=7))
+        access_token = await self.create_token(user.id)
+        refresh_token = await self.create_token(user.id, token_duration=timedelta(days=7))
 
         data = {
                 "access_token": access_token,
@@ -213,7 +229,7 @@ class AuthService:
 
         return data
     
-    def login_form(self, data) -> dict:
+    async def login_form(self, data) -> dict:
         """
         Realiza o login do usuário e retorna os tokens de acesso.
 
@@ -231,12 +247,12 @@ class AuthService:
         Raises:
             HTTPException: Se o usuário n o existir ou as credenciais forem inv lidas.
         """
-        user = self.authenticate_user(data.username, data.password)
+        user = await self.authenticate_user(data.username, data.password)
         if not user:
             return UserErrorMessages.USER_NOT_FOUND_OR_CREDENTIALS_INVALID
 
-        access_token = self.create_token(user.id)
-        refresh_token = self.create_token(user.id, token_duration=timedelta(days=7))
+        access_token = await self.create_token(user.id)
+        refresh_token = await self.create_token(user.id, token_duration=timedelta(days=7))
 
         data = {
                 "access_token": access_token,
@@ -245,7 +261,7 @@ class AuthService:
                 }
         return data
 
-    def refresh_token(self, refresh_token: str):
+    async def refresh_token(self, refresh_token: str):
         """
         Renova o token de acesso com o token de refresh informado.
 
@@ -258,9 +274,9 @@ class AuthService:
         Returns:
             dict: Um dicionário com os tokens de acesso e atualiza o.
         """
-        user = self.verify_token(refresh_token)
-        access_token = self.create_token(user.id)
-        refresh_token = self.create_token(user.id, token_duration=timedelta(days=7))
+        user = await self.verify_token(refresh_token)
+        access_token = await self.create_token(user.id)
+        refresh_token = await self.create_token(user.id, token_duration=timedelta(days=7))
 
         data = {
                 "access_token": access_token,
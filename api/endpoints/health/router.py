@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from api.config.emuns import UserErrorMessages
+from api.database.engine import engine
+from api.database.pool import pool_status
+from api.endpoints.auth.providers import get_current_user
+from api.models.users import User
+
+
+router = APIRouter(
+    prefix='/api/v1/health',
+    tags=['health'],
+    dependencies=[Depends(get_current_user)]
+)
+
+@router.get('/db-pool', status_code=status.HTTP_200_OK)
+async def get_db_pool_status(user: User = Depends(get_current_user)):
+    """
+    Retorna a situação do pool de conexões com o banco de dados deste worker.
+
+    Informa o tamanho do pool, as conexões livres, em uso e em overflow, e o tempo de espera
+    para obter uma conexão, usados para dimensionar o pool por worker do uvicorn.
+    Acessível apenas por administradores.
+
+    Raises
+    ------
+    HTTPException
+        403 se o usuário não for administrador.
+    """
+    if not user.admin:
+        raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
+
+    return pool_status(engine)
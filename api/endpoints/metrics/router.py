@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from api.config.metrics import metrics
+
+
+router = APIRouter(tags=['metrics'])
+
+@router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """
+    Retorna as métricas deste worker no formato texto do Prometheus: latência por rota,
+    requisições em andamento, respostas por status, fila do pool de bcrypt, uso do pool
+    do banco e taxa de acerto dos caches.
+
+    Não exige autenticação, para ser consultada diretamente pelo Prometheus; deve ficar
+    acessível apenas pela rede interna.
+    """
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
@@ -1,37 +1,49 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 from typing import Optional
+from api.config.pagination import paginate
+from api.endpoints.orders.repository import OrderRepository
+from api.database.routing import replica_read
 from api.models.order_items import OrderItem
+from api.models.orders import Order
 
 class OrderItemsRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         """
         Inicializa o repositório de pedidos.
 
         Parâmetros
         ----------
-        session : Session
-            A sessão do banco de dados.
+        session : AsyncSession
+            A sessão assíncrona do banco de dados.
         """
         self.session = session
 
-    def get_all_order_items(self, offset: int = 0, limit: int = 10) -> list[OrderItem]:
+    @replica_read
+    async def get_all_order_items(self, offset: int = 0, limit: int = 10, after: Optional[int] = None) -> list[OrderItem]:
         """
             Recupera todos os pedidos do banco de dados.
 
             Parâmetros
             offset : int, opcional O número de pedidos a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
             limit : int, opcional O número máximo de pedidos a serem retornados. Padrão é 10.
+            after : int, opcional O ID do último item da página anterior, para paginação por cursor. Quando informado, o offset é ignorado.
 
             Retornos
             list[OrderItem] A lista de pedidos se encontrado, caso contrário uma lista vazia.
         """
         try:
-            return self.session.query(OrderItem).filter(OrderItem.active == True).offset(offset).limit(limit).all()
+            result = await self.session.scalars(
+                paginate(select(OrderItem).where(OrderItem.active == True), OrderItem.id, offset, limit, after)
+            )
+            return list(result)
         except SQLAlchemyError:
             return []
 
-    def get_order_items_by_id(self, id) -> Optional[OrderItem]:
+    @replica_read
+    async def get_order_items_by_id(self, id) -> Optional[OrderItem]:
         """
             Recupera um pedido pelo seu ID do banco de dados.
 
@@ -42,41 +54,115 @@ class OrderItemsRepository:
             Optional[OrderItem] O objeto do pedido se encontrado, caso contrário None.
         """
         try:
-            return self.session.query(OrderItem).filter(OrderItem.id == id, OrderItem.active == True).first()
+            return await self.session.scalar(select(OrderItem).where(OrderItem.id == id, OrderItem.active == True))
         except SQLAlchemyError:
             return None
 
-    def create_order_item(self, order_item: OrderItem) -> OrderItem:
+    async def create_order_item(self, order_item: OrderItem, order: Order) -> Optional[OrderItem]:
         """
-        Cria um novo pedido no banco de dados.
+        Cria um novo item de pedido e atualiza o preço do pedido na mesma transação.
+
+        O preço é recalculado no banco (`SUM(unit_price * amount)` dos itens ativos),
+        sem carregar os demais itens do pedido.
 
         Parameters
         ----------
-        OrderItem : OrderItem
-            O pedido a ser criado.
+        order_item : OrderItem
+            O item de pedido a ser criado.
+        order : Order
+            O pedido ao qual o item pertence.
 
         Returns
         -------
-        OrderItem
-            O pedido criado com o ID atualizado.
+        OrderItem | None
+            O item criado com o ID atualizado, ou None se ocorrer um erro no banco.
+
+        Raises
+        ------
+        StaleDataError
+            Se o pedido foi alterado por outra requisição desde que foi lido.
         """
         try:
-
             self.session.add(order_item)
-            self.session.commit()
-            self.session.refresh(order_item)
+            order.touch()
+            await OrderRepository(self.session).update_order_price(order)
+            await self.session.commit()
             return order_item
+        except StaleDataError:
+            await self.session.rollback()
+            raise
         except SQLAlchemyError:
+            await self.session.rollback()
             return None
 
-    def delete_order_items(self, id_order_items: int):
+    async def create_order_items(self, values: list[dict], order: Order) -> Optional[list[OrderItem]]:
+        """
+        Cria vários itens de um mesmo pedido e atualiza o preço do pedido na mesma transação.
+
+        Os itens são gravados em um único INSERT em lote (ver `OrderRepository.insert_items`)
+        e o preço do pedido é recalculado no banco uma única vez.
+
+        Parameters
+        ----------
+        values : list[dict]
+            Os valores das colunas de cada item de pedido a ser criado.
+        order : Order
+            O pedido ao qual os itens pertencem.
+
+        Returns
+        -------
+        list[OrderItem] | None
+            Os itens criados com os IDs atualizados, ou None se ocorrer um erro no banco.
+
+        Raises
+        ------
+        StaleDataError
+            Se o pedido foi alterado por outra requisição desde que foi lido.
+        """
         try:
-            order_item = self.get_order_items_by_id(id_order_items)
-            if order_item:
-                order_item.active = False
-                self.session.commit()
-                return order_item
-            else:
-                return None
+            orders = OrderRepository(self.session)
+            order_items = await orders.insert_items(values)
+            order.touch()
+            await orders.update_order_price(order)
+            await self.session.commit()
+            return order_items
+        except StaleDataError:
+            await self.session.rollback()
+            raise
+        except SQLAlchemyError:
+            await self.session.rollback()
+            return None
+
+    async def delete_order_items(self, order_item: OrderItem, order: Order) -> Optional[OrderItem]:
+        """
+        Inativa um item de pedido e recalcula o preço do pedido na mesma transação.
+
+        Parameters
+        ----------
+        order_item : OrderItem
+            O item de pedido a ser inativado.
+        order : Order
+            O pedido ao qual o item pertence.
+
+        Returns
+        -------
+        OrderItem | None
+            O item inativado, ou None se ocorrer um erro no banco.
+
+        Raises
+        ------
+        StaleDataError
+            Se o pedido foi alterado por outra requisição desde que foi lido.
+        """
+        try:
+            order_item.active = False
+            order.touch()
+            await OrderRepository(self.session).update_order_price(order)
+            await self.session.commit()
+            return order_item
+        except StaleDataError:
+            await self.session.rollback()
+            raise
         except SQLAlchemyError:
+            await self.session.rollback()
             return None
\ No newline at end of file
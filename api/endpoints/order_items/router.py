@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from typing import List, Optional
 
+from api.config.idempotency import idempotency_store
+from api.config.pagination import decode_cursor, next_cursor
+from api.config.responses import model_response
 from api.endpoints.auth.providers import get_current_user
 from api.endpoints.order_items.schemas import (CreateOrderItemsSchema, OrderItemsPublicSchema, ResponseOrderItemsSchema)
 from api.endpoints.order_items.services import OrderItemsService
@@ -14,11 +17,13 @@ router = APIRouter(
     dependencies=[Depends(get_current_user)])
 
 @router.get('/', status_code=status.HTTP_200_OK, response_model=ResponseOrderItemsSchema[List[OrderItemsPublicSchema]])
-async def get_all_order_items(offset: int = 0, limit: int = 10, service: OrderItemsService = Depends(get_order_items_service)):
+async def get_all_order_items(offset: int = 0, limit: int = 10, after: Optional[str] = None,
+                              service: OrderItemsService = Depends(get_order_items_service)):
     """
     Recupera todos os itens do pedido do banco de dados com paginação.
 
     Este endpoint permite que os usuários busquem uma lista de pedidos, com paginação opcional usando parâmetros de offset e limite.
+    Para percorrer páginas profundas, informe em `after` o `next_cursor` retornado na página anterior; nesse caso o offset é ignorado.
 
     Parâmetros
     ----------
@@ -29,11 +34,13 @@ async def get_all_order_items(offset: int = 0, limit: int = 10, service: OrderIt
     ResponseOrderItemsSchema[List[OrderItemsPublicSchema]] Um esquema de resposta contendo uma mensagem e a lista de pedidos.
     """
 
-    order_items = service.get_all_order_items(offset, limit)
-    return ResponseOrderItemsSchema(message='Order items found', data=order_items)
+    order_items = await service.get_all_order_items(offset, limit, decode_cursor(after))
+    return model_response(ResponseOrderItemsSchema[List[OrderItemsPublicSchema]](
+        message='Order items found', data=order_items, next_cursor=next_cursor(order_items, limit)))
 
 @router.post('/', status_code=status.HTTP_201_CREATED, response_model=ResponseOrderItemsSchema[OrderItemsPublicSchema])
 async def create_order_items(create_order_items_schema: CreateOrderItemsSchema, 
+                            idempotency_key: Optional[str] = Header(None, max_length=255),
                             service: OrderItemsService = Depends(get_order_items_service),
                             user: User = Depends(get_current_user)):
     
@@ -45,9 +52,17 @@ async def create_order_items(create_order_items_schema: CreateOrderItemsSchema,
     Se o item do pedido for criado com sucesso, retorna o item do pedido criado com o status HTTP 201.
     Se o item do pedido n o for criado, retorna um erro HTTP 400 com a mensagem 'Erro ao criar o item do pedido.'.
     Se o usuário não tiver permissão, retorna um erro HTTP 401 com a mensagem 'Unauthorized'.
+
+    Com o cabeçalho `Idempotency-Key`, novas tentativas com a mesma chave recebem a resposta
+    original (com `Idempotent-Replayed: true`) sem criar outro item.
     """
-    order_items = service.create_order_items(create_order_items_schema, user)
-    return ResponseOrderItemsSchema(message='Item do do pedido criado com sucesso.', data=order_items)
+    async def create():
+        order_items = await service.create_order_items(create_order_items_schema, user)
+        return model_response(ResponseOrderItemsSchema[OrderItemsPublicSchema](
+            message='Item do do pedido criado com sucesso.', data=order_items), status_code=status.HTTP_201_CREATED)
+
+    return await idempotency_store.run(idempotency_key, user.id, 'POST /api/v1/order-items/',
+                                       create_order_items_schema.model_dump(mode='json'), create)
 
 @router.get('/{id_order_items}', status_code=status.HTTP_200_OK, response_model=ResponseOrderItemsSchema[OrderItemsPublicSchema])
 async def get_order_items(id_order_items : int, service: OrderItemsService = Depends(get_order_items_service),
@@ -62,7 +77,7 @@ async def get_order_items(id_order_items : int, service: OrderItemsService = Dep
     Se o pedido não existir, retorna um erro HTTP 404 com a mensagem 'Order not found'.
     Se o usuário não tiver permissão, retorna um erro HTTP 401 com a mensagem 'Unauthorized'.
     """
-    order = service.get_order_items(id_order_items, user)
+    order = await service.get_order_items(id_order_items, user)
     return ResponseOrderItemsSchema(message='Order found', data=order)
 
 @router.post('/{id_order_items}/delete', status_code=status.HTTP_204_NO_CONTENT)
@@ -77,5 +92,5 @@ async def delete_order_items(id_order_items : int, service: OrderItemsService =
     Se o item de pedido n o existir, retorna um erro HTTP 404 com a mensagem 'Order not found'.
     Se o usuário n o tiver permiss o, retorna um erro HTTP 401 com a mensagem 'Unauthorized'.
     """
-    service.delete_order_items(id_order_items, user)
+    await service.delete_order_items(id_order_items, user)
     return ResponseOrderItemsSchema(message='Order item deleted', data=None)
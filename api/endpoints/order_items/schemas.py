@@ -7,18 +7,22 @@ T = TypeVar("T")
 class ResponseOrderItemsSchema(BaseModel, Generic[T]):
     message: str
     data: Optional[T] = None # Pode ser um objeto, uma lista, ou None
+    next_cursor: Optional[str] = None # Cursor da próxima página nas listagens paginadas
 
 
-class CreateOrderItemsSchema(BaseModel):
+class CreateOrderItemsNestedSchema(BaseModel):
+    """Item informado junto com a criação do pedido (o pedido ainda não possui ID)."""
     amount: int
     flavor: str
     size: str
     unit_price: float
-    order: int
 
     class Config:
         from_attributes = True
 
+class CreateOrderItemsSchema(CreateOrderItemsNestedSchema):
+    order: int
+
 class OrderItemsPublicSchema(BaseModel):
     id: int
     amount: int
@@ -1,7 +1,11 @@
 from fastapi import HTTPException
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Optional
 
 from api.config.emuns import UserErrorMessages, OrderErrorMessages
-from api.database.session import get_session
+from api.database.routing import use_primary
+from api.endpoints.orders.cache import OrderCache, order_cache
+from api.endpoints.orders.events import OrderEventBroker, order_events
 from api.endpoints.orders.repository import OrderRepository
 from api.endpoints.order_items.repository import OrderItemsRepository
 from api.endpoints.order_items.schemas import CreateOrderItemsSchema
@@ -10,7 +14,8 @@ from api.models.order_items import OrderItem
 
 
 class OrderItemsService:
-    def __init__(self, repository: OrderItemsRepository):
+    def __init__(self, repository: OrderItemsRepository, cache: OrderCache = order_cache,
+                 events: OrderEventBroker = order_events):
         """
         Inicializa o serviço de itens de pedidos.
 
@@ -18,10 +23,16 @@ class OrderItemsService:
         ----------
         repository : OrderItemsRepository
             O repositório de pedidos.
+        cache : OrderCache, opcional
+            O cache de pedidos, invalidado a cada item criado ou removido.
+        events : OrderEventBroker, opcional
+            O broker que notifica o stream de pedidos a cada item criado ou removido.
         """
         self.repository = repository
+        self.cache = cache
+        self.events = events
 
-    def get_all_order_items(self, offset: int = 0, limit: int = 10):
+    async def get_all_order_items(self, offset: int = 0, limit: int = 10, after: Optional[int] = None):
         """
         Recupera todos os pedidos do banco de dados com paginação.
 
@@ -29,14 +40,15 @@ class OrderItemsService:
         ----------
         offset : int, opcional O número de pedidos a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
         limit : int, opcional O número máximo de pedidos a serem retornados. Padrão é 10.
+        after : int, opcional O ID do último item da página anterior, para paginação por cursor. Padrão é None.
 
         Retornos
         -------
         list[OrderItems] A lista de itens de pedidos se encontrado, caso contrário uma lista vazia.
         """
-        return self.repository.get_all_order_items(offset, limit)
+        return await self.repository.get_all_order_items(offset, limit, after)
 
-    def get_order_items(self, id_order_items: int, user: User):
+    async def get_order_items(self, id_order_items: int, user: User):
         """
         Recupera um imtem pedido pelo seu ID do banco de dados.
 
@@ -61,17 +73,24 @@ class OrderItemsService:
             Um erro HTTP 401 com a mensagem 'Unauthorized' se o usuário não tiver permissão.
             
         """
-        order = self.repository.get_order_by_id(id_order_items)
+        order_items = await self.repository.get_order_items_by_id(id_order_items)
+        if not order_items:
+            raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
+
+        order = await OrderRepository(self.repository.session).get_order_by_id(order_items.order, load_items=False)
         if not order:
             raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
         if order.user != user.id and not user.admin:
             raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
-        return order
+        return order_items
 
-    def create_order_items(self, data: CreateOrderItemsSchema, user: User):
+    async def create_order_items(self, data: CreateOrderItemsSchema, user: User):
         """
         Cria um novo item de pedido no banco de dados.
 
+        O item e a atualização do preço do pedido são gravados em uma única transação,
+        na mesma sessão da requisição.
+
         Parâmetros
         ----------
         data : CreateOrderItemsSchema
@@ -82,9 +101,71 @@ class OrderItemsService:
         Order itemms
             O item de pedido criado com o ID atualizado.
         """
-        session = next(get_session())
-        order_repo = OrderRepository(session)
-        order = order_repo.get_order_by_id(data.order)
+        order = await self._get_order_for_new_items(data.order, user)
+        order_item = OrderItem(
+            amount=data.amount,
+            flavor=data.flavor,
+            size=data.size,
+            unit_price=data.unit_price,
+            order=order.id)
+
+        try:
+            order_item_created = await self.repository.create_order_item(order_item, order)
+        except StaleDataError:
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
+        if not order_item_created:
+            raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_UPDATED)
+
+        await self.cache.invalidate()
+        self.events.publish('order.updated', order)
+        return order_item_created
+
+    async def create_order_items_batch(self, id_order: int, data: list[CreateOrderItemsSchema], user: User):
+        """
+        Cria vários itens de um mesmo pedido em uma única transação.
+
+        Os itens são inseridos em lote e o preço do pedido é atualizado uma única vez,
+        substituindo uma requisição por item.
+
+        Parâmetros
+        ----------
+        id_order : int
+            O ID do pedido que receberá os itens.
+        data : list[CreateOrderItemsSchema]
+            Os esquemas com os dados dos itens a serem criados. O campo `order` de cada item
+            deve ser igual a `id_order`.
+        user : User
+            O usuário que está fazendo a requisição.
+
+        Retornos
+        -------
+        list[OrderItem]
+            Os itens de pedido criados com os IDs atualizados.
+        """
+        if any(item.order != id_order for item in data):
+            raise HTTPException(status_code=400, detail=OrderErrorMessages.ORDER_ITEMS_ORDER_MISMATCH)
+
+        order = await self._get_order_for_new_items(id_order, user)
+        values = [{**item.model_dump(), 'order': order.id, 'active': True} for item in data]
+
+        try:
+            order_items_created = await self.repository.create_order_items(values, order)
+        except StaleDataError:
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
+        if not order_items_created:
+            raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_UPDATED)
+
+        await self.cache.invalidate()
+        self.events.publish('order.updated', order)
+        return order_items_created
+
+    async def _get_order_for_new_items(self, id_order: int, user: User):
+        """
+        Recupera o pedido que receberá novos itens, validando a existência, a permissão
+        do usuário e se o pedido ainda está pendente (não cancelado nem finalizado).
+        """
+        use_primary(self.repository.session)
+        order = await OrderRepository(self.repository.session).get_order_by_id(id_order, load_items=False)
 
         if not order:
             raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
@@ -95,23 +176,17 @@ class OrderItemsService:
         if order.status == 'CANCELADO':
             raise HTTPException(status_code=400, detail=OrderErrorMessages.ORDER_ALREADY_CANCELLED)
 
-        order_item = OrderItem(
-            amount=data.amount,
-            flavor=data.flavor,
-            size=data.size,
-            unit_price=data.unit_price,
-            order=order.id)
+        if order.status == 'FINALIZADO':
+            raise HTTPException(status_code=400, detail=OrderErrorMessages.ORDER_ALREADY_FINISHED)
 
-        order_item_created = self.repository.create_order_item(order_item)
-        order.update_order_price()
-        session.commit()
-        session.refresh(order)
-        return order_item_created
+        return order
 
-    def delete_order_items(self, id_order_items: int, user: User):
+    async def delete_order_items(self, id_order_items: int, user: User):
         """
         Deleta um item de pedido no banco de dados.
 
+        A inativação do item e a atualização do preço do pedido são gravadas em uma única transação.
+
         Parâmetros
         ----------
         id_order_items : int
@@ -124,25 +199,33 @@ class OrderItemsService:
             Um erro HTTP 404 com a mensagem 'Order not found' se o item de pedido não existir.
             Um erro HTTP 401 com a mensagem 'Unauthorized' se o usuário não tiver permissão.
         """
-        session = next(get_session())
-        order_repo = OrderRepository(session)
+        use_primary(self.repository.session)
+        order_repo = OrderRepository(self.repository.session)
 
-        order_items = self.repository.get_order_items_by_id(id_order_items)
+        order_items = await self.repository.get_order_items_by_id(id_order_items)
         if not order_items:
             raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
         
-        order = order_repo.get_order_by_id(order_items.order)
+        order = await order_repo.get_order_by_id(order_items.order, load_items=False)
         if not order:
             raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
         
         if order.status == 'CANCELADO':
             raise HTTPException(status_code=400, detail=OrderErrorMessages.ORDER_ALREADY_CANCELLED)
 
+        if order.status == 'FINALIZADO':
+            raise HTTPException(status_code=400, detail=OrderErrorMessages.ORDER_ALREADY_FINISHED)
+
         if order.user != user.id and not user.admin:
             raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
 
-        order_item_created = self.repository.delete_order_items(id_order_items)
-        order.update_order_price()
-        session.commit()
-        session.refresh(order)
-        return order_item_created
+        try:
+            order_item_deleted = await self.repository.delete_order_items(order_items, order)
+        except StaleDataError:
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
+        if not order_item_deleted:
+            raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_UPDATED)
+
+        await self.cache.invalidate()
+        self.events.publish('order.updated', order)
+        return order_item_deleted
@@ -0,0 +1,107 @@
+from typing import Awaitable, Callable, List, Optional
+
+from pydantic import TypeAdapter
+
+from api.config.cache import build_cache_backend
+from api.config.settings import get_settings
+from api.endpoints.orders.schemas import OrderPublicSchema
+
+ORDERS_ADAPTER = TypeAdapter(List[OrderPublicSchema])
+
+
+class OrderCache:
+    def __init__(self, backend=None, ttl: float = 5, prefix: str = 'orders'):
+        """
+        Cache das listagens de pedidos e dos pedidos individuais já serializados.
+
+        As chaves incluem um contador de geração: qualquer alteração em pedidos ou itens
+        incrementa o contador (`invalidate`) e todas as entradas anteriores deixam de ser lidas,
+        expirando pelo TTL. Uma leitura do banco que termine depois de uma alteração grava
+        sob a geração antiga e nunca é servida.
+
+        Args:
+            backend: Backend com a interface do `redis.asyncio` (`get`, `set`, `incr`).
+                Sem backend o cache fica desabilitado e as consultas vão sempre ao banco.
+            ttl (float): Tempo máximo, em segundos, que uma entrada permanece no cache. O Redis só
+                aceita segundos inteiros em `ex`, então o valor é truncado (mínimo de 1 segundo).
+            prefix (str): Prefixo das chaves no backend.
+        """
+        self.backend = backend
+        self.ttl = max(1, int(ttl))
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    async def get_orders(self, scope: str, offset: int, limit: int, after: Optional[int],
+                         loader: Callable[[], Awaitable[list]]) -> list[OrderPublicSchema]:
+        """
+        Retorna uma página de pedidos do cache ou, se ausente, carrega com `loader` e guarda.
+
+        Args:
+            scope (str): Quem pode ver a página (ex: `all` para administradores, `user:1`).
+            offset, limit, after: Os parâmetros de paginação da listagem.
+            loader: Função assíncrona que busca os pedidos no banco.
+        """
+        if self.backend is None:
+            return await loader()
+
+        key = f'{self.prefix}:{await self._generation()}:list:{scope}:{offset}:{limit}:{after}'
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return ORDERS_ADAPTER.validate_json(cached)
+
+        self.misses += 1
+        orders = ORDERS_ADAPTER.validate_python(await loader(), from_attributes=True)
+        await self.backend.set(key, ORDERS_ADAPTER.dump_json(orders), ex=self.ttl)
+        return orders
+
+    async def get_order(self, id_order: int,
+                        loader: Callable[[], Awaitable[Optional[object]]]) -> Optional[OrderPublicSchema]:
+        """
+        Retorna um pedido do cache ou, se ausente, carrega com `loader` e guarda.
+        Pedidos não encontrados não são guardados.
+        """
+        if self.backend is None:
+            return await loader()
+
+        key = f'{self.prefix}:{await self._generation()}:order:{id_order}'
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return OrderPublicSchema.model_validate_json(cached)
+
+        self.misses += 1
+        order = await loader()
+        if order is None:
+            return None
+
+        order = OrderPublicSchema.model_validate(order)
+        await self.backend.set(key, order.model_dump_json(), ex=self.ttl)
+        return order
+
+    async def invalidate(self) -> None:
+        """
+        Invalida todas as listagens e pedidos em cache.
+
+        Deve ser chamado depois de qualquer alteração gravada em pedidos ou itens.
+        """
+        if self.backend is not None:
+            await self.backend.incr(f'{self.prefix}:generation')
+
+    def stats(self) -> dict:
+        """
+        Retorna a quantidade de acertos e falhas do cache e a taxa de acerto.
+        """
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_ratio': self.hits / total if total else 0.0}
+
+    async def _generation(self) -> int:
+        generation = await self.backend.get(f'{self.prefix}:generation')
+        return int(generation) if generation is not None else 0
+
+
+order_cache = OrderCache(
+    build_cache_backend(get_settings()),
+    ttl=get_settings().order_cache_ttl_seconds,
+)
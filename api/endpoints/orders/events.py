@@ -0,0 +1,106 @@
+import asyncio
+from typing import Optional
+
+from api.config.settings import get_settings
+from api.models.orders import Order
+
+
+class OrderSubscription:
+    def __init__(self, user_id: Optional[int] = None, max_queue: int = 100):
+        """
+        Inscrição de um cliente no stream de eventos de pedidos.
+
+        Args:
+            user_id (int, optional): Recebe apenas eventos dos pedidos deste usuário.
+                Quando None (administradores), recebe eventos de todos os pedidos.
+            max_queue (int): Quantidade máxima de eventos aguardando leitura.
+        """
+        self.user_id = user_id
+        self.queue: asyncio.Queue[Optional[dict]] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+    def wants(self, event: dict) -> bool:
+        return self.user_id is None or event['user'] == self.user_id
+
+    async def get(self) -> Optional[dict]:
+        """
+        Aguarda o próximo evento. Retorna None quando a inscrição foi descartada.
+        """
+        return await self.queue.get()
+
+    def drop(self) -> None:
+        """
+        Descarta a inscrição: esvazia a fila e sinaliza o fim do stream ao cliente,
+        que deve reconectar e recarregar os pedidos.
+        """
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class OrderEventBroker:
+    def __init__(self, max_queue: int = 100):
+        """
+        Pub/sub em memória dos eventos de alteração de pedidos, usado pelo stream
+        `/api/v1/orders/stream` no lugar do polling da listagem.
+
+        Cada inscrito tem uma fila limitada; um inscrito que não consome os eventos no ritmo
+        em que são publicados (fila cheia) é descartado, sem atrasar a publicação nem os demais.
+        O broker é local ao processo: cada worker do uvicorn entrega apenas os eventos das
+        alterações feitas por ele.
+
+        Args:
+            max_queue (int): Tamanho da fila de cada inscrito.
+        """
+        self.max_queue = max_queue
+        self.subscribers: set[OrderSubscription] = set()
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, user_id: Optional[int] = None) -> OrderSubscription:
+        subscription = OrderSubscription(user_id, self.max_queue)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: OrderSubscription) -> None:
+        self.subscribers.discard(subscription)
+
+    def publish(self, event_type: str, order: Order) -> None:
+        """
+        Publica um evento de alteração do pedido para os inscritos interessados.
+
+        Deve ser chamado depois que a alteração for gravada no banco.
+
+        Args:
+            event_type (str): O tipo do evento (ex: `order.created`, `order.cancelled`).
+            order (Order): O pedido alterado.
+        """
+        event = {
+            'type': event_type,
+            'id': order.id,
+            'user': order.user,
+            'status': order.status,
+            'price': float(order.price),
+            'version': order.version,
+        }
+        self.published += 1
+
+        for subscription in list(self.subscribers):
+            if not subscription.wants(event):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.drop()
+                self.unsubscribe(subscription)
+                self.dropped += 1
+
+    def stats(self) -> dict:
+        """
+        Retorna a quantidade de inscritos, de eventos publicados e de inscritos descartados.
+        """
+        return {'subscribers': len(self.subscribers), 'published': self.published, 'dropped': self.dropped}
+
+
+order_events = OrderEventBroker(max_queue=get_settings().order_events_queue_size)
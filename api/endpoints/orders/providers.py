@@ -1,21 +1,24 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.config.settings import Settings, get_settings
 from api.database.session import get_session
 from api.endpoints.orders.repository import OrderRepository
 from api.endpoints.orders.services import OrderService
 
-def get_order_service(session: Session = Depends(get_session)) -> OrderService:
+def get_order_service(session: AsyncSession = Depends(get_session),
+                      settings: Settings = Depends(get_settings)) -> OrderService:
     """
     Fornecer uma instância de OrderService.
 
-    Esta função é uma dependência do FastAPI que fornece uma instância de OrderService usando a sessão de banco de dados fornecida. Ela inicializa um OrderRepository com a sessão e retorna um OrderService com esse repositório.
+    Esta função é uma dependência do FastAPI que fornece uma instância de OrderService usando a sessão de banco de dados fornecida. Ela inicializa um OrderRepository com a sessão e a estratégia de carregamento dos itens definida em ORDER_ITEMS_LOADING_STRATEGY e retorna um OrderService com esse repositório.
 
     Parâmetros
-    session : Session Uma sessão de banco de dados, fornecida pela injeção de dependência do FastAPI.
+    session : AsyncSession Uma sessão assíncrona de banco de dados, fornecida pela injeção de dependência do FastAPI.
+    settings : Settings As configurações da aplicação.
 
     Retornos
     OrderService Uma instância de OrderService.
     """
 
-    repository = OrderRepository(session)
+    repository = OrderRepository(session, settings.order_items_loading_strategy)
     return OrderService(repository)
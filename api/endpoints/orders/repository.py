@@ -1,130 +1,368 @@
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+
+from sqlalchemy import Row, and_, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
 from typing import Optional
+from api.config.pagination import paginate
+from api.database.routing import replica_read
+from api.endpoints.reports.repository import ReportRepository
+from api.models.order_items import OrderItem
 from api.models.orders import Order
 
+# Estratégias de carregamento dos itens do pedido nas consultas de leitura.
+LOADING_STRATEGIES = {
+    'selectin': selectinload,
+    'joined': joinedload,
+}
+
 class OrderRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession, loading_strategy: str = 'selectin'):
         """
         Inicializa o repositório de pedidos.
 
         Parâmetros
         ----------
-        session : Session
-            A sessão do banco de dados.
+        session : AsyncSession
+            A sessão assíncrona do banco de dados.
+        loading_strategy : str, opcional
+            Estratégia de carregamento dos itens do pedido ('selectin' ou 'joined'). Padrão é 'selectin'.
         """
+        if loading_strategy not in LOADING_STRATEGIES:
+            raise ValueError(f'Estratégia de carregamento inválida: {loading_strategy}')
+
         self.session = session
+        self.loading_strategy = loading_strategy
+
+    def _select_orders(self, load_items: bool = True):
+        """
+        Monta a consulta base de pedidos já carregando os itens de forma antecipada,
+        evitando uma consulta extra por pedido durante a serialização.
 
-    def get_all_orders(self, offset: int = 0, limit: int = 10) -> list[Order]:
+        Com `load_items=False` os itens não são carregados (e qualquer acesso a eles falha),
+        para operações que só precisam dos dados do próprio pedido.
+        """
+        if not load_items:
+            return select(Order).options(raiseload(Order.items))
+
+        loader = LOADING_STRATEGIES[self.loading_strategy]
+        return select(Order).options(loader(Order.items))
+
+    @replica_read
+    async def get_all_orders(self, offset: int = 0, limit: int = 10, after: Optional[int] = None) -> list[Order]:
         """
             Recupera todos os pedidos do banco de dados.
 
             Parâmetros
             offset : int, opcional O número de pedidos a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
             limit : int, opcional O número máximo de pedidos a serem retornados. Padrão é 10.
+            after : int, opcional O ID do último pedido da página anterior, para paginação por cursor. Quando informado, o offset é ignorado.
 
             Retornos
             list[Order] A lista de pedidos se encontrado, caso contrário uma lista vazia.
         """
         try:
-            return self.session.query(Order).filter(Order.active == True).offset(offset).limit(limit).all()
+            result = await self.session.scalars(
+                paginate(self._select_orders().where(Order.active == True), Order.id, offset, limit, after)
+            )
+            return list(result.unique())
         except SQLAlchemyError:
             return []
     
-    def get_orders_by_user(self, user_id: int, offset: int = 0, limit: int = 10):
+    @replica_read
+    async def get_orders_by_user(self, user_id: int, offset: int = 0, limit: int = 10, after: Optional[int] = None):
         try:
-            return self.session.query(Order).filter(Order.user == user_id, Order.active == True).offset(offset).limit(limit).all()
+            result = await self.session.scalars(
+                paginate(
+                    self._select_orders().where(Order.user == user_id, Order.active == True),
+                    Order.id, offset, limit, after
+                )
+            )
+            return list(result.unique())
         except SQLAlchemyError:
             return []
 
-    def get_order_by_id(self, id_order: int) -> Optional[Order]:
+    @replica_read
+    async def get_order_by_id(self, id_order: int, load_items: bool = True) -> Optional[Order]:
         """
             Recupera um pedido pelo seu ID do banco de dados.
 
             Parâmetros
             id : int O ID do pedido a ser recuperado.
+            load_items : bool, opcional Se os itens do pedido devem ser carregados. Padrão é True.
 
             Retornos
             Optional[Order] O objeto do pedido se encontrado, caso contrário None.
         """
         try:
-            return self.session.query(Order).filter(Order.id == id_order, Order.active == True).first()
+            result = await self.session.scalars(
+                self._select_orders(load_items).where(Order.id == id_order, Order.active == True)
+            )
+            return result.unique().first()
+        except SQLAlchemyError:
+            return None
+
+    @replica_read
+    async def get_order_version(self, id_order: int) -> Optional[Row]:
+        """
+            Recupera apenas o dono, o status e a versão de um pedido, sem carregar os itens.
+
+            Parâmetros
+            id_order : int O ID do pedido.
+
+            Retornos
+            Optional[Row] A linha com `user`, `status` e `version` se o pedido for encontrado, caso contrário None.
+        """
+        try:
+            result = await self.session.execute(
+                select(Order.user, Order.status, Order.version).where(Order.id == id_order, Order.active == True)
+            )
+            return result.first()
         except SQLAlchemyError:
             return None
 
-    def create_order(self, order: Order) -> Order:
+    @replica_read
+    async def get_orders_versions(self, user_id: Optional[int] = None, offset: int = 0, limit: int = 10,
+                                  after: Optional[int] = None) -> list[Row]:
+        """
+            Recupera apenas o ID e a versão dos pedidos de uma página da listagem, sem carregar os itens.
+
+            Parâmetros
+            user_id : int, opcional O ID do dono dos pedidos. Quando None, considera todos os pedidos.
+            offset, limit, after : Os mesmos parâmetros de paginação de `get_all_orders`.
+
+            Retornos
+            list[Row] As linhas com `id` e `version` dos pedidos da página.
+        """
+        statement = select(Order.id, Order.version).where(Order.active == True)
+        if user_id is not None:
+            statement = statement.where(Order.user == user_id)
+
+        try:
+            result = await self.session.execute(paginate(statement, Order.id, offset, limit, after))
+            return list(result)
+        except SQLAlchemyError:
+            return []
+
+    @replica_read
+    async def stream_orders_with_items(self, batch_size: int = 1000) -> AsyncResult:
+        """
+            Abre um cursor no servidor sobre todos os pedidos ativos junto com os seus itens ativos
+            (uma linha por item; pedidos sem itens vêm com as colunas do item nulas), ordenado por pedido.
+
+            As linhas são buscadas em lotes de `batch_size` e só com as colunas necessárias,
+            sem montar objetos do ORM, mantendo a memória constante independente do tamanho da tabela.
+
+            Parâmetros
+            batch_size : int, opcional A quantidade de linhas buscadas por vez. Padrão é 1000.
+
+            Retornos
+            AsyncResult O resultado a ser percorrido de forma assíncrona (ex: `result.partitions()`).
+        """
+        statement = (
+            select(Order.id, Order.user, Order.status, Order.price, Order.version, Order.updated_at,
+                   OrderItem.id.label('item_id'), OrderItem.flavor, OrderItem.size, OrderItem.amount,
+                   OrderItem.unit_price)
+            .outerjoin(OrderItem, and_(OrderItem.order == Order.id, OrderItem.active == True))
+            .where(Order.active == True)
+            .order_by(Order.id, OrderItem.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return await self.session.stream(statement)
+
+    async def create_order(self, order: Order, items: Optional[list[dict]] = None) -> Optional[Order]:
         """
-        Cria um novo pedido no banco de dados.
+        Cria um novo pedido no banco de dados, opcionalmente junto com os seus itens.
+
+        O pedido e os itens são gravados em uma única transação; os itens em um único
+        INSERT em lote, e o preço do pedido é calculado no banco a partir dos itens gravados.
+        A contagem de pedidos por status dos relatórios é atualizada na mesma transação.
 
         Parameters
         ----------
         order : Order
             O pedido a ser criado.
+        items : list[dict], opcional
+            Os valores das colunas de cada item do pedido (sem o campo `order`).
 
         Returns
         -------
-        Order
-            O pedido criado com o ID atualizado.
+        Order | None
+            O pedido criado com o ID e os itens atualizados, ou None se ocorrer um erro no banco.
         """
         try:
-
             self.session.add(order)
-            self.session.commit()
-            self.session.refresh(order)
+            await self.session.flush()
+
+            created_items = []
+            if items:
+                created_items = await self.insert_items([{**item, 'order': order.id, 'active': True} for item in items])
+                await self.update_order_price(order)
+
+            set_committed_value(order, 'items', created_items)
+            await ReportRepository(self.session).record_status_change(order)
+            await self.session.commit()
             return order
         except SQLAlchemyError:
+            await self.session.rollback()
             return None
 
-    def cancel_order(self, id_order: int) -> Optional[Order]:
+    async def insert_items(self, values: list[dict]) -> list[OrderItem]:
+        """
+        Grava vários itens de pedido em um único INSERT em lote com RETURNING. Em bancos sem
+        RETURNING em lote (ex: MySQL), grava os itens pela sessão. Não faz commit.
+
+        Parameters
+        ----------
+        values : list[dict]
+            Os valores das colunas de cada item de pedido.
+
+        Returns
+        -------
+        list[OrderItem]
+            Os itens gravados, com os IDs atualizados.
+        """
+        if self.session.get_bind().dialect.insert_executemany_returning:
+            return list(await self.session.scalars(insert(OrderItem).returning(OrderItem), values))
+
+        items = [OrderItem(**item) for item in values]
+        self.session.add_all(items)
+        await self.session.flush()
+        return items
+
+    async def update_order_price(self, order: Order) -> None:
+        """
+        Recalcula o preço do pedido no banco, com um único
+        `UPDATE pedidos SET price = (SELECT SUM(unit_price * amount) ... WHERE active)`,
+        sem carregar os itens na sessão. Não faz commit.
+
+        O valor gravado volta pelo RETURNING; em bancos sem UPDATE ... RETURNING (ex: MySQL),
+        por uma consulta em seguida.
+
+        Parameters
+        ----------
+        order : Order
+            O pedido a ser atualizado; `order.price` recebe o valor gravado.
         """
-        Cancela um pedido no banco de dados.
+        await self.session.flush()
+        statement = update(Order).where(Order.id == order.id).values(price=Order.items_total())
+        execution_options = {'synchronize_session': False}
+
+        if self.session.get_bind().dialect.update_returning:
+            price = await self.session.scalar(statement.returning(Order.price), execution_options=execution_options)
+        else:
+            await self.session.execute(statement, execution_options=execution_options)
+            price = await self.session.scalar(select(Order.price).where(Order.id == order.id))
+        set_committed_value(order, 'price', price)
+
+    async def cancel_order(self, id_order: int, user_id: Optional[int] = None,
+                           version: Optional[int] = None) -> Optional[Order]:
+        """
+        Cancela um pedido pendente, atualizando os relatórios na mesma transação.
 
         Parameters
         ----------
         id_order : int
             O ID do pedido a ser cancelado.
+        user_id : int, opcional
+            O dono exigido do pedido. Se None (administradores), cancela o pedido de qualquer usuário.
+        version : int, opcional
+            A versão do pedido lida antes da alteração. Se informada, o pedido só é cancelado
+            se ainda estiver nessa versão.
 
         Returns
         -------
         Order | None
-            O pedido atualizado se encontrado e cancelado, ou None se não encontrado.
+            O pedido cancelado, ou None se ocorrer um erro no banco.
+
+        Raises
+        ------
+        StaleDataError
+            Se o pedido não existir, não pertencer a `user_id`, não estiver pendente ou tiver mudado de versão.
         """
         try:
-            order = self.get_order_by_id(id_order)
-            if not order:
-                return None
-
-            order.status = 'CANCELADO'
-            self.session.commit()
-            self.session.refresh(order)
+            order = await self._transition(id_order, 'CANCELADO', user_id, version)
+            await ReportRepository(self.session).record_status_change(order, 'PENDENTE')
+            await self.session.commit()
             return order
+        except StaleDataError:
+            await self.session.rollback()
+            raise
         except SQLAlchemyError:
-            self.session.rollback()
+            await self.session.rollback()
             return None
 
-    def finish_order(self, id_order: int) -> Optional[Order]:
+    async def finish_order(self, id_order: int, version: Optional[int] = None) -> Optional[Order]:
         """
-        Finaliza um pedido no banco de dados.
+        Finaliza um pedido pendente, atualizando os relatórios na mesma transação.
 
         Parameters
         ----------
         id_order : int
             O ID do pedido a ser finalizado.
+        version : int, opcional
+            A versão do pedido lida antes da alteração. Se informada, o pedido só é finalizado
+            se ainda estiver nessa versão.
 
         Returns
         -------
         Order | None
-            O pedido atualizado se encontrado e finalizado, ou None se não encontrado.
+            O pedido finalizado, ou None se ocorrer um erro no banco.
+
+        Raises
+        ------
+        StaleDataError
+            Se o pedido não existir, não estiver pendente ou tiver mudado de versão.
         """
         try:
-            order = self.get_order_by_id(id_order)
-            if not order:
-                return None
-
-            order.status = 'FINALIZADO'
-            self.session.commit()
-            self.session.refresh(order)
+            order = await self._transition(id_order, 'FINALIZADO', version=version)
+            reports = ReportRepository(self.session)
+            await reports.record_status_change(order, 'PENDENTE')
+            await reports.record_order_finished(order)
+            await self.session.commit()
             return order
+        except StaleDataError:
+            await self.session.rollback()
+            raise
         except SQLAlchemyError:
-            self.session.rollback()
-            return None
\ No newline at end of file
+            await self.session.rollback()
+            return None
+
+    async def _transition(self, id_order: int, status: str, user_id: Optional[int] = None,
+                          version: Optional[int] = None) -> Order:
+        """
+        Muda o status de um pedido pendente em um único UPDATE condicional, incrementando a versão.
+
+        A regra de transição (apenas PENDENTE -> CANCELADO/FINALIZADO), o dono do pedido e a versão
+        esperada são verificados no próprio UPDATE, sem ler o pedido antes e sem travar a linha:
+        se o pedido não se encaixa ou outra requisição o alterou no meio tempo, nenhuma linha é
+        atualizada. O pedido atualizado volta pelo RETURNING, com os itens carregados em seguida;
+        em bancos sem UPDATE ... RETURNING (ex: MySQL), por uma consulta após o UPDATE.
+        """
+        statement = (
+            update(Order)
+            .where(Order.id == id_order, Order.active == True, Order.status == 'PENDENTE')
+            .values(status=status, version=Order.version + 1, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        if user_id is not None:
+            statement = statement.where(Order.user == user_id)
+        if version is not None:
+            statement = statement.where(Order.version == version)
+
+        if self.session.get_bind().dialect.update_returning:
+            order = (await self.session.scalars(statement.returning(Order))).one_or_none()
+        elif (await self.session.execute(statement)).rowcount:
+            order = await self.session.scalar(
+                select(Order).where(Order.id == id_order).execution_options(populate_existing=True)
+            )
+        else:
+            order = None
+
+        if order is None:
+            raise StaleDataError(f'Pedido {id_order} não está disponível para a transição para {status}.')
+        return order
@@ -1,7 +1,22 @@
-from fastapi import APIRouter, Depends, status
-from typing import List
+import asyncio
+import json
 
+from fastapi import APIRouter, Body, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from api.config.etag import etag_matches
+from api.config.idempotency import idempotency_store
+from api.config.pagination import decode_cursor, next_cursor
+from api.config.responses import model_response
+from api.config.settings import Settings, get_settings
+from api.database.session import get_session
 from api.endpoints.auth.providers import get_current_user
+from api.endpoints.order_items.schemas import (CreateOrderItemsSchema, OrderItemsPublicSchema, ResponseOrderItemsSchema)
+from api.endpoints.order_items.services import OrderItemsService
+from api.endpoints.order_items.providers import get_order_items_service
+from api.endpoints.orders.events import order_events
 from api.endpoints.orders.schemas import (CreateOrderSchema, OrderPublicSchema, ResponseOrderSchema)
 from api.endpoints.orders.services import OrderService
 from api.endpoints.orders.providers import get_order_service
@@ -15,13 +30,18 @@ router = APIRouter(
 )
 
 @router.get('/', status_code=status.HTTP_200_OK, response_model=ResponseOrderSchema[List[OrderPublicSchema]])
-async def get_all_orders(offset: int = 0, limit: int = 10, 
+async def get_all_orders(offset: int = 0, limit: int = 10, after: Optional[str] = None,
+                         if_none_match: Optional[str] = Header(None),
                          service: OrderService = Depends(get_order_service),
                          user: User = Depends(get_current_user)):
     """
     Recupera todos os pedidos do banco de dados com paginação.
 
     Este endpoint permite que os usuários busquem uma lista de pedidos, com paginação opcional usando parâmetros de offset e limite.
+    Para percorrer páginas profundas, informe em `after` o `next_cursor` retornado na página anterior; nesse caso o offset é ignorado.
+
+    A resposta traz um ETag derivado da versão dos pedidos da página. Se o cabeçalho If-None-Match
+    corresponder ao ETag atual, retorna 304 sem carregar nem serializar os pedidos.
 
     Parâmetros
     ----------
@@ -32,12 +52,78 @@ async def get_all_orders(offset: int = 0, limit: int = 10,
     ResponseOrderSchema[List[OrderPublicSchema]] Um esquema de resposta contendo uma mensagem e a lista de pedidos.
     """
 
-    orders = service.get_all_orders(user, offset, limit)
-    return ResponseOrderSchema(message='Orders found', data=orders)
+    after_id = decode_cursor(after)
+    if if_none_match:
+        etag = await service.get_orders_etag(user, offset, limit, after_id)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    orders = await service.get_all_orders(user, offset, limit, after_id)
+    return model_response(
+        ResponseOrderSchema[List[OrderPublicSchema]](message='Orders found', data=orders, next_cursor=next_cursor(orders, limit)),
+        headers={'ETag': service.orders_etag(orders)},
+    )
+
+@router.get('/stream', status_code=status.HTTP_200_OK)
+async def stream_orders(user: User = Depends(get_current_user),
+                        session: AsyncSession = Depends(get_session),
+                        settings: Settings = Depends(get_settings)):
+    """
+    Stream (server-sent events) das alterações de pedidos, no lugar do polling da listagem.
+
+    Emite um evento a cada pedido criado (`order.created`), cancelado (`order.cancelled`),
+    finalizado (`order.finished`) ou com itens criados/removidos (`order.updated`), com o ID,
+    o dono, o status, o preço e a versão do pedido. Administradores recebem os eventos de todos
+    os pedidos; os demais usuários, apenas dos seus.
+
+    Clientes que não consomem os eventos a tempo são desconectados e devem reconectar
+    e recarregar a listagem.
+    """
+    # A sessão só é usada na autenticação; fechá-la libera a conexão durante o stream.
+    await session.close()
+    subscription = order_events.subscribe(None if user.admin else user.id)
+
+    async def event_stream():
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), settings.order_events_heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ': keep-alive\n\n'
+                    continue
+
+                if event is None:
+                    break
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            order_events.unsubscribe(subscription)
+
+    return StreamingResponse(event_stream(), media_type='text/event-stream',
+                             headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@router.get('/export', status_code=status.HTTP_200_OK)
+async def export_orders(export_format: str = Query('ndjson', alias='format', pattern='^(ndjson|csv)$'),
+                        service: OrderService = Depends(get_order_service),
+                        user: User = Depends(get_current_user)):
+    """
+    Exporta todos os pedidos ativos com os seus itens, em streaming.
+
+    - `format=ndjson` (padrão): um pedido por linha, em JSON, com os itens aninhados.
+    - `format=csv`: uma linha por item, com os dados do pedido repetidos.
+
+    Os pedidos são lidos em lotes por um cursor no servidor e enviados à medida que são lidos,
+    com memória constante independente do tamanho da tabela. Acessível apenas por administradores.
+    """
+    content = await service.export_orders(user, export_format)
+    media_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    return StreamingResponse(content, media_type=media_type,
+                             headers={'Content-Disposition': f'attachment; filename=orders.{export_format}'})
 
 @router.post('/', status_code=status.HTTP_201_CREATED, response_model=ResponseOrderSchema[OrderPublicSchema])
 async def create_order(create_order_schema: CreateOrderSchema, 
-                       service: OrderService = Depends(get_order_service)):
+                       idempotency_key: Optional[str] = Header(None, max_length=255),
+                       service: OrderService = Depends(get_order_service),
+                       user: User = Depends(get_current_user)):
 
     """
     Cria um novo pedido no banco de dados.
@@ -46,13 +132,22 @@ async def create_order(create_order_schema: CreateOrderSchema,
 
     Se o pedido for criado com sucesso, retorna o pedido criado com o status HTTP 201.
     Se o pedido n o for criado, retorna um erro HTTP 400 com a mensagem 'Erro ao criar o pedido.'.
+
+    Com o cabeçalho `Idempotency-Key`, novas tentativas com a mesma chave recebem a resposta
+    original (com `Idempotent-Replayed: true`) sem criar outro pedido.
     """
-    order = service.create_order(create_order_schema)
-    return ResponseOrderSchema(message='Pedido criado com sucesso.', data=order)
+    async def create():
+        order = await service.create_order(create_order_schema)
+        return model_response(ResponseOrderSchema[OrderPublicSchema](message='Pedido criado com sucesso.', data=order),
+                              status_code=status.HTTP_201_CREATED)
+
+    return await idempotency_store.run(idempotency_key, user.id, 'POST /api/v1/orders/',
+                                       create_order_schema.model_dump(mode='json'), create)
 
 @router.get('/{id_order}', status_code=status.HTTP_200_OK, response_model=ResponseOrderSchema[OrderPublicSchema])
-async def get_order(id_order : int, service: OrderService = Depends(get_order_service),
-                       user: User = Depends(get_current_user)):
+async def get_order(id_order : int, if_none_match: Optional[str] = Header(None),
+                    service: OrderService = Depends(get_order_service),
+                    user: User = Depends(get_current_user)):
 
     """
     Recupera um pedido do banco de dados.
@@ -62,12 +157,22 @@ async def get_order(id_order : int, service: OrderService = Depends(get_order_se
     Se o pedido existir e o usuário tiver permiss o, retorna o pedido.
     Se o pedido n o existir, retorna um erro HTTP 404 com a mensagem 'Order not found'.
     Se o usuário n o tiver permiss o, retorna um erro HTTP 401 com a mensagem 'Unauthorized'.
+    Se o cabeçalho If-None-Match corresponder ao ETag atual do pedido, retorna 304 consultando apenas a versão do pedido.
     """
-    order = service.get_order(id_order, user)
-    return ResponseOrderSchema(message='Order found', data=order)
+    if if_none_match:
+        etag = await service.get_order_etag(id_order, user)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    order = await service.get_order(id_order, user)
+    return model_response(
+        ResponseOrderSchema[OrderPublicSchema](message='Order found', data=order),
+        headers={'ETag': service.order_etag(order)},
+    )
 
 @router.post('/{id_order}/cancel', status_code=status.HTTP_200_OK, response_model=ResponseOrderSchema[OrderPublicSchema])
-async def cancel_order(id_order : int, service: OrderService = Depends(get_order_service),
+async def cancel_order(id_order : int, if_match: Optional[str] = Header(None),
+                       service: OrderService = Depends(get_order_service),
                        user: User = Depends(get_current_user)):
     """
     Cancela um pedido no banco de dados.
@@ -78,6 +183,10 @@ async def cancel_order(id_order : int, service: OrderService = Depends(get_order
 
     Caso contrário, lança um erro HTTP 404 com a mensagem 'Order not found' ou um erro HTTP 401 com a mensagem 'Unauthorized'.
 
+    Apenas pedidos pendentes podem ser cancelados. Se o pedido não estiver pendente, for alterado
+    por outra requisição durante o cancelamento ou não corresponder ao ETag informado em
+    `If-Match`, retorna um erro HTTP 409.
+
     Parameters
     ----------
     id_order : int
@@ -92,11 +201,12 @@ async def cancel_order(id_order : int, service: OrderService = Depends(get_order
     HTTPException
         Se o pedido não existir ou o usuário não tiver permissão para cancelá-lo.
     """
-    order = service.cancel_order(id_order, user)
+    order = await service.cancel_order(id_order, user, if_match)
     return ResponseOrderSchema(message='Order canceled', data=order)
 
 @router.post('/{id_order}/finish', status_code=status.HTTP_200_OK, response_model=ResponseOrderSchema[OrderPublicSchema])
-async def finish_order(id_order : int, service: OrderService = Depends(get_order_service),
+async def finish_order(id_order : int, if_match: Optional[str] = Header(None),
+                       service: OrderService = Depends(get_order_service),
                        user: User = Depends(get_current_user)):
     """
     Finaliza um pedido no banco de dados.
@@ -107,6 +217,10 @@ async def finish_order(id_order : int, service: OrderService = Depends(get_order
 
     Caso contrário, lança um erro HTTP 404 com a mensagem 'Order not found' ou um erro HTTP 401 com a mensagem 'Unauthorized'.
 
+    Apenas pedidos pendentes podem ser finalizados. Se o pedido não estiver pendente, for alterado
+    por outra requisição durante a finalização ou não corresponder ao ETag informado em
+    `If-Match`, retorna um erro HTTP 409.
+
     Parameters
     ----------
     id_order : int
@@ -121,5 +235,25 @@ async def finish_order(id_order : int, service: OrderService = Depends(get_order
     HTTPException
         Se o pedido não existir ou o usuário não tiver permissão para finalizá-lo.
     """
-    order = service.finish_order(id_order, user)
-    return ResponseOrderSchema(message='Order finished', data=order)
\ No newline at end of file
+    order = await service.finish_order(id_order, user, if_match)
+    return ResponseOrderSchema(message='Order finished', data=order)
+
+@router.post('/{id_order}/items:batch', status_code=status.HTTP_201_CREATED, 
+             response_model=ResponseOrderItemsSchema[List[OrderItemsPublicSchema]])
+async def create_order_items_batch(id_order: int, 
+                                   create_order_items_schema: List[CreateOrderItemsSchema] = Body(..., min_length=1, max_length=100),
+                                   service: OrderItemsService = Depends(get_order_items_service),
+                                   user: User = Depends(get_current_user)):
+    """
+    Cria vários itens de um pedido em uma única requisição.
+
+    Recebe a lista de itens (de 1 a 100) do pedido informado, insere todos em lote e atualiza
+    o preço do pedido uma única vez, em uma única transação.
+
+    Se os itens forem criados com sucesso, retorna os itens criados com o status HTTP 201.
+    Se algum item informar um pedido diferente de `id_order`, retorna um erro HTTP 400.
+    Se o pedido não existir, retorna um erro HTTP 404 com a mensagem 'Order not found'.
+    Se o usuário não tiver permissão, retorna um erro HTTP 401 com a mensagem 'Unauthorized'.
+    """
+    order_items = await service.create_order_items_batch(id_order, create_order_items_schema, user)
+    return ResponseOrderItemsSchema(message='Itens do pedido criados com sucesso.', data=order_items)
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Generic, TypeVar, List
 
-from api.endpoints.order_items.schemas import OrderItemsPublicSchema
+from api.endpoints.order_items.schemas import CreateOrderItemsNestedSchema, OrderItemsPublicSchema
 
 # T é um tipo genérico que será substituído por outro schema (ex: OrderPublicSchema)
 T = TypeVar("T")
@@ -9,10 +9,12 @@ T = TypeVar("T")
 class ResponseOrderSchema(BaseModel, Generic[T]):
     message: str
     data: Optional[T] = None # Pode ser um objeto, uma lista, ou None
+    next_cursor: Optional[str] = None # Cursor da próxima página nas listagens paginadas
 
 
 class CreateOrderSchema(BaseModel):
     user: int
+    items: List[CreateOrderItemsNestedSchema] = Field(default_factory=list, max_length=100) # Itens opcionais criados junto com o pedido
 
     class Config:
         from_attributes = True
@@ -23,6 +25,7 @@ class OrderPublicSchema(BaseModel):
     status: str
     price: float
     active: bool
+    version: int
     items: List[OrderItemsPublicSchema]
 
     class Config:
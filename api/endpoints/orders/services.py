@@ -1,13 +1,31 @@
+import csv
+import io
+from typing import AsyncIterator, Optional
+
+import orjson
 from fastapi import HTTPException
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
 
+from api.config.etag import etag_matches, make_etag
+from api.database.engine import SessionLocal
+from api.database.routing import use_primary
+from api.endpoints.orders.cache import OrderCache, order_cache
+from api.endpoints.orders.events import OrderEventBroker, order_events
 from api.endpoints.orders.repository import OrderRepository
 from api.endpoints.orders.schemas import CreateOrderSchema
 from api.config.emuns import UserErrorMessages, OrderErrorMessages
 from api.models.users import User
 from api.models.orders import Order
 
+# Colunas do CSV de exportação: uma linha por item, com os dados do pedido repetidos.
+EXPORT_CSV_COLUMNS = ['order_id', 'user', 'status', 'price', 'version', 'updated_at',
+                      'item_id', 'flavor', 'size', 'amount', 'unit_price']
+
 class OrderService:
-    def __init__(self, repository: OrderRepository):
+    def __init__(self, repository: OrderRepository, cache: OrderCache = order_cache,
+                 events: OrderEventBroker = order_events, session_factory: async_sessionmaker = SessionLocal):
         """
         Inicializa o serviço de pedidos.
 
@@ -15,30 +33,44 @@ class OrderService:
         ----------
         repository : OrderRepository
             O repositório de pedidos.
+        cache : OrderCache, opcional
+            O cache das listagens e dos pedidos serializados.
+        events : OrderEventBroker, opcional
+            O broker que notifica o stream de pedidos a cada alteração.
+        session_factory : async_sessionmaker, opcional
+            A fábrica das sessões usadas pela exportação, que continua depois da requisição.
         """
         self.repository = repository
+        self.cache = cache
+        self.events = events
+        self.session_factory = session_factory
 
-    def get_all_orders(self, user: User, offset: int = 0, limit: int = 10):
+    async def get_all_orders(self, user: User, offset: int = 0, limit: int = 10, after: Optional[int] = None):
         """
         Recupera todos os pedidos do banco de dados com paginação.
 
+        As páginas são servidas do cache de pedidos enquanto nenhum pedido for alterado.
+
         Parâmetros
         ----------
         user : User
             O usuário autenticado atual.
         offset : int, opcional O número de pedidos a serem pulados antes de iniciar a coleta do conjunto de resultados. Padrão é 0.
         limit : int, opcional O número máximo de pedidos a serem retornados. Padrão é 10.
+        after : int, opcional O ID do último pedido da página anterior, para paginação por cursor. Padrão é None.
 
         Retornos
         -------
         list[Order] A lista de pedidos se encontrado, caso contrário uma lista vazia.
         """
         if user.admin:
-            return self.repository.get_all_orders(offset, limit)
+            return await self.cache.get_orders('all', offset, limit, after,
+                                               lambda: self.repository.get_all_orders(offset, limit, after))
 
-        return self.repository.get_orders_by_user(user.id, offset, limit)
+        return await self.cache.get_orders(f'user:{user.id}', offset, limit, after,
+                                           lambda: self.repository.get_orders_by_user(user.id, offset, limit, after))
 
-    def get_order(self, id_order: int, user: User):
+    async def get_order(self, id_order: int, user: User):
         """
         Recupera um pedido pelo seu ID do banco de dados.
 
@@ -64,34 +96,148 @@ class OrderService:
             Um erro HTTP 401 com a mensagem 'Unauthorized' se o usuário não tiver permissão.
         
         """
-        order = self.repository.get_order_by_id(id_order, user.id)
+        order = await self.cache.get_order(id_order, lambda: self.repository.get_order_by_id(id_order))
         if not order:
             raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
         if order.user != user.id and not user.admin:
             raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
         return order
 
-    def create_order(self, data: CreateOrderSchema):
+    async def get_order_etag(self, id_order: int, user: User) -> str:
+        """
+        Calcula o ETag de um pedido consultando apenas a sua versão, sem carregar os itens.
+
+        Aplica as mesmas verificações de `get_order`: 404 se o pedido não existir e
+        401 se o usuário não tiver permissão.
+        """
+        row = await self.repository.get_order_version(id_order)
+        if not row:
+            raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
+        if row.user != user.id and not user.admin:
+            raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
+        return make_etag('order', id_order, row.version)
+
+    async def get_orders_etag(self, user: User, offset: int = 0, limit: int = 10, after: Optional[int] = None) -> str:
+        """
+        Calcula o ETag de uma página da listagem consultando apenas o ID e a versão dos pedidos.
+        """
+        rows = await self.repository.get_orders_versions(None if user.admin else user.id, offset, limit, after)
+        return self.orders_etag(rows)
+
+    @staticmethod
+    def order_etag(order) -> str:
+        """
+        Retorna o ETag de um pedido já carregado.
+        """
+        return make_etag('order', order.id, order.version)
+
+    @staticmethod
+    def orders_etag(orders) -> str:
+        """
+        Retorna o ETag de uma página de pedidos já carregada (ID e versão de cada pedido).
+        """
+        return make_etag('orders', *(f'{order.id}:{order.version}' for order in orders))
+
+    async def export_orders(self, user: User, export_format: str = 'ndjson') -> AsyncIterator[bytes]:
+        """
+        Exporta todos os pedidos ativos com os seus itens, em NDJSON (um pedido por linha, com os
+        itens aninhados) ou CSV (uma linha por item).
+
+        A permissão é verificada antes de qualquer linha ser enviada. A exportação usa uma sessão
+        própria, pois o conteúdo é gerado depois que a requisição (e a sua sessão) termina, e lê
+        os pedidos em lotes por um cursor no servidor, com memória constante.
+
+        Parâmetros
+        ----------
+        user : User
+            O usuário que está fazendo a requisição.
+        export_format : str
+            `ndjson` ou `csv`.
+
+        Retornos
+        -------
+        AsyncIterator[bytes]
+            Os blocos do arquivo exportado, um por lote de linhas lidas do banco.
+
+        Raises
+        ------
+        HTTPException
+            403 se o usuário não for administrador.
+        """
+        if not user.admin:
+            raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
+
+        if export_format == 'csv':
+            return self._export_csv()
+        return self._export_ndjson()
+
+    async def _export_partitions(self):
+        async with self.session_factory() as session:
+            result = await OrderRepository(session).stream_orders_with_items()
+            async for partition in result.partitions():
+                yield partition
+
+    async def _export_ndjson(self):
+        order = None
+        async for partition in self._export_partitions():
+            lines = []
+            for row in partition:
+                if order is None or order['id'] != row.id:
+                    if order is not None:
+                        lines.append(orjson.dumps(order))
+                    order = {'id': row.id, 'user': row.user, 'status': row.status, 'price': float(row.price),
+                             'version': row.version, 'updated_at': row.updated_at, 'items': []}
+                if row.item_id is not None:
+                    order['items'].append({'id': row.item_id, 'flavor': row.flavor, 'size': row.size,
+                                           'amount': row.amount, 'unit_price': float(row.unit_price)})
+            if lines:
+                yield b'\n'.join(lines) + b'\n'
+
+        if order is not None:
+            yield orjson.dumps(order) + b'\n'
+
+    async def _export_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_CSV_COLUMNS)
+
+        async for partition in self._export_partitions():
+            writer.writerows(partition)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    async def create_order(self, data: CreateOrderSchema):
         """
         Cria um novo pedido no banco de dados.
 
+        Quando o esquema traz itens, o pedido e os itens são criados em uma única transação,
+        com o preço do pedido calculado uma única vez no banco.
+
         Parâmetros
         ----------
         data : CreateOrderSchema
-            O esquema com os dados do pedido a ser criado.
+            O esquema com os dados do pedido (e, opcionalmente, dos itens) a ser criado.
 
         Retornos
         -------
         Order
             O pedido criado com o ID atualizado.
         """
+        items = [item.model_dump() for item in data.items]
         order = Order(user=data.user)
-        order_created = self.repository.create_order(order)
+        order_created = await self.repository.create_order(order, items)
         if not order_created:
             raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_CREATED)
+
+        await self.cache.invalidate()
+        self.events.publish('order.created', order_created)
         return order_created
     
-    def cancel_order(self, id_order: int, user: User):
+    async def cancel_order(self, id_order: int, user: User, if_match: Optional[str] = None):
         """
         Cancela um pedido no banco de dados.
 
@@ -101,12 +247,19 @@ class OrderService:
         Se o pedido não existir, retorna None.
         Se o usuário não tiver permiss o, retorna 'unauthorized'.
 
+        O dono do pedido e o status pendente são verificados no próprio UPDATE, sem ler o pedido
+        antes. Só quando nenhuma linha é alterada o pedido é consultado para escolher o erro.
+        Com If-Match, o UPDATE também exige a versão correspondente ao ETag informado.
+
         Parâmetros
         ----------
         id_order : int
             O ID do pedido a ser cancelado.
         user : User
             O usuário que está fazendo a requisição.
+        if_match : str, opcional
+            O cabeçalho If-Match da requisição. Se informado, o pedido só é cancelado se o
+            ETag atual corresponder a ele.
 
         Retornos
         -------
@@ -115,21 +268,23 @@ class OrderService:
         HTTPException
             Um erro HTTP 404 com a mensagem 'Order not found' se o pedido não existir.
             Um erro HTTP 401 com a mensagem 'Unauthorized' se o usuário não tiver permissão. 
+            Um erro HTTP 409 se o pedido não estiver pendente ou tiver sido alterado por outra requisição.
         """
-        order = self.repository.get_order_by_id(id_order)
-        if not order:
-            raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
-
-        if order.user != user.id and not user.admin:
-            raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
-        
-        order_created = self.repository.cancel_order(id_order)
+        use_primary(self.repository.session)
+        version = await self._if_match_version(id_order, user, if_match)
+        try:
+            order_created = await self.repository.cancel_order(id_order, None if user.admin else user.id, version)
+        except StaleDataError:
+            await self._check_transition(id_order, user)
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
         if not order_created:
             raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_CANCELLED)
-        
+
+        await self.cache.invalidate()
+        self.events.publish('order.cancelled', order_created)
         return order_created
     
-    def finish_order(self, id_order: int, user: User):
+    async def finish_order(self, id_order: int, user: User, if_match: Optional[str] = None):
         """
         Finaliza um pedido no banco de dados.
 
@@ -139,12 +294,19 @@ class OrderService:
         Se o pedido não existir, retorna None.
         Se o usuário não tiver permiss o, retorna 'unauthorized'.
 
+        O status pendente é verificado no próprio UPDATE, sem ler o pedido antes. Só quando nenhuma
+        linha é alterada o pedido é consultado para escolher o erro. Com If-Match, o UPDATE também
+        exige a versão correspondente ao ETag informado.
+
         Parâmetros
         ----------
         id_order : int
             O ID do pedido a ser finalizado.
         user : User
             O usuário que está fazendo a requisição.
+        if_match : str, opcional
+            O cabeçalho If-Match da requisição. Se informado, o pedido só é finalizado se o
+            ETag atual corresponder a ele.
 
         Retornos
         -------
@@ -153,16 +315,52 @@ class OrderService:
         HTTPException
             Um erro HTTP 404 com a mensagem 'Order not found' se o pedido não existir.
             Um erro HTTP 401 com a mensagem 'Unauthorized' se o usuário não tiver permissão. 
+            Um erro HTTP 409 se o pedido não estiver pendente ou tiver sido alterado por outra requisição.
         """
-        order = self.repository.get_order_by_id(id_order)
-        if not order:
-            raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
-
+        use_primary(self.repository.session)
         if not user.admin:
-            raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
-        
-        order_created = self.repository.finish_order(id_order)
+            # Recusa sempre: 404 se o pedido não existir, 401 caso contrário.
+            await self._check_transition(id_order, user, admin_only=True)
+
+        version = await self._if_match_version(id_order, user, if_match)
+        try:
+            order_created = await self.repository.finish_order(id_order, version)
+        except StaleDataError:
+            await self._check_transition(id_order, user)
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
         if not order_created:
             raise HTTPException(status_code=500, detail=OrderErrorMessages.ORDER_NOT_CANCELLED)
-        
+
+        await self.cache.invalidate()
+        self.events.publish('order.finished', order_created)
         return order_created
+
+    async def _check_transition(self, id_order: int, user: User, admin_only: bool = False) -> Row:
+        """
+        Consulta apenas o dono, o status e a versão do pedido e recusa a mudança de status com
+        404 se o pedido não existir, 401 se o usuário não tiver permissão (com `admin_only`, apenas
+        administradores têm) e 409 se o pedido não estiver pendente.
+
+        Retorna a linha consultada quando a mudança é permitida.
+        """
+        row = await self.repository.get_order_version(id_order)
+        if not row:
+            raise HTTPException(status_code=404, detail=OrderErrorMessages.ORDER_NOT_FOUND)
+        if not user.admin and (admin_only or row.user != user.id):
+            raise HTTPException(status_code=401, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
+        if row.status != 'PENDENTE':
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_NOT_PENDING)
+        return row
+
+    async def _if_match_version(self, id_order: int, user: User, if_match: Optional[str]) -> Optional[int]:
+        """
+        Retorna a versão exigida no UPDATE da mudança de status: None sem If-Match; com If-Match,
+        a versão atual do pedido, recusando com 409 se o ETag dela não corresponder ao informado.
+        """
+        if if_match is None:
+            return None
+
+        row = await self._check_transition(id_order, user)
+        if not etag_matches(if_match, make_etag('order', id_order, row.version)):
+            raise HTTPException(status_code=409, detail=OrderErrorMessages.ORDER_CONFLICT)
+        return row.version
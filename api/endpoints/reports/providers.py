@@ -0,0 +1,17 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.session import get_session
+from api.endpoints.reports.repository import ReportRepository
+from api.endpoints.reports.services import ReportService
+
+def get_report_service(session: AsyncSession = Depends(get_session)) -> ReportService:
+    """
+    Argumentos:
+    - session (AsyncSession): A sessão assíncrona do banco de dados.
+
+    Retornos:
+    - ReportService: Uma instância de ReportService.
+    """
+    repository = ReportRepository(session)
+    return ReportService(repository)
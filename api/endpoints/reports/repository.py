@@ -0,0 +1,151 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, func, literal, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.database.routing import replica_read
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.reports import ORDER_STATUS_SHARDS, DailyItemSales, DailyOrderStatus, DailyRevenue
+
+# INSERT com suporte a upsert de cada banco suportado pela aplicação.
+UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+    'mysql': mysql.insert,
+}
+
+
+class ReportRepository:
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório de relatórios.
+
+        As tabelas de relatório são agregados diários mantidos de forma incremental, na mesma
+        transação das alterações de pedidos, e consultados sem varrer `pedidos` e `itens_pedido`.
+
+        Parâmetros
+        ----------
+        session : AsyncSession
+            A sessão assíncrona do banco de dados.
+        """
+        self.session = session
+
+    def _insert(self, model):
+        """
+        Retorna o INSERT do dialeto em uso, que suporta upsert (`ON CONFLICT DO UPDATE` no
+        SQLite e no PostgreSQL, `ON DUPLICATE KEY UPDATE` no MySQL).
+        """
+        return UPSERT_INSERTS[self.session.get_bind().dialect.name](model)
+
+    def _accumulate(self, statement, index_elements: list, columns: list[str]):
+        """
+        Completa o INSERT para que, se a chave já existir, os valores inseridos nas colunas
+        informadas sejam somados aos existentes.
+        """
+        table = statement.table
+        if self.session.get_bind().dialect.name == 'mysql':
+            return statement.on_duplicate_key_update({column: table.c[column] + statement.inserted[column] for column in columns})
+
+        return statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: table.c[column] + statement.excluded[column] for column in columns},
+        )
+
+    async def record_status_change(self, order: Order, previous_status: Optional[str] = None) -> None:
+        """
+        Move o pedido de `previous_status` (None para pedidos novos) para o seu status atual
+        na contagem diária por status. Não faz commit.
+
+        Cada pedido é contado sempre na mesma das `ORDER_STATUS_SHARDS` linhas do dia e status,
+        de forma que transações de pedidos diferentes raramente disputam a mesma linha.
+        """
+        day = order.updated_at.date()
+        shard = order.id % ORDER_STATUS_SHARDS
+        rows = [{'day': day, 'status': order.status, 'shard': shard, 'orders': 1}]
+        if previous_status is not None:
+            rows.append({'day': day, 'status': previous_status, 'shard': shard, 'orders': -1})
+
+        statement = self._insert(DailyOrderStatus).values(rows)
+        await self.session.execute(self._accumulate(
+            statement, [DailyOrderStatus.day, DailyOrderStatus.status, DailyOrderStatus.shard], ['orders'],
+        ))
+
+    async def record_order_finished(self, order: Order) -> None:
+        """
+        Soma o pedido finalizado à receita do dia e os seus itens ativos às vendas
+        por sabor e tamanho do dia. Não faz commit.
+        """
+        day = order.updated_at.date()
+
+        statement = self._insert(DailyRevenue).values(day=day, orders=1, revenue=order.price)
+        await self.session.execute(self._accumulate(statement, [DailyRevenue.day], ['orders', 'revenue']))
+
+        items = (
+            select(literal(day, Date), OrderItem.flavor, OrderItem.size,
+                   func.sum(OrderItem.amount), func.sum(OrderItem.unit_price * OrderItem.amount))
+            .where(OrderItem.order == order.id, OrderItem.active == True)
+            .group_by(OrderItem.flavor, OrderItem.size)
+        )
+        statement = self._insert(DailyItemSales).from_select(['day', 'flavor', 'size', 'quantity', 'revenue'], items)
+        await self.session.execute(self._accumulate(
+            statement, [DailyItemSales.day, DailyItemSales.flavor, DailyItemSales.size], ['quantity', 'revenue'],
+        ))
+
+    @replica_read
+    async def get_daily_revenue(self, start: Optional[date] = None, end: Optional[date] = None) -> list[DailyRevenue]:
+        """
+            Recupera a receita por dia no período informado (datas inclusivas), em ordem cronológica.
+        """
+        statement = select(DailyRevenue).order_by(DailyRevenue.day)
+        if start is not None:
+            statement = statement.where(DailyRevenue.day >= start)
+        if end is not None:
+            statement = statement.where(DailyRevenue.day <= end)
+
+        try:
+            return list(await self.session.scalars(statement))
+        except SQLAlchemyError:
+            return []
+
+    @replica_read
+    async def get_top_items(self, group_by: str, start: Optional[date] = None, end: Optional[date] = None,
+                            limit: int = 10) -> list:
+        """
+            Recupera os sabores (`group_by='flavor'`) ou tamanhos (`group_by='size'`) mais vendidos
+            no período informado, pela quantidade vendida.
+        """
+        column = getattr(DailyItemSales, group_by)
+        quantity = func.sum(DailyItemSales.quantity).label('quantity')
+        revenue = func.sum(DailyItemSales.revenue).label('revenue')
+        statement = select(column.label('name'), quantity, revenue).group_by(column).order_by(quantity.desc()).limit(limit)
+        if start is not None:
+            statement = statement.where(DailyItemSales.day >= start)
+        if end is not None:
+            statement = statement.where(DailyItemSales.day <= end)
+
+        try:
+            return list(await self.session.execute(statement))
+        except SQLAlchemyError:
+            return []
+
+    @replica_read
+    async def get_orders_by_status(self) -> list:
+        """
+            Recupera a quantidade atual de pedidos em cada status, somando os saldos diários
+            (O(dias), sem varrer `pedidos`). Status sem pedidos não são listados.
+        """
+        orders = func.sum(DailyOrderStatus.orders)
+        statement = (
+            select(DailyOrderStatus.status.label('status'), orders.label('orders'))
+            .group_by(DailyOrderStatus.status)
+            .having(orders > 0)
+            .order_by(DailyOrderStatus.status)
+        )
+        try:
+            return list(await self.session.execute(statement))
+        except SQLAlchemyError:
+            return []
@@ -0,0 +1,67 @@
+from datetime import date
+from fastapi import APIRouter, Depends, Query, status
+from typing import List, Optional
+
+from api.config.responses import model_response
+from api.endpoints.auth.providers import get_current_user
+from api.endpoints.reports.providers import get_report_service
+from api.endpoints.reports.schemas import (DailyRevenueSchema, OrderStatusCountSchema, ResponseReportSchema,
+                                           TopItemSchema)
+from api.endpoints.reports.services import ReportService
+from api.models.users import User
+
+
+router = APIRouter(
+    prefix='/api/v1/reports',
+    tags=['reports'],
+    dependencies=[Depends(get_current_user)]
+)
+
+@router.get('/revenue', status_code=status.HTTP_200_OK, response_model=ResponseReportSchema[List[DailyRevenueSchema]])
+async def get_daily_revenue(start: Optional[date] = None, end: Optional[date] = None,
+                            service: ReportService = Depends(get_report_service),
+                            user: User = Depends(get_current_user)):
+    """
+    Retorna a quantidade de pedidos finalizados e a receita por dia, entre `start` e `end` (inclusivos).
+
+    Os valores vêm de agregados atualizados a cada pedido finalizado, sem varrer os pedidos.
+    Acessível apenas por administradores.
+    """
+    revenue = await service.get_daily_revenue(user, start, end)
+    return model_response(ResponseReportSchema[List[DailyRevenueSchema]](message='Revenue found', data=revenue))
+
+@router.get('/top-flavors', status_code=status.HTTP_200_OK, response_model=ResponseReportSchema[List[TopItemSchema]])
+async def get_top_flavors(start: Optional[date] = None, end: Optional[date] = None,
+                          limit: int = Query(10, ge=1, le=100),
+                          service: ReportService = Depends(get_report_service),
+                          user: User = Depends(get_current_user)):
+    """
+    Retorna os sabores mais vendidos (pela quantidade) nos pedidos finalizados entre `start` e `end`.
+    Acessível apenas por administradores.
+    """
+    flavors = await service.get_top_items(user, 'flavor', start, end, limit)
+    return model_response(ResponseReportSchema[List[TopItemSchema]](message='Flavors found', data=flavors))
+
+@router.get('/top-sizes', status_code=status.HTTP_200_OK, response_model=ResponseReportSchema[List[TopItemSchema]])
+async def get_top_sizes(start: Optional[date] = None, end: Optional[date] = None,
+                        limit: int = Query(10, ge=1, le=100),
+                        service: ReportService = Depends(get_report_service),
+                        user: User = Depends(get_current_user)):
+    """
+    Retorna os tamanhos mais vendidos (pela quantidade) nos pedidos finalizados entre `start` e `end`.
+    Acessível apenas por administradores.
+    """
+    sizes = await service.get_top_items(user, 'size', start, end, limit)
+    return model_response(ResponseReportSchema[List[TopItemSchema]](message='Sizes found', data=sizes))
+
+@router.get('/orders-by-status', status_code=status.HTTP_200_OK,
+            response_model=ResponseReportSchema[List[OrderStatusCountSchema]])
+async def get_orders_by_status(service: ReportService = Depends(get_report_service),
+                               user: User = Depends(get_current_user)):
+    """
+    Retorna a quantidade atual de pedidos em cada status (PENDENTE, CANCELADO, FINALIZADO).
+    Os valores vêm da soma das contagens diárias por status, sem varrer os pedidos.
+    Acessível apenas por administradores.
+    """
+    statuses = await service.get_orders_by_status(user)
+    return model_response(ResponseReportSchema[List[OrderStatusCountSchema]](message='Orders found', data=statuses))
@@ -0,0 +1,33 @@
+from datetime import date
+from pydantic import BaseModel
+from typing import Optional, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseReportSchema(BaseModel, Generic[T]):
+    message: str
+    data: Optional[T] = None
+
+class DailyRevenueSchema(BaseModel):
+    day: date
+    orders: int
+    revenue: float
+
+    class Config:
+        from_attributes = True
+
+class TopItemSchema(BaseModel):
+    name: str
+    quantity: int
+    revenue: float
+
+    class Config:
+        from_attributes = True
+
+class OrderStatusCountSchema(BaseModel):
+    status: str
+    orders: int
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,60 @@
+from datetime import date
+from fastapi import HTTPException
+from typing import Optional
+
+from api.config.emuns import UserErrorMessages
+from api.endpoints.reports.repository import ReportRepository
+from api.models.users import User
+
+
+class ReportService:
+    def __init__(self, repository: ReportRepository):
+        self.repository = repository
+
+    async def get_daily_revenue(self, user: User, start: Optional[date] = None, end: Optional[date] = None):
+        """
+        Retorna a quantidade de pedidos finalizados e a receita por dia no período informado.
+
+        Args:
+            user (User): Usuário autenticado realizando a operação.
+            start (date, optional): Primeiro dia do período (inclusivo).
+            end (date, optional): Último dia do período (inclusivo).
+
+        Raises:
+            HTTPException: 403 se o usuário não for administrador.
+        """
+        self._check_admin(user)
+        return await self.repository.get_daily_revenue(start, end)
+
+    async def get_top_items(self, user: User, group_by: str, start: Optional[date] = None,
+                            end: Optional[date] = None, limit: int = 10):
+        """
+        Retorna os sabores ou tamanhos mais vendidos (pela quantidade) nos pedidos finalizados do período.
+
+        Args:
+            user (User): Usuário autenticado realizando a operação.
+            group_by (str): `flavor` para sabores ou `size` para tamanhos.
+            start (date, optional): Primeiro dia do período (inclusivo).
+            end (date, optional): Último dia do período (inclusivo).
+            limit (int, optional): Quantidade máxima de resultados. Default é 10.
+
+        Raises:
+            HTTPException: 403 se o usuário não for administrador.
+        """
+        self._check_admin(user)
+        return await self.repository.get_top_items(group_by, start, end, limit)
+
+    async def get_orders_by_status(self, user: User):
+        """
+        Retorna a quantidade atual de pedidos em cada status.
+
+        Raises:
+            HTTPException: 403 se o usuário não for administrador.
+        """
+        self._check_admin(user)
+        return await self.repository.get_orders_by_status()
+
+    @staticmethod
+    def _check_admin(user: User):
+        if not user.admin:
+            raise HTTPException(status_code=403, detail=UserErrorMessages.USER_NOT_AUTHORIZED)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+from api.database.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Resposta gravada de uma requisição de criação enviada com o cabeçalho `Idempotency-Key`.
+
+    A chave é o hash do usuário, do endpoint e da chave informada pelo cliente; `status_code`
+    e `response` ficam vazios enquanto a primeira requisição ainda está em andamento, reservada
+    até `locked_until`.
+    """
+    __tablename__ = 'chaves_idempotencia'
+
+    key = Column('key', String(64), primary_key=True)
+    request_hash = Column('request_hash', String(64), nullable=False)
+    status_code = Column('status_code', Integer)
+    response = Column('response', LargeBinary)
+    created_at = Column('created_at', DateTime(timezone=True), nullable=False, index=True)
+    locked_until = Column('locked_until', DateTime(timezone=True))
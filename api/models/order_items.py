@@ -1,14 +1,19 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Index
 from api.database.base import Base
+from api.database.types import Money
 
 class OrderItem(Base):
     __tablename__ = 'itens_pedido'
+    __table_args__ = (
+        Index('ix_itens_pedido_order_active', 'order', 'active'),
+        Index('ix_itens_pedido_active_id', 'active', 'id'),
+    )
 
     id = Column('id', Integer, primary_key=True, autoincrement=True)
     amount = Column('amount', Integer)
     flavor = Column('flavor', String)
     size = Column('size', String)
-    unit_price = Column('unit_price', Float)
+    unit_price = Column('unit_price', Money)
     order = Column('order', ForeignKey('pedidos.id'))
     active = Column('active', Boolean)
 
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Index, func, select
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils.types import ChoiceType
 from api.database.base import Base
+from api.database.types import Money
+from api.models.order_items import OrderItem
 
 class Order(Base):
     __tablename__ = 'pedidos'
+    __table_args__ = (
+        Index('ix_pedidos_user_active_id', 'user', 'active', 'id'),
+        Index('ix_pedidos_active_id', 'active', 'id'),
+    )
 
     # ORDER_STATUS = (
     #     ('PENDENTE', 'PENDENTE'),
@@ -15,15 +23,41 @@ class Order(Base):
     id = Column('id', Integer, primary_key=True, autoincrement=True)
     user = Column('user', ForeignKey('usuarios.id'))
     status = Column('status', String)
-    price = Column('price', Float)
+    price = Column('price', Money)
     active = Column('active', Boolean)
-    items = relationship('OrderItem', cascade='all, delete')
+    version = Column('version', Integer, nullable=False, default=1)
+    updated_at = Column('updated_at', DateTime(timezone=True))
+    items = relationship('OrderItem', cascade='all, delete', lazy='selectin')
+
+    # Controle de concorrência otimista: todo UPDATE do pedido pela ORM incrementa a versão
+    # e só é aplicado se a versão no banco ainda for a lida (senão, StaleDataError).
+    __mapper_args__ = {'version_id_col': version}
     
     def __init__(self, user, status='PENDENTE', price=0, active=True):
         self.user = user
         self.status = status
         self.price = price
         self.active = active
+        self.version = 1
+        self.updated_at = datetime.now(timezone.utc)
+
+    @classmethod
+    def items_total(cls):
+        """
+        Subconsulta com a soma de `unit_price * amount` dos itens ativos do pedido,
+        correlacionada à tabela de pedidos. Usada para recalcular o preço no próprio banco,
+        sem carregar os itens.
+        """
+        return (
+            select(func.coalesce(func.sum(OrderItem.unit_price * OrderItem.amount), 0))
+            .where(OrderItem.order == cls.id, OrderItem.active == True)
+            .scalar_subquery()
+        )
 
-    def update_order_price(self):
-        self.price = sum(item.unit_price * item.amount for item in self.items if item.active)
\ No newline at end of file
+    def touch(self):
+        """
+        Registra uma alteração no pedido: atualiza a data da última alteração, o que faz a ORM
+        incrementar a versão (usada no ETag das respostas) no próximo flush, condicionada à
+        versão lida. Deve ser chamado a cada alteração no pedido ou nos seus itens.
+        """
+        self.updated_at = datetime.now(timezone.utc)
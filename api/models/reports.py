@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Date, Integer, String
+from api.database.base import Base
+from api.database.types import Money
+
+
+class DailyRevenue(Base):
+    """
+    Receita dos pedidos finalizados por dia, atualizada a cada pedido finalizado.
+    """
+    __tablename__ = 'relatorio_receita_diaria'
+
+    day = Column('day', Date, primary_key=True)
+    orders = Column('orders', Integer, nullable=False, default=0)
+    revenue = Column('revenue', Money, nullable=False, default=0)
+
+
+class DailyItemSales(Base):
+    """
+    Quantidade vendida e receita por dia, sabor e tamanho dos itens de pedidos finalizados.
+    """
+    __tablename__ = 'relatorio_vendas_itens_diaria'
+
+    day = Column('day', Date, primary_key=True)
+    flavor = Column('flavor', String, primary_key=True)
+    size = Column('size', String, primary_key=True)
+    quantity = Column('quantity', Integer, nullable=False, default=0)
+    revenue = Column('revenue', Money, nullable=False, default=0)
+
+
+
+# Linhas em que a contagem de cada dia e status é dividida (pelo ID do pedido), para que
+# pedidos diferentes alterados ao mesmo tempo não disputem a mesma linha.
+ORDER_STATUS_SHARDS = 16
+
+
+class DailyOrderStatus(Base):
+    """
+    Saldo diário de pedidos em cada status: +1 para o status em que um pedido entrou no dia
+    e -1 para o status de onde saiu. A soma de todos os dias é a quantidade atual de pedidos
+    em cada status.
+    """
+    __tablename__ = 'relatorio_pedidos_por_status_diaria'
+
+    day = Column('day', Date, primary_key=True)
+    status = Column('status', String, primary_key=True)
+    shard = Column('shard', Integer, primary_key=True)
+    orders = Column('orders', Integer, nullable=False, default=0)
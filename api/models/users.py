@@ -6,7 +6,7 @@ class User(Base):
 
     id = Column('id', Integer, primary_key=True, autoincrement=True)
     name = Column('name', String)
-    email = Column('email', String, nullable=False)
+    email = Column('email', String, nullable=False, unique=True, index=True)
     password = Column('password', String)
     active = Column('active', Boolean)
     admin = Column('admin', Boolean, default=False)
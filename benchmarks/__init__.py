@@ -0,0 +1,23 @@
+"""
+Benchmarks e teste de carga da API de pedidos.
+
+Os scripts usam sempre um banco próprio (`BENCHMARK_DATABASE_URL`, por padrão
+`sqlite:///benchmark.db`), nunca o banco configurado em `DATABASE_URL`:
+
+    python -m benchmarks.seed            # popula o banco (100 mil pedidos, 1 milhão de itens)
+    python -m benchmarks.micro           # micro-benchmarks de token, preço e serialização
+    python -m benchmarks.load            # teste de carga contra um uvicorn local
+
+`micro` e `load` aceitam `--save <arquivo.json>` para guardar os resultados e
+`--baseline <arquivo.json>` para falhar (código de saída 1) em caso de regressão.
+"""
+import os
+
+# Precisa acontecer antes de qualquer import de `api`, que cria o engine na importação.
+os.environ['DATABASE_URL'] = os.getenv('BENCHMARK_DATABASE_URL', 'sqlite:///benchmark.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+# Senha de todos os usuários criados pelo seed.
+BENCHMARK_PASSWORD = 'benchmark'
@@ -0,0 +1,117 @@
+"""
+Teste de carga da API de pedidos: sobe a aplicação em um uvicorn no próprio processo,
+contra o banco populado por `benchmarks.seed`, e dispara requisições concorrentes com
+httpx em cada endpoint, reportando p50/p95/p99 e requisições por segundo.
+
+    python -m benchmarks.seed
+    python -m benchmarks.load --concurrency 32 --duration 10 --save load.json
+    python -m benchmarks.load --baseline load.json
+
+Respostas com status 4xx/5xx contam como erros do endpoint.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Callable
+
+import httpx
+import uvicorn
+from sqlalchemy import func, select
+
+from benchmarks import BENCHMARK_PASSWORD
+from benchmarks.seed import ADMIN_EMAIL, FLAVORS, SIZES, customer_email
+from benchmarks.stats import check_baseline, print_report, save_results, summarize
+from api.database.engine import engine
+from api.models.orders import Order
+from main import app
+
+
+async def login(client: httpx.AsyncClient, email: str) -> dict:
+    response = await client.post('/api/v1/auth/login', json={'email': email, 'password': BENCHMARK_PASSWORD})
+    response.raise_for_status()
+    return {'Authorization': f'Bearer {response.json()["access_token"]}'}
+
+
+async def run_scenario(client: httpx.AsyncClient, build_request: Callable[[random.Random], dict],
+                       concurrency: int, duration: float) -> dict:
+    samples, errors = [], 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(rng: random.Random):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.request(**build_request(rng))
+            samples.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(number)) for number in range(concurrency)))
+    return summarize(samples, elapsed=time.perf_counter() - started, errors=errors)
+
+
+async def run(host: str, port: int, concurrency: int, duration: float) -> dict:
+    async with engine.connect() as conn:
+        last_order = await conn.scalar(select(func.max(Order.id)))
+    if not last_order:
+        sys.exit('O banco de benchmark está vazio; rode `python -m benchmarks.seed` antes.')
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level='warning'))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f'http://{host}:{port}', limits=limits, timeout=30) as client:
+        admin = await login(client, ADMIN_EMAIL)
+        customer = await login(client, customer_email(1))
+
+        scenarios = {
+            'GET /api/v1/orders/ (admin)': lambda rng: {
+                'method': 'GET', 'url': '/api/v1/orders/', 'params': {'limit': 50}, 'headers': admin},
+            'GET /api/v1/orders/ (cliente)': lambda rng: {
+                'method': 'GET', 'url': '/api/v1/orders/', 'params': {'limit': 50}, 'headers': customer},
+            'GET /api/v1/orders/{id_order}': lambda rng: {
+                'method': 'GET', 'url': f'/api/v1/orders/{rng.randint(1, last_order)}', 'headers': admin},
+            'POST /api/v1/orders/': lambda rng: {
+                'method': 'POST', 'url': '/api/v1/orders/', 'headers': customer, 'json': {'user': 2, 'items': [
+                    {'amount': rng.randint(1, 3), 'flavor': rng.choice(FLAVORS), 'size': size, 'unit_price': float(SIZES[size])}
+                    for size in rng.choices(list(SIZES), k=3)
+                ]}},
+            'GET /api/v1/reports/revenue': lambda rng: {
+                'method': 'GET', 'url': '/api/v1/reports/revenue', 'headers': admin},
+        }
+
+        results = {}
+        for name, build_request in scenarios.items():
+            print(f'{name}: {concurrency} conexões por {duration:g}s...', flush=True)
+            results[name] = await run_scenario(client, build_request, concurrency, duration)
+
+    server.should_exit = True
+    await serving
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de carga da API de pedidos.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10, help='Duração de cada cenário, em segundos.')
+    parser.add_argument('--save', help='Grava os resultados neste arquivo JSON.')
+    parser.add_argument('--baseline', help='Compara com os resultados gravados neste arquivo JSON.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Piora máxima aceita (0.2 = 20%%).')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.host, args.port, args.concurrency, args.duration))
+    print_report('Teste de carga', results)
+    if args.save:
+        save_results(args.save, results)
+    sys.exit(check_baseline(results, args.baseline, args.tolerance))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Micro-benchmarks dos caminhos mais quentes da API, isolados do HTTP: criação do serviço
+de autenticação a cada requisição, criação e verificação de tokens, recálculo do preço do
+pedido e serialização das listas (pelo `response_model` padrão do FastAPI, por
+`model_response` e a partir do cache).
+
+    python -m benchmarks.micro --rounds 2000 --save micro.json
+    python -m benchmarks.micro --baseline micro.json
+
+Usa um banco SQLite em memória próprio, independente do banco populado pelo seed.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.stats import check_baseline, print_report, save_results, summarize
+from api.config.responses import model_response
+from api.database.base import Base
+from api.config.settings import get_settings
+from api.endpoints.auth.cache import PrincipalCache
+from api.endpoints.auth.providers import get_auth_service
+from api.endpoints.auth.repository import AuthRepository
+from api.endpoints.auth.services import AuthService
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.schemas import OrderPublicSchema, ResponseOrderSchema
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.users import User
+
+PAGE_SIZE = 1000
+
+
+async def measure(operation: Callable[[], Awaitable], rounds: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        await operation()
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def build_orders_page() -> List[Order]:
+    orders = []
+    for order_id in range(1, PAGE_SIZE + 1):
+        order = Order(user=1)
+        order.id = order_id
+        order.items = [OrderItem(amount=1, flavor='Calabresa', size='G', unit_price=50, order=order_id)
+                       for _ in range(3)]
+        for number, item in enumerate(order.items):
+            item.id = order_id * 3 + number
+        orders.append(order)
+    return orders
+
+
+async def run(rounds: int, warmup: int) -> dict:
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    results = {}
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add(User(name='Benchmark', email='benchmark@email.com', password='x'))
+        await session.commit()
+
+        auth = AuthService(AuthRepository(session), cache=PrincipalCache())
+        uncached_auth = AuthService(AuthRepository(session), cache=PrincipalCache(max_size=0))
+        token = await auth.create_token(1)
+
+        settings = get_settings()
+
+        async def build_auth_service():
+            return get_auth_service(session=session, settings=settings)
+
+        results['auth.get_auth_service'] = await measure(build_auth_service, rounds, warmup)
+        results['auth.create_token'] = await measure(lambda: auth.create_token(1), rounds, warmup)
+        results['auth.verify_token (cache hit)'] = await measure(lambda: auth.verify_token(token), rounds, warmup)
+        results['auth.verify_token (cache miss)'] = await measure(lambda: uncached_auth.verify_token(token), rounds, warmup)
+
+        orders = OrderRepository(session)
+        order = await orders.create_order(Order(user=1), [
+            {'amount': 1, 'flavor': 'Calabresa', 'size': 'G', 'unit_price': 49.9} for _ in range(10)
+        ])
+        results['orders.update_order_price (10 items)'] = await measure(
+            lambda: orders.update_order_price(order), rounds, warmup)
+
+    await engine.dispose()
+
+    page = build_orders_page()
+    cached_page = [OrderPublicSchema.model_validate(order) for order in page]
+    field = create_model_field(name='response', type_=ResponseOrderSchema[List[OrderPublicSchema]], mode='serialization')
+
+    async def serialize_page_response_model():
+        content = await serialize_response(
+            field=field, response_content=ResponseOrderSchema(message='Orders found', data=page), is_coroutine=True,
+        )
+        return JSONResponse(content).body
+
+    async def serialize_page():
+        return model_response(ResponseOrderSchema[List[OrderPublicSchema]](message='Orders found', data=page)).body
+
+    async def serialize_cached_page():
+        return model_response(ResponseOrderSchema[List[OrderPublicSchema]](message='Orders found', data=cached_page)).body
+
+    serialization_rounds = max(rounds // 100, 10)
+    for name, operation in ((f'serialization.response_model ({PAGE_SIZE})', serialize_page_response_model),
+                            (f'serialization.orders_page ({PAGE_SIZE})', serialize_page),
+                            (f'serialization.cached_page ({PAGE_SIZE})', serialize_cached_page)):
+        results[name] = await measure(operation, serialization_rounds, min(warmup, serialization_rounds))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks da API de pedidos.')
+    parser.add_argument('--rounds', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=100)
+    parser.add_argument('--save', help='Grava os resultados neste arquivo JSON.')
+    parser.add_argument('--baseline', help='Compara com os resultados gravados neste arquivo JSON.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Piora máxima aceita (0.2 = 20%%).')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.rounds, args.warmup))
+    print_report('Micro-benchmarks', results)
+    if args.save:
+        save_results(args.save, results)
+    sys.exit(check_baseline(results, args.baseline, args.tolerance))
+
+
+if __name__ == '__main__':
+    main()
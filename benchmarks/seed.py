@@ -0,0 +1,139 @@
+"""
+Popula o banco de benchmark com dados realistas: usuários, pedidos em todos os status,
+itens com sabores e tamanhos variados e os relatórios consolidados correspondentes.
+
+    python -m benchmarks.seed --orders 100000 --items-per-order 10
+
+O banco de benchmark é recriado do zero a cada execução. Os dados são gerados a partir
+de uma semente fixa, para que execuções diferentes meçam exatamente o mesmo conjunto.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import insert, text
+
+from benchmarks import BENCHMARK_PASSWORD
+from api.database.base import Base
+from api.database.engine import engine
+from api.endpoints.auth.hashing import password_hasher
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.reports import ORDER_STATUS_SHARDS, DailyItemSales, DailyOrderStatus, DailyRevenue
+from api.models.users import User
+
+ADMIN_EMAIL = 'admin@benchmark.com'
+FLAVORS = ['Calabresa', 'Mussarela', 'Portuguesa', 'Frango com Catupiry', 'Quatro Queijos',
+           'Marguerita', 'Pepperoni', 'Napolitana', 'Bacon', 'Chocolate']
+SIZES = {'P': Decimal('29.90'), 'M': Decimal('39.90'), 'G': Decimal('49.90'), 'GG': Decimal('59.90')}
+STATUSES = ['PENDENTE', 'FINALIZADO', 'CANCELADO']
+STATUS_WEIGHTS = [2, 7, 1]
+
+# Mesmas consultas da migração que criou os relatórios, recalculando-os a partir dos pedidos.
+ROLLUPS = [
+    """
+    INSERT INTO relatorio_receita_diaria (day, orders, revenue)
+    SELECT DATE(updated_at), COUNT(*), SUM(price)
+    FROM pedidos
+    WHERE status = 'FINALIZADO' AND active
+    GROUP BY DATE(updated_at)
+    """,
+    """
+    INSERT INTO relatorio_vendas_itens_diaria (day, flavor, size, quantity, revenue)
+    SELECT DATE(p.updated_at), i.flavor, i.size, SUM(i.amount), SUM(i.unit_price * i.amount)
+    FROM itens_pedido i JOIN pedidos p ON p.id = i."order"
+    WHERE p.status = 'FINALIZADO' AND p.active AND i.active
+    GROUP BY DATE(p.updated_at), i.flavor, i.size
+    """,
+    f"""
+    INSERT INTO relatorio_pedidos_por_status_diaria (day, status, shard, orders)
+    SELECT DATE(updated_at), status, id % {ORDER_STATUS_SHARDS}, COUNT(*)
+    FROM pedidos
+    WHERE active
+    GROUP BY DATE(updated_at), status, id % {ORDER_STATUS_SHARDS}
+    """,
+]
+
+
+def customer_email(number: int) -> str:
+    return f'cliente{number}@benchmark.com'
+
+
+def build_batch(rng: random.Random, first_id: int, size: int, users: int, items_per_order: int, now: datetime):
+    orders, items = [], []
+    for order_id in range(first_id, first_id + size):
+        total = Decimal(0)
+        for _ in range(rng.randint(1, items_per_order * 2 - 1)):
+            size_name = rng.choice(list(SIZES))
+            amount = rng.randint(1, 3)
+            items.append({'order': order_id, 'flavor': rng.choice(FLAVORS), 'size': size_name,
+                          'amount': amount, 'unit_price': SIZES[size_name], 'active': True})
+            total += SIZES[size_name] * amount
+
+        orders.append({
+            'id': order_id,
+            'user': rng.randint(2, users + 1),
+            'status': rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+            'price': total,
+            'active': True,
+            'version': 1,
+            'updated_at': now - timedelta(minutes=rng.randint(0, 90 * 24 * 60)),
+        })
+    return orders, items
+
+
+async def seed(orders: int, items_per_order: int, users: int, batch_size: int, random_seed: int) -> None:
+    rng = random.Random(random_seed)
+    now = datetime.now(timezone.utc)
+    started = time.perf_counter()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        password = await password_hasher.hash(BENCHMARK_PASSWORD)
+        await conn.execute(insert(User.__table__), [
+            {'name': 'Admin', 'email': ADMIN_EMAIL, 'password': password, 'active': True, 'admin': True},
+            *({'name': f'Cliente {number}', 'email': customer_email(number), 'password': password,
+               'active': True, 'admin': False} for number in range(1, users + 1)),
+        ])
+
+    total_items = 0
+    for first_id in range(1, orders + 1, batch_size):
+        order_rows, item_rows = build_batch(rng, first_id, min(batch_size, orders - first_id + 1),
+                                            users, items_per_order, now)
+        async with engine.begin() as conn:
+            await conn.execute(insert(Order.__table__), order_rows)
+            await conn.execute(insert(OrderItem.__table__), item_rows)
+        total_items += len(item_rows)
+        print(f'{first_id + len(order_rows) - 1} pedidos, {total_items} itens', flush=True)
+
+    async with engine.begin() as conn:
+        for table in (DailyRevenue, DailyItemSales, DailyOrderStatus):
+            await conn.execute(table.__table__.delete())
+        for rollup in ROLLUPS:
+            await conn.execute(text(rollup))
+        if conn.dialect.name == 'sqlite':
+            await conn.execute(text('ANALYZE'))
+
+    await engine.dispose()
+    print(f'Banco de benchmark populado em {time.perf_counter() - started:.1f}s: '
+          f'{users + 1} usuários, {orders} pedidos, {total_items} itens.', flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Popula o banco de benchmark.')
+    parser.add_argument('--orders', type=int, default=100_000)
+    parser.add_argument('--items-per-order', type=int, default=10, help='Média de itens por pedido.')
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--batch-size', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(seed(args.orders, args.items_per_order, args.users, args.batch_size, args.seed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import json
+import math
+from typing import Optional, Sequence
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    """
+    Retorna o percentil informado (0 a 100) das amostras, pelo método nearest-rank.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: Sequence[float], elapsed: Optional[float] = None, errors: int = 0) -> dict:
+    """
+    Resume as latências medidas (em segundos) em milissegundos: p50, p95, p99, média e máximo.
+
+    Args:
+        samples (Sequence[float]): A latência de cada operação, em segundos.
+        elapsed (float, optional): A duração total da medição, em segundos, usada no cálculo
+            de operações por segundo. Sem ela, considera as operações executadas em sequência.
+        errors (int): Quantidade de operações que falharam (ex: status HTTP 5xx).
+
+    Returns:
+        dict: O resumo da medição.
+    """
+    count = len(samples)
+    elapsed = elapsed if elapsed is not None else sum(samples)
+    return {
+        'count': count,
+        'errors': errors,
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'mean_ms': sum(samples) / count * 1000 if count else 0.0,
+        'max_ms': max(samples, default=0.0) * 1000,
+        'rps': count / elapsed if elapsed else 0.0,
+    }
+
+
+def print_report(title: str, results: dict) -> None:
+    """
+    Imprime os resultados em uma tabela, um benchmark por linha.
+    """
+    print(f'\n{title}', flush=True)
+    print(f'{"benchmark":<40} {"count":>8} {"errors":>7} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"rps":>10}')
+    for name, result in results.items():
+        print(f'{name:<40} {result["count"]:>8} {result["errors"]:>7} {result["p50_ms"]:>9.3f} '
+              f'{result["p95_ms"]:>9.3f} {result["p99_ms"]:>9.3f} {result["rps"]:>10.1f}', flush=True)
+
+
+def save_results(path: str, results: dict) -> None:
+    """
+    Grava os resultados em JSON, para servirem de baseline em execuções futuras.
+    """
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float = 0.2) -> list[str]:
+    """
+    Compara os resultados com um baseline gravado por `save_results`.
+
+    Um benchmark regrediu quando o p95 ficou mais que `tolerance` acima do baseline ou
+    as operações por segundo ficaram mais que `tolerance` abaixo dele. Benchmarks que não
+    existem no baseline são ignorados.
+
+    Returns:
+        list[str]: A descrição de cada regressão encontrada.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if result['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            regressions.append(f'{name}: p95 {previous["p95_ms"]:.3f} ms -> {result["p95_ms"]:.3f} ms')
+        if result['rps'] < previous['rps'] * (1 - tolerance):
+            regressions.append(f'{name}: rps {previous["rps"]:.1f} -> {result["rps"]:.1f}')
+
+    return regressions
+
+
+def check_baseline(results: dict, baseline_path: Optional[str], tolerance: float) -> int:
+    """
+    Compara os resultados com o baseline (quando informado), imprime as regressões
+    e retorna o código de saída do script: 1 se houve regressão, 0 caso contrário.
+    """
+    if not baseline_path:
+        return 0
+
+    with open(baseline_path) as file:
+        regressions = find_regressions(results, json.load(file), tolerance)
+
+    for regression in regressions:
+        print(f'REGRESSÃO {regression}', flush=True)
+    return 1 if regressions else 0
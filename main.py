@@ -1,17 +1,45 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from api.config.metrics import MetricsMiddleware, metrics
+from api.config.middleware import ServerTimingMiddleware
+from api.database.engine import engine, replica_engines
+from api.database.pool import pool_status
+from api.endpoints.auth.cache import principal_cache
+from api.endpoints.auth.hashing import password_hasher
 from api.endpoints.auth.router import router as auth_router
 from api.endpoints.accounts.router import router as accounts_router
+from api.endpoints.orders.cache import order_cache
+from api.endpoints.orders.events import order_events
 from api.endpoints.orders.router import router as orders_router
 from api.endpoints.order_items.router import router as order_items_router
+from api.endpoints.health.router import router as health_router
+from api.endpoints.metrics.router import router as metrics_router
+from api.endpoints.reports.router import router as reports_router
 
 app = FastAPI(
     title='FastAPI',
     description='API para gerenciamento de pedidos',
     version='0.1.0',
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware, registry=metrics)
+
+metrics.register_collector('password_hasher', password_hasher.stats, counters=('completed', 'rejected'))
+metrics.register_collector('db_pool', lambda: pool_status(engine), counters=('checkouts', 'timeouts'))
+for index, replica in enumerate(replica_engines):
+    metrics.register_collector(f'db_replica{index}_pool', lambda replica=replica: pool_status(replica),
+                               counters=('checkouts', 'timeouts'))
+metrics.register_collector('principal_cache', principal_cache.stats, counters=('hits', 'misses'))
+metrics.register_collector('order_cache', order_cache.stats, counters=('hits', 'misses'))
+metrics.register_collector('order_events', order_events.stats, counters=('published', 'dropped'))
+
 app.include_router(auth_router)
 app.include_router(accounts_router)
 app.include_router(orders_router)
-app.include_router(order_items_router)
\ No newline at end of file
+app.include_router(order_items_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(reports_router)
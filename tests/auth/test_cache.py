@@ -0,0 +1,90 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from api.endpoints.auth.cache import PrincipalCache
+from api.endpoints.auth.repository import AuthRepository
+from api.endpoints.auth.services import AuthService
+from api.models.users import User
+
+
+class CountingRepository:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_user_by_id(self, id):
+        self.calls += 1
+        return SimpleNamespace(id=id, name='Teste', email='teste@email.com', admin=False, active=True)
+
+
+def test_cache_expires_after_ttl(monkeypatch):
+    cache = PrincipalCache(ttl=10)
+    cache.set('token', SimpleNamespace(id=1))
+    assert cache.get('token').id == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+    assert cache.get('token') is None
+
+
+def test_cache_never_outlives_token():
+    cache = PrincipalCache(ttl=60)
+    cache.set('token', SimpleNamespace(id=1), token_expires_at=time.time() - 1)
+    assert cache.get('token') is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = PrincipalCache(max_size=2)
+    cache.set('a', SimpleNamespace(id=1))
+    cache.set('b', SimpleNamespace(id=2))
+    cache.get('a')
+    cache.set('c', SimpleNamespace(id=3))
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+
+
+def test_invalidate_removes_every_token_of_the_user():
+    cache = PrincipalCache()
+    cache.set('a', SimpleNamespace(id=1))
+    cache.set('b', SimpleNamespace(id=1))
+    cache.set('c', SimpleNamespace(id=2))
+
+    cache.invalidate(1)
+
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+
+
+@pytest.mark.asyncio
+async def test_verify_token_queries_database_once():
+    repository = CountingRepository()
+    service = AuthService(repository, PrincipalCache())
+    token = await service.create_token(1)
+    repository.calls = 0
+
+    for _ in range(3):
+        user = await service.verify_token(token)
+
+    assert user.id == 1
+    assert repository.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_user_survives_rollback_of_the_request_session(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    await session.commit()
+
+    cache = PrincipalCache()
+    service = AuthService(AuthRepository(session), cache)
+    token = await service.create_token(1)
+    await service.verify_token(token)
+
+    await session.rollback()
+    await session.close()
+
+    user = await AuthService(CountingRepository(), cache).verify_token(token)
+    assert (user.id, user.email, user.admin) == (1, 'teste@email.com', False)
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from api.endpoints.auth.hashing import PasswordHasher
+
+
+class BlockingContext:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password):
+        self.release.wait(timeout=5)
+        return f'hashed-{password}'
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_run_in_pool():
+    hasher = PasswordHasher(CryptContext(schemes=['bcrypt'], deprecated='auto'), max_workers=1)
+
+    hashed = await hasher.hash('senha')
+
+    assert await hasher.verify('senha', hashed)
+    assert not await hasher.verify('outra', hashed)
+    assert hasher.stats()['completed'] == 3
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_503():
+    context = BlockingContext()
+    hasher = PasswordHasher(context, max_workers=1, max_queue=2)
+
+    running = [asyncio.create_task(hasher.hash(str(i))) for i in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc:
+        await hasher.hash('excedente')
+    assert exc.value.status_code == 503
+
+    context.release.set()
+    assert await asyncio.gather(*running) == ['hashed-0', 'hashed-1']
+
+    stats = hasher.stats()
+    assert stats['rejected'] == 1
+    assert stats['pending'] == 0
+    assert stats['wait_time_max'] > 0
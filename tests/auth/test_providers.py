@@ -0,0 +1,40 @@
+import os
+
+from passlib.context import CryptContext
+
+from api.config.settings import get_settings
+from api.endpoints.auth.hashing import password_hasher
+from api.endpoints.auth.providers import get_auth_service
+
+
+class FailingEnviron(dict):
+    '''
+    Substituto do `os.environ` que falha em qualquer leitura das variáveis de ambiente.
+    '''
+
+    def __getitem__(self, key):
+        raise AssertionError(f'variável de ambiente {key} lida a cada requisição')
+
+    def get(self, key, default=None):
+        return self[key]
+
+
+def test_auth_service_reuses_process_wide_objects(monkeypatch):
+    '''
+    Criar o AuthService a cada requisição não deve montar um novo contexto de criptografia
+    nem ler as variáveis de ambiente: ambos são únicos do processo. A medição do custo
+    fica em `benchmarks/micro.py`.
+    '''
+    settings = get_settings()
+
+    def fail(*args, **kwargs):
+        raise AssertionError('CryptContext criado a cada requisição')
+
+    monkeypatch.setattr(CryptContext, '__init__', fail)
+    monkeypatch.setattr(os, 'environ', FailingEnviron())
+    first = get_auth_service(session=None, settings=settings)
+    second = get_auth_service(session=None, settings=get_settings())
+    monkeypatch.undo()
+
+    assert first.hasher is second.hasher is password_hasher
+    assert (first.secret_key, first.algorithm) == (settings.secret_key, settings.algorithm)
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config.idempotency import REPLAYED_HEADER, IdempotencyStore, StoredResponse
+from api.models.idempotency import IdempotencyKey
+
+
+@pytest.mark.asyncio
+async def test_repeated_key_replays_the_stored_response(session):
+    session_factory = async_sessionmaker(session.bind, expire_on_commit=False)
+    store = IdempotencyStore(session_factory)
+    calls = []
+
+    async def create():
+        calls.append(1)
+        return ORJSONResponse({'id': len(calls)}, status_code=201)
+
+    first = await store.run('chave-1', 1, 'POST /api/v1/orders/', {'user': 1}, create)
+    replayed = await store.run('chave-1', 1, 'POST /api/v1/orders/', {'user': 1}, create)
+    from_table = await IdempotencyStore(session_factory).run('chave-1', 1, 'POST /api/v1/orders/', {'user': 1}, create)
+
+    assert len(calls) == 1
+    assert (replayed.status_code, replayed.body) == (201, first.body)
+    assert replayed.headers[REPLAYED_HEADER] == 'true'
+    assert from_table.body == first.body
+
+    with pytest.raises(HTTPException) as error:
+        await store.run('chave-1', 1, 'POST /api/v1/orders/', {'user': 2}, create)
+    assert error.value.status_code == 422
+
+    await store.run('chave-1', 2, 'POST /api/v1/orders/', {'user': 1}, create)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_the_key(session):
+    store = IdempotencyStore(async_sessionmaker(session.bind, expire_on_commit=False))
+
+    async def fail():
+        raise HTTPException(status_code=400)
+
+    async def create():
+        return ORJSONResponse({'id': 1}, status_code=201)
+
+    with pytest.raises(HTTPException):
+        await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, fail)
+
+    response = await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, create)
+    assert REPLAYED_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_abandoned_reservation_is_taken_over_after_the_lock(session, monkeypatch):
+    store = IdempotencyStore(async_sessionmaker(session.bind, expire_on_commit=False))
+    calls = []
+
+    async def create():
+        calls.append(1)
+        return ORJSONResponse({'id': len(calls)}, status_code=201)
+
+    async def crash(*args):
+        pass
+
+    # O worker cai depois de criar o pedido, sem gravar a resposta.
+    monkeypatch.setattr(store, '_complete', crash)
+    await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, create)
+    monkeypatch.undo()
+
+    with pytest.raises(HTTPException) as error:
+        await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, create)
+    assert error.value.status_code == 409
+
+    await session.execute(update(IdempotencyKey).values(locked_until=datetime.now(timezone.utc) - timedelta(seconds=1)))
+    await session.commit()
+
+    response = await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, create)
+    replayed = await store.run('chave-1', 1, 'POST /api/v1/orders/', {}, create)
+    assert len(calls) == 2
+    assert REPLAYED_HEADER not in response.headers
+    assert replayed.body == response.body
+
+
+@pytest.mark.asyncio
+async def test_cached_replay_expires_with_the_reservation(session):
+    store = IdempotencyStore(async_sessionmaker(session.bind, expire_on_commit=False), ttl=60)
+    stored = StoredResponse('hash', 201, b'{}')
+
+    await store._complete('antiga', stored, datetime.now(timezone.utc) - timedelta(seconds=61))
+    await store._complete('recente', stored, datetime.now(timezone.utc) - timedelta(seconds=30))
+
+    assert store._get_cached('antiga') is None
+    assert store._get_cached('recente') == stored
@@ -0,0 +1,36 @@
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from api.config.metrics import MetricsMiddleware, MetricsRegistry
+
+
+@pytest.mark.asyncio
+async def test_requests_are_grouped_by_route_and_status():
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    registry.register_collector('cache', lambda: {'hits': 3, 'hit_ratio': 0.75, 'backend': 'memory'}, counters=('hits',))
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.get('/orders/{id_order}')
+    async def get_order(id_order: int):
+        if id_order == 0:
+            raise HTTPException(status_code=404)
+        return {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        for id_order in (1, 2, 0):
+            await client.get(f'/orders/{id_order}')
+        await client.get('/missing')
+
+    lines = registry.render().splitlines()
+    assert 'ordering_http_requests_in_flight 0' in lines
+    assert 'ordering_http_request_duration_seconds_count{method="GET",route="/orders/{id_order}"} 3' in lines
+    assert 'ordering_http_request_duration_seconds_bucket{method="GET",route="/orders/{id_order}",le="+Inf"} 3' in lines
+    assert 'ordering_http_responses_total{method="GET",route="/orders/{id_order}",status="200"} 2' in lines
+    assert 'ordering_http_responses_total{method="GET",route="/orders/{id_order}",status="404"} 1' in lines
+    assert 'ordering_http_responses_total{method="GET",route="unmatched",status="404"} 1' in lines
+    assert 'ordering_cache_hits_total 3' in lines
+    assert 'ordering_cache_hit_ratio 0.75' in lines
+    assert not any('backend' in line for line in lines)
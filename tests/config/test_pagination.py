@@ -0,0 +1,25 @@
+import pytest
+from fastapi import HTTPException
+from types import SimpleNamespace
+
+from api.config.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(123)) == 123
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize('cursor', ['nao-e-um-cursor', encode_cursor('1'), 'W10'])
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_next_cursor_only_when_page_is_full():
+    rows = [SimpleNamespace(id=i) for i in (3, 7)]
+
+    assert decode_cursor(next_cursor(rows, 2)) == 7
+    assert next_cursor(rows, 10) is None
+    assert next_cursor([], 10) is None
@@ -2,10 +2,13 @@ import sys
 import os
 
 import pytest 
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from main import app
+from api.database.base import Base
 
 
 @pytest.fixture(scope='module')
@@ -16,4 +19,21 @@ def client():
     '''
 
     with TestClient(app) as c:
-        yield c
\ No newline at end of file
+        yield c
+
+
+@pytest_asyncio.fixture
+async def session():
+    '''
+    Fixture que fornece uma sessão assíncrona ligada a um banco SQLite em memória,
+    com as tabelas criadas a partir dos models. Usada nos testes de repositório.
+    '''
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as s:
+        yield s
+
+    await engine.dispose()
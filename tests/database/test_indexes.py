@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import event
+
+from api.endpoints.auth.repository import AuthRepository
+from api.endpoints.order_items.repository import OrderItemsRepository
+from api.endpoints.orders.repository import OrderRepository
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.users import User
+
+
+async def query_plans(session, call):
+    '''
+    Executa a chamada do repositório capturando as consultas emitidas e retorna
+    o plano de execução (EXPLAIN QUERY PLAN) de cada uma delas.
+    '''
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        await call()
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+    conn = await session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        plans.append(' | '.join(row[-1] for row in result))
+    return plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('call, expected', [
+    (lambda s: AuthRepository(s).get_user_by_email('teste@email.com'), ['ix_usuarios_email']),
+    (lambda s: OrderRepository(s).get_orders_by_user(1), ['ix_pedidos_user_active_id', 'ix_itens_pedido_order_active']),
+    (lambda s: OrderRepository(s).get_all_orders(after=0), ['ix_pedidos_active_id', 'ix_itens_pedido_order_active']),
+    (lambda s: OrderItemsRepository(s).get_all_order_items(after=0), ['ix_itens_pedido_active_id']),
+])
+async def test_hot_lookups_use_indexes(session, call, expected):
+    '''
+    Garante que as consultas mais frequentes fazem busca por índice em vez de
+    varrer a tabela inteira, mantendo o custo estável conforme as tabelas crescem.
+    '''
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.flush()
+    session.add(OrderItem(amount=1, flavor='Calabresa', size='G', unit_price=50, order=1))
+    await session.commit()
+    session.expunge_all()
+
+    plans = await query_plans(session, lambda: call(session))
+
+    assert len(plans) >= len(expected)
+    for plan in plans:
+        assert 'SCAN' not in plan.replace('SCAN CONSTANT ROW', ''), plan
+    for index in expected:
+        assert any(index in plan for plan in plans), plans
@@ -0,0 +1,62 @@
+import logging
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from api.config.middleware import ServerTimingMiddleware
+from api.database import instrumentation
+from api.database.instrumentation import frame_name, instrument_engine, query_stats, track_queries
+from api.endpoints.orders.repository import OrderRepository
+
+
+@pytest.mark.asyncio
+async def test_queries_are_counted_and_slow_ones_logged_with_origin(session, caplog):
+    instrument_engine(session.bind, slow_query_threshold_ms=0)
+    stats = track_queries()
+
+    with caplog.at_level(logging.WARNING, logger='api.database.slow_queries'):
+        await OrderRepository(session).get_order_by_id(1)
+
+    assert stats.statements == 1
+    assert stats.duration > 0
+    assert 'OrderRepository.get_order_by_id' in caplog.records[0].getMessage()
+    query_stats.set(None)
+
+
+def test_frame_name_without_co_qualname():
+    repository = OrderRepository(None)
+    frame = SimpleNamespace(f_code=SimpleNamespace(co_name='get_order_by_id'), f_locals={'self': repository})
+    assert frame_name(frame) == 'OrderRepository.get_order_by_id'
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log_failure_does_not_fail_the_query(session, monkeypatch):
+    def fail():
+        raise AttributeError('co_qualname')
+
+    monkeypatch.setattr(instrumentation, 'query_origin', fail)
+    instrument_engine(session.bind, slow_query_threshold_ms=0)
+
+    assert await OrderRepository(session).get_order_by_id(1) is None
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_reports_request_queries():
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get('/')
+    async def index():
+        stats = query_stats.get()
+        stats.statements += 2
+        stats.duration += 0.0015
+        return {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        response = await client.get('/')
+
+    db, app_timing = response.headers['server-timing'].split(', ')
+    assert db == 'db;dur=1.5;desc="2 queries"'
+    assert app_timing.startswith('app;dur=')
@@ -0,0 +1,58 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from api.database.base import Base
+from api.database.routing import RoutingSession, use_primary
+from api.endpoints.orders.repository import OrderRepository
+from api.models.orders import Order
+from api.models.users import User
+
+
+@pytest_asyncio.fixture
+async def routing_session(tmp_path):
+    '''
+    Sessão com roteamento entre dois arquivos SQLite: o principal e uma réplica.
+    Os arquivos não são replicados entre si, então cada leitura revela o banco consultado.
+    '''
+    primary = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "primary.db"}')
+    replica = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "replica.db"}')
+
+    for engine, price in ((primary, 20), (replica, 10)):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as s:
+            s.add(User(name='Teste', email='teste@email.com', password='x'))
+            s.add(Order(user=1, price=price))
+            await s.commit()
+
+    SessionLocal = async_sessionmaker(
+        bind=primary, class_=AsyncSession, sync_session_class=RoutingSession,
+        replicas=[replica.sync_engine], expire_on_commit=False,
+    )
+    async with SessionLocal() as s:
+        yield s
+
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_the_session_writes(routing_session):
+    repository = OrderRepository(routing_session)
+
+    assert (await repository.get_order_by_id(1)).price == 10
+    assert [order.price for order in await repository.get_all_orders()] == [10]
+
+    created = await repository.create_order(Order(user=1, price=30))
+    routing_session.expunge_all()
+
+    assert (await repository.get_order_by_id(created.id)).price == 30
+    assert (await repository.get_order_by_id(1)).price == 20
+
+
+@pytest.mark.asyncio
+async def test_use_primary_routes_replica_reads_to_primary(routing_session):
+    use_primary(routing_session)
+
+    assert (await OrderRepository(routing_session).get_order_by_id(1)).price == 20
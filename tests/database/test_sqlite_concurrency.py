@@ -0,0 +1,87 @@
+import asyncio
+import multiprocessing
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.config.settings import get_settings
+from api.database.base import Base
+from api.database.engine import build_engine
+from api.endpoints.orders.repository import OrderRepository
+from api.models.orders import Order
+from api.models.users import User
+
+WORKERS = 4
+ORDERS_PER_WORKER = 50
+
+
+def high_concurrency_settings(database_path):
+    return get_settings().model_copy(update={
+        'database_url': f'sqlite+aiosqlite:///{database_path}',
+        'sqlite_high_concurrency': True,
+    })
+
+
+async def write_orders(database_path):
+    engine = build_engine(high_concurrency_settings(database_path))
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            repository = OrderRepository(session)
+            for _ in range(ORDERS_PER_WORKER):
+                await repository.create_order(Order(user=1), [
+                    {'amount': 1, 'flavor': 'Calabresa', 'size': 'G', 'unit_price': 50},
+                ])
+    finally:
+        await engine.dispose()
+
+
+def worker(database_path):
+    asyncio.run(write_orders(database_path))
+
+
+async def prepare_database(database_path):
+    engine = build_engine(high_concurrency_settings(database_path))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        journal_mode = (await conn.execute(text('PRAGMA journal_mode'))).scalar()
+        busy_timeout = (await conn.execute(text('PRAGMA busy_timeout'))).scalar()
+
+    async with async_sessionmaker(engine)() as session:
+        session.add(User(name='Teste', email='teste@email.com', password='x'))
+        await session.commit()
+
+    await engine.dispose()
+    return journal_mode, busy_timeout
+
+
+async def count_orders(database_path):
+    engine = build_engine(high_concurrency_settings(database_path))
+    async with engine.connect() as conn:
+        total = (await conn.execute(select(func.count()).select_from(Order))).scalar()
+    await engine.dispose()
+    return total
+
+
+@pytest.mark.asyncio
+async def test_concurrent_order_writes_from_several_processes(tmp_path):
+    '''
+    Vários processos (como workers do uvicorn) gravando pedidos ao mesmo tempo no
+    mesmo arquivo SQLite: com o perfil de alta concorrência nenhuma escrita falha
+    com "database is locked".
+    '''
+    database_path = tmp_path / 'concurrency.db'
+
+    journal_mode, busy_timeout = await prepare_database(database_path)
+    assert journal_mode == 'wal'
+    assert busy_timeout == get_settings().sqlite_busy_timeout_ms
+
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=worker, args=(database_path,)) for _ in range(WORKERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+    assert await count_orders(database_path) == WORKERS * ORDERS_PER_WORKER
@@ -0,0 +1,87 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from api.endpoints.order_items.repository import OrderItemsRepository
+from api.endpoints.order_items.schemas import CreateOrderItemsSchema
+from api.endpoints.order_items.services import OrderItemsService
+from api.models.orders import Order
+from api.models.users import User
+
+
+@pytest.mark.asyncio
+async def test_item_mutations_update_price_in_a_single_transaction(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.commit()
+    session.expunge_all()
+
+    service = OrderItemsService(OrderItemsRepository(session))
+    user = SimpleNamespace(id=1, admin=False)
+    commits = []
+    event.listen(session.bind.sync_engine, 'commit', lambda conn: commits.append(conn))
+
+    items = [
+        await service.create_order_items(
+            CreateOrderItemsSchema(amount=amount, flavor='Calabresa', size='G', unit_price=25, order=1), user
+        )
+        for amount in (1, 2, 3)
+    ]
+    await service.delete_order_items(items[1].id, user)
+
+    assert len(commits) == 4
+
+    session.expunge_all()
+    order = await session.get(Order, 1)
+    assert order.price == 100
+
+
+@pytest.mark.asyncio
+async def test_batch_inserts_items_with_a_single_statement(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.commit()
+    session.expunge_all()
+
+    service = OrderItemsService(OrderItemsRepository(session))
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    items = await service.create_order_items_batch(1, [
+        CreateOrderItemsSchema(amount=amount, flavor='Calabresa', size='G', unit_price=10, order=1)
+        for amount in range(1, 31)
+    ], SimpleNamespace(id=1, admin=False))
+
+    assert len({item.id for item in items}) == 30
+    assert sum(statement.startswith('INSERT INTO itens_pedido') for statement in statements) == 1
+
+    session.expunge_all()
+    order = await session.get(Order, 1)
+    assert order.price == 10 * sum(range(1, 31))
+
+
+@pytest.mark.asyncio
+async def test_order_price_is_exact_and_computed_in_sql(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.commit()
+    session.expunge_all()
+
+    service = OrderItemsService(OrderItemsRepository(session))
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    await service.create_order_items_batch(1, [
+        CreateOrderItemsSchema(amount=1, flavor='Calabresa', size='G', unit_price=0.1, order=1)
+        for _ in range(10)
+    ], SimpleNamespace(id=1, admin=False))
+
+    assert not any(statement.startswith('SELECT itens_pedido') for statement in statements)
+
+    session.expunge_all()
+    order = await session.get(Order, 1)
+    assert order.price == Decimal('1.00')
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from api.endpoints.order_items.repository import OrderItemsRepository
+from api.endpoints.orders.cache import OrderCache
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.services import OrderService
+from api.endpoints.reports.repository import ReportRepository
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.users import User
+
+
+async def create_order(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    await session.commit()
+    await OrderRepository(session).create_order(Order(user=1), [
+        {'amount': 1, 'flavor': 'Calabresa', 'size': 'G', 'unit_price': 50},
+    ])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transitions_apply_only_once(session):
+    await create_order(session)
+    other = async_sessionmaker(session.bind, expire_on_commit=False)()
+
+    stale = await OrderRepository(other).get_order_by_id(1)
+    finished = await OrderRepository(session).finish_order(1, version=1)
+    assert (finished.status, finished.version) == ('FINALIZADO', 2)
+
+    with pytest.raises(StaleDataError):
+        await OrderRepository(other).cancel_order(1, version=stale.version)
+    with pytest.raises(StaleDataError):
+        await OrderRepository(other).cancel_order(1)
+    await other.close()
+
+    statuses = {row.status: row.orders for row in await ReportRepository(session).get_orders_by_status()}
+    assert statuses == {'FINALIZADO': 1}
+
+
+@pytest.mark.asyncio
+async def test_item_change_on_a_stale_order_is_rejected(session):
+    await create_order(session)
+    other = async_sessionmaker(session.bind, expire_on_commit=False)()
+
+    stale = await OrderRepository(other).get_order_by_id(1, load_items=False)
+    order = await OrderRepository(session).get_order_by_id(1, load_items=False)
+    await OrderItemsRepository(session).create_order_item(
+        OrderItem(amount=1, flavor='Mussarela', size='M', unit_price=30, order=1), order)
+    assert order.version == 2
+
+    with pytest.raises(StaleDataError):
+        await OrderItemsRepository(other).create_order_item(
+            OrderItem(amount=1, flavor='Mussarela', size='M', unit_price=30, order=1), stale)
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_service_rejects_invalid_or_outdated_transitions(session):
+    await create_order(session)
+    service = OrderService(OrderRepository(session), OrderCache())
+    admin = SimpleNamespace(id=1, admin=True)
+
+    with pytest.raises(HTTPException) as error:
+        await service.cancel_order(1, admin, if_match='W/"outdated"')
+    assert error.value.status_code == 409
+
+    order = await service.cancel_order(1, admin, if_match=OrderService.order_etag(await session.get(Order, 1)))
+    assert order.status == 'CANCELADO'
+
+    with pytest.raises(HTTPException) as error:
+        await service.finish_order(1, admin)
+    assert error.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_cancel_checks_ownership_in_the_update(session):
+    await create_order(session)
+    session.expunge_all()
+    service = OrderService(OrderRepository(session), OrderCache())
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    for id_order, user, status_code in ((1, SimpleNamespace(id=2, admin=False), 401),
+                                        (2, SimpleNamespace(id=1, admin=False), 404)):
+        with pytest.raises(HTTPException) as error:
+            await service.cancel_order(id_order, user)
+        assert error.value.status_code == status_code
+
+    statements.clear()
+    order = await service.cancel_order(1, SimpleNamespace(id=1, admin=False))
+    assert (order.status, order.version, len(order.items)) == ('CANCELADO', 2, 1)
+    assert [statement.split()[0] for statement in statements] == ['UPDATE', 'SELECT', 'INSERT']
+    assert 'pedidos.user' in statements[0]
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from api.endpoints.auth.providers import get_current_user
+from api.endpoints.order_items.repository import OrderItemsRepository
+from api.endpoints.orders.cache import OrderCache
+from api.endpoints.orders.providers import get_order_service
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.services import OrderService
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.users import User
+from main import app
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_until_the_order_changes(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.flush()
+    session.add(OrderItem(amount=1, flavor='Calabresa', size='G', unit_price=50, order=1))
+    await session.commit()
+    session.expunge_all()
+
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1, admin=False)
+    app.dependency_overrides[get_order_service] = lambda: OrderService(OrderRepository(session), OrderCache())
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+            etags = {}
+            for url in ('/api/v1/orders/1', '/api/v1/orders/'):
+                response = await client.get(url)
+                etag = etags[url] = response.headers['ETag']
+                assert response.status_code == 200
+
+                statements.clear()
+                response = await client.get(url, headers={'If-None-Match': etag})
+                assert response.status_code == 304
+                assert response.headers['ETag'] == etag
+                assert len(statements) == 1
+                assert 'itens_pedido' not in statements[0]
+
+            order = await session.get(Order, 1)
+            item = await session.get(OrderItem, 1)
+            await OrderItemsRepository(session).delete_order_items(item, order)
+
+            response = await client.get('/api/v1/orders/1', headers={'If-None-Match': etags['/api/v1/orders/1']})
+            assert response.status_code == 200
+            assert response.json()['data']['version'] == 2
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import pytest
+
+from api.endpoints.orders.events import OrderEventBroker
+
+
+def order(id, user, status='PENDENTE'):
+    return SimpleNamespace(id=id, user=user, status=status, price=0, version=1)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_only_their_orders():
+    broker = OrderEventBroker(max_queue=10)
+    admin = broker.subscribe()
+    owner = broker.subscribe(user_id=1)
+
+    broker.publish('order.created', order(1, user=1))
+    broker.publish('order.created', order(2, user=2))
+
+    assert [(await admin.get())['id'] for _ in range(2)] == [1, 2]
+    assert (await owner.get())['id'] == 1
+    assert owner.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped_without_affecting_others():
+    broker = OrderEventBroker(max_queue=2)
+    slow = broker.subscribe()
+    fast = broker.subscribe()
+
+    for id in range(3):
+        broker.publish('order.created', order(id, user=1))
+        await fast.get()
+
+    assert slow.dropped
+    assert await slow.get() is None
+    assert broker.subscribers == {fast}
+    assert broker.stats() == {'subscribers': 1, 'published': 3, 'dropped': 1}
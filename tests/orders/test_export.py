@@ -0,0 +1,44 @@
+import csv
+import io
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.services import EXPORT_CSV_COLUMNS, OrderService
+from api.models.orders import Order
+from api.models.users import User
+
+
+async def export(service, user, export_format):
+    return b''.join([chunk async for chunk in await service.export_orders(user, export_format)])
+
+
+@pytest.mark.asyncio
+async def test_export_streams_orders_with_items(session):
+    admin = User(name='Admin', email='admin@email.com', password='x', admin=True)
+    session.add(admin)
+    await session.commit()
+
+    repository = OrderRepository(session)
+    await repository.create_order(Order(user=1), [
+        {'amount': 2, 'flavor': 'Calabresa', 'size': 'G', 'unit_price': 40.5},
+        {'amount': 1, 'flavor': 'Mussarela', 'size': 'M', 'unit_price': 30},
+    ])
+    await repository.create_order(Order(user=1), [])
+
+    service = OrderService(repository, session_factory=async_sessionmaker(session.bind, expire_on_commit=False))
+
+    orders = [orjson.loads(line) for line in (await export(service, admin, 'ndjson')).splitlines()]
+    assert [(order['id'], order['price'], len(order['items'])) for order in orders] == [(1, 111.0, 2), (2, 0.0, 0)]
+    assert orders[0]['items'][0] == {'id': 1, 'flavor': 'Calabresa', 'size': 'G', 'amount': 2, 'unit_price': 40.5}
+
+    rows = list(csv.reader(io.StringIO((await export(service, admin, 'csv')).decode())))
+    assert rows[0] == EXPORT_CSV_COLUMNS
+    assert [(row[0], row[6], row[7]) for row in rows[1:]] == [('1', '1', 'Calabresa'), ('1', '2', 'Mussarela'), ('2', '', '')]
+
+    with pytest.raises(HTTPException) as error:
+        await service.export_orders(User(name='Teste', email='teste@email.com', password='x'), 'csv')
+    assert error.value.status_code == 403
@@ -0,0 +1,78 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from api.config.cache import MemoryCacheBackend
+from api.endpoints.order_items.repository import OrderItemsRepository
+from api.endpoints.order_items.schemas import CreateOrderItemsSchema
+from api.endpoints.order_items.services import OrderItemsService
+from api.endpoints.orders.cache import OrderCache
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.services import OrderService
+from api.models.orders import Order
+from api.models.users import User
+
+
+class FakeRedis:
+    '''
+    Substituto do cliente `redis.asyncio` para os testes: mesmos comandos e
+    mesmas respostas (valores em bytes), guardados em um dicionário. Como o redis-py,
+    recusa um `ex` que não seja inteiro.
+    '''
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if ex is not None and not isinstance(ex, (int, timedelta)):
+            raise TypeError('ex must be datetime.timedelta or int')
+        self.data[key] = value.encode() if isinstance(value, str) else bytes(value)
+        return True
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b'0')) + 1).encode()
+        return int(self.data[key])
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('backend', [MemoryCacheBackend, FakeRedis])
+async def test_orders_are_served_from_cache_until_a_mutation(session, backend):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    session.add(Order(user=1))
+    await session.commit()
+    session.expunge_all()
+
+    cache = OrderCache(backend(), ttl=60.5)
+    orders = OrderService(OrderRepository(session), cache)
+    items = OrderItemsService(OrderItemsRepository(session), cache)
+    user = SimpleNamespace(id=1, admin=False)
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    await orders.get_all_orders(user)
+    await orders.get_order(1, user)
+    reads = len(statements)
+
+    assert [order.id for order in await orders.get_all_orders(user)] == [1]
+    assert (await orders.get_order(1, user)).price == 0
+    assert len(statements) == reads
+    assert cache.stats()['hits'] == 2
+
+    await items.create_order_items(
+        CreateOrderItemsSchema(amount=2, flavor='Calabresa', size='G', unit_price=25, order=1), user
+    )
+
+    assert (await orders.get_order(1, user)).price == 50
+    assert (await orders.get_all_orders(user))[0].items[0].amount == 2
+
+    await orders.cancel_order(1, user)
+    assert (await orders.get_order(1, user)).status == 'CANCELADO'
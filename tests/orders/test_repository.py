@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import event
+
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.orders.schemas import OrderPublicSchema
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+from api.models.users import User
+
+
+async def seed_orders(session, user, amount):
+    for _ in range(amount):
+        order = Order(user=user.id)
+        session.add(order)
+        await session.flush()
+        session.add_all([OrderItem(amount=1, flavor='Calabresa', size='G', unit_price=50, order=order.id) for _ in range(3)])
+    await session.commit()
+    session.expunge_all()
+
+
+async def count_statements(session, repository, limit):
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        orders = await repository.get_all_orders(0, limit)
+        [OrderPublicSchema.model_validate(order) for order in orders]
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+    session.expunge_all()
+    return len(orders), len(statements)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('loading_strategy', ['selectin', 'joined'])
+async def test_get_all_orders_statement_count_is_constant(session, loading_strategy):
+    user = User(name='Teste', email='teste@email.com', password='x')
+    session.add(user)
+    await session.commit()
+
+    repository = OrderRepository(session, loading_strategy)
+
+    await seed_orders(session, user, 2)
+    small_page, small_count = await count_statements(session, repository, 2)
+
+    await seed_orders(session, user, 48)
+    large_page, large_count = await count_statements(session, repository, 50)
+
+    assert (small_page, large_page) == (2, 50)
+    assert small_count == large_count
+
+
+def test_invalid_loading_strategy():
+    with pytest.raises(ValueError):
+        OrderRepository(None, 'lazy')
+
+
+@pytest.mark.asyncio
+async def test_create_order_with_items_in_one_transaction(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    await session.commit()
+
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    items = [dict(amount=amount, flavor='Calabresa', size='G', unit_price=20) for amount in range(1, 11)]
+    order = await OrderRepository(session).create_order(Order(user=1), items)
+
+    assert [statement.split(' (')[0].split('=')[0] for statement in statements] == [
+        'INSERT INTO pedidos', 'INSERT INTO itens_pedido', 'UPDATE pedidos SET price',
+        'INSERT INTO relatorio_pedidos_por_status_diaria',
+    ]
+    assert order.price == 20 * 55
+    assert len(order.items) == 10
+    assert all(item.order == order.id for item in order.items)
+
+
+@pytest.mark.asyncio
+async def test_writes_fall_back_when_the_database_has_no_returning(session, monkeypatch):
+    dialect = session.bind.dialect
+    for capability in ('insert_returning', 'insert_executemany_returning', 'update_returning'):
+        monkeypatch.setattr(dialect, capability, False)
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    await session.commit()
+
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    orders = OrderRepository(session)
+    items = [dict(amount=amount, flavor='Calabresa', size='G', unit_price=20) for amount in range(1, 4)]
+    order = await orders.create_order(Order(user=1), items)
+    assert (order.price, len(order.items)) == (20 * 6, 3)
+
+    order = await orders.cancel_order(order.id, user_id=1, version=1)
+    assert (order.status, order.version, len(order.items)) == ('CANCELADO', 2, 3)
+    assert not any('RETURNING' in statement for statement in statements)
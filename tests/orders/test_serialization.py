@@ -0,0 +1,51 @@
+import json
+from typing import List
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from api.config.responses import model_response
+from api.endpoints.orders.schemas import OrderPublicSchema, ResponseOrderSchema
+from api.models.order_items import OrderItem
+from api.models.orders import Order
+
+PAGE_SIZE = 50
+
+
+def build_orders():
+    orders = []
+    for id in range(1, PAGE_SIZE + 1):
+        order = Order(user=1)
+        order.id = id
+        order.items = [
+            OrderItem(amount=1, flavor='Calabresa', size='G', unit_price=50, order=id)
+            for _ in range(3)
+        ]
+        for number, item in enumerate(order.items):
+            item.id = id * 3 + number
+        orders.append(order)
+    return orders
+
+
+@pytest.mark.asyncio
+async def test_model_response_matches_the_response_model_path():
+    '''
+    `model_response` (validação única + orjson) deve gerar o mesmo conteúdo que o caminho
+    padrão do FastAPI (`response_model` revalidando o schema), inclusive a partir dos
+    pedidos já validados guardados no cache. A comparação de desempenho dos dois caminhos
+    fica em `benchmarks/micro.py`.
+    '''
+    orders = build_orders()
+    field = create_model_field(name='response', type_=ResponseOrderSchema[List[OrderPublicSchema]], mode='serialization')
+
+    legacy = JSONResponse(await serialize_response(
+        field=field, response_content=ResponseOrderSchema(message='Orders found', data=orders), is_coroutine=True,
+    )).body
+    fast = model_response(ResponseOrderSchema[List[OrderPublicSchema]](message='Orders found', data=orders)).body
+    cached = [OrderPublicSchema.model_validate(order) for order in orders]
+    fast_cached = model_response(ResponseOrderSchema[List[OrderPublicSchema]](message='Orders found', data=cached)).body
+
+    assert json.loads(fast) == json.loads(legacy)
+    assert json.loads(fast_cached) == json.loads(legacy)
@@ -0,0 +1,59 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import mysql
+
+from api.endpoints.orders.repository import OrderRepository
+from api.endpoints.reports.repository import ReportRepository
+from api.models.orders import Order
+from api.models.reports import DailyOrderStatus, DailyRevenue
+from api.models.users import User
+
+
+@pytest.mark.asyncio
+async def test_rollups_follow_order_finish_and_cancel(session):
+    session.add(User(name='Teste', email='teste@email.com', password='x'))
+    await session.commit()
+
+    orders = OrderRepository(session)
+    for _ in range(3):
+        await orders.create_order(Order(user=1), [
+            {'amount': 2, 'flavor': 'Calabresa', 'size': 'G', 'unit_price': 40.5},
+            {'amount': 1, 'flavor': 'Mussarela', 'size': 'M', 'unit_price': 30},
+        ])
+    await orders.finish_order(1)
+    await orders.finish_order(2)
+    await orders.cancel_order(3)
+
+    reports = ReportRepository(session)
+    [revenue] = await reports.get_daily_revenue()
+    assert (revenue.orders, revenue.revenue) == (2, Decimal('222.00'))
+
+    flavors = await reports.get_top_items('flavor')
+    assert [(row.name, row.quantity, row.revenue) for row in flavors] == [
+        ('Calabresa', 4, Decimal('162.00')), ('Mussarela', 2, Decimal('60.00')),
+    ]
+    assert [row.name for row in await reports.get_top_items('size', limit=1)] == ['G']
+
+    statements = []
+    event.listen(session.bind.sync_engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    statuses = {row.status: row.orders for row in await reports.get_orders_by_status()}
+    assert statuses == {'CANCELADO': 1, 'FINALIZADO': 2}
+    assert 'FROM pedidos' not in statements[0]
+
+    counted = await session.execute(select(DailyOrderStatus.status, DailyOrderStatus.shard)
+                                    .where(DailyOrderStatus.orders != 0).order_by(DailyOrderStatus.shard))
+    assert [tuple(row) for row in counted] == [('FINALIZADO', 1), ('FINALIZADO', 2), ('CANCELADO', 3)]
+
+
+def test_rollup_upserts_compile_for_mysql():
+    bind = SimpleNamespace(dialect=mysql.dialect())
+    reports = ReportRepository(SimpleNamespace(get_bind=lambda: bind))
+
+    statement = reports._insert(DailyRevenue).values(day=date(2025, 1, 1), orders=1, revenue=10)
+    sql = str(reports._accumulate(statement, [DailyRevenue.day], ['orders', 'revenue']).compile(dialect=bind.dialect))
+    assert 'ON DUPLICATE KEY UPDATE orders = (relatorio_receita_diaria.orders + VALUES(orders))' in sql